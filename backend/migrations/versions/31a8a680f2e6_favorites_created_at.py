@@ -0,0 +1,37 @@
+"""favorites created_at
+
+Revision ID: 31a8a680f2e6
+Revises: 4cdfdab1c2cd
+Create Date: 2026-10-18 15:20:11.502318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '31a8a680f2e6'
+down_revision: Union[str, Sequence[str], None] = '4cdfdab1c2cd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Favoritos já existentes recebem o instante da migração
+    op.add_column(
+        'user_favorite_recipes',
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(
+        'ix_user_favorite_recipes_user_id_created_at', 'user_favorite_recipes',
+        ['user_id', 'created_at', 'recipe_id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_favorite_recipes_user_id_created_at', table_name='user_favorite_recipes')
+    op.drop_column('user_favorite_recipes', 'created_at')
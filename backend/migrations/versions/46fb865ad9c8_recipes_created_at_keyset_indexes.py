@@ -0,0 +1,41 @@
+"""recipes created_at and keyset indexes
+
+Revision ID: 46fb865ad9c8
+Revises: 7890a1141013
+Create Date: 2026-10-18 09:12:04.118230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '46fb865ad9c8'
+down_revision: Union[str, Sequence[str], None] = '7890a1141013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'recipes',
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(
+        'ix_recipes_public_created_at_id', 'recipes', ['created_at', 'id'],
+        unique=False, postgresql_where=sa.text('is_public'),
+    )
+    op.create_index(
+        'ix_recipes_public_title_id', 'recipes', ['title', 'id'],
+        unique=False, postgresql_where=sa.text('is_public'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_recipes_public_title_id', table_name='recipes')
+    op.drop_index('ix_recipes_public_created_at_id', table_name='recipes')
+    op.drop_column('recipes', 'created_at')
@@ -0,0 +1,31 @@
+"""recipes ingredients gin index
+
+Revision ID: 4cdfdab1c2cd
+Revises: ef4e0fd6075e
+Create Date: 2026-10-18 12:05:40.371926
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4cdfdab1c2cd'
+down_revision: Union[str, Sequence[str], None] = 'ef4e0fd6075e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_recipes_ingredients', 'recipes', ['ingredients'],
+        unique=False, postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_recipes_ingredients', table_name='recipes')
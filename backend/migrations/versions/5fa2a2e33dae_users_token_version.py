@@ -0,0 +1,31 @@
+"""users token_version
+
+Revision ID: 5fa2a2e33dae
+Revises: 46fb865ad9c8
+Create Date: 2026-10-18 10:03:51.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5fa2a2e33dae'
+down_revision: Union[str, Sequence[str], None] = '46fb865ad9c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'users',
+        sa.Column('token_version', sa.Integer(), server_default='0', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
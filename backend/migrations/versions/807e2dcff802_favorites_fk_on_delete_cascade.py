@@ -0,0 +1,43 @@
+"""favorites fk on delete cascade
+
+Revision ID: 807e2dcff802
+Revises: 5fa2a2e33dae
+Create Date: 2026-10-18 10:41:27.630914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '807e2dcff802'
+down_revision: Union[str, Sequence[str], None] = '5fa2a2e33dae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _recreate_fks(ondelete: Union[str, None]) -> None:
+    op.drop_constraint('user_favorite_recipes_user_id_fkey', 'user_favorite_recipes', type_='foreignkey')
+    op.drop_constraint('user_favorite_recipes_recipe_id_fkey', 'user_favorite_recipes', type_='foreignkey')
+    op.create_foreign_key(
+        'user_favorite_recipes_user_id_fkey', 'user_favorite_recipes', 'users',
+        ['user_id'], ['id'], ondelete=ondelete,
+    )
+    op.create_foreign_key(
+        'user_favorite_recipes_recipe_id_fkey', 'user_favorite_recipes', 'recipes',
+        ['recipe_id'], ['id'], ondelete=ondelete,
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Os relacionamentos não carregam mais a coleção ao deletar (passive_deletes);
+    # a limpeza da associação passa a ser feita pelo banco.
+    _recreate_fks('CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _recreate_fks(None)
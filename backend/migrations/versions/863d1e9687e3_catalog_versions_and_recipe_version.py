@@ -0,0 +1,35 @@
+"""catalog versions and recipe version
+
+Revision ID: 863d1e9687e3
+Revises: 807e2dcff802
+Create Date: 2026-10-18 11:02:14.218305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '863d1e9687e3'
+down_revision: Union[str, Sequence[str], None] = '807e2dcff802'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'catalog_versions',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    op.add_column('recipes', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('recipes', 'version')
+    op.drop_table('catalog_versions')
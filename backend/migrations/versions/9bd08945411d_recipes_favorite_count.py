@@ -0,0 +1,77 @@
+"""recipes favorite_count and sharded counters
+
+Revision ID: 9bd08945411d
+Revises: c5592a64239f
+Create Date: 2026-10-18 16:31:02.847120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9bd08945411d'
+down_revision: Union[str, Sequence[str], None] = 'c5592a64239f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mesmo número de shards de petfit.infra.models.favorite_count_model
+SHARDS = 16
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'recipes',
+        sa.Column('favorite_count', sa.BigInteger(), server_default='0', nullable=False),
+    )
+    op.create_table(
+        'recipe_favorite_count_shards',
+        sa.Column('recipe_id', sa.String(), nullable=False),
+        sa.Column('shard', sa.SmallInteger(), nullable=False),
+        sa.Column('delta', sa.BigInteger(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('recipe_id', 'shard'),
+    )
+    # Backfill a partir dos favoritos existentes (antes dos triggers existirem)
+    op.execute(
+        "UPDATE recipes SET favorite_count = f.total FROM ("
+        "SELECT recipe_id, count(*) AS total FROM user_favorite_recipes GROUP BY recipe_id"
+        ") AS f WHERE recipes.id = f.recipe_id"
+    )
+    op.create_index(
+        'ix_recipes_public_favorite_count_id', 'recipes', ['favorite_count', 'id'],
+        unique=False, postgresql_where=sa.text('is_public'),
+    )
+    op.execute(
+        "CREATE OR REPLACE FUNCTION petfit_count_favorites() RETURNS trigger "
+        "LANGUAGE plpgsql AS $$ BEGIN "
+        "INSERT INTO recipe_favorite_count_shards (recipe_id, shard, delta) "
+        f"SELECT recipe_id, floor(random() * {SHARDS})::smallint, "
+        "CASE WHEN TG_OP = 'INSERT' THEN count(*) ELSE -count(*) END "
+        "FROM changed GROUP BY recipe_id ORDER BY recipe_id "
+        "ON CONFLICT (recipe_id, shard) DO UPDATE "
+        "SET delta = recipe_favorite_count_shards.delta + EXCLUDED.delta; "
+        "RETURN NULL; END $$"
+    )
+    op.execute(
+        "CREATE TRIGGER trg_user_favorite_recipes_count_insert "
+        "AFTER INSERT ON user_favorite_recipes REFERENCING NEW TABLE AS changed "
+        "FOR EACH STATEMENT EXECUTE FUNCTION petfit_count_favorites()"
+    )
+    op.execute(
+        "CREATE TRIGGER trg_user_favorite_recipes_count_delete "
+        "AFTER DELETE ON user_favorite_recipes REFERENCING OLD TABLE AS changed "
+        "FOR EACH STATEMENT EXECUTE FUNCTION petfit_count_favorites()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_user_favorite_recipes_count_delete ON user_favorite_recipes")
+    op.execute("DROP TRIGGER IF EXISTS trg_user_favorite_recipes_count_insert ON user_favorite_recipes")
+    op.execute("DROP FUNCTION IF EXISTS petfit_count_favorites()")
+    op.drop_index('ix_recipes_public_favorite_count_id', table_name='recipes')
+    op.drop_table('recipe_favorite_count_shards')
+    op.drop_column('recipes', 'favorite_count')
@@ -0,0 +1,30 @@
+"""favorites recipe_id index
+
+Revision ID: c5592a64239f
+Revises: 31a8a680f2e6
+Create Date: 2026-10-18 15:48:37.114905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5592a64239f'
+down_revision: Union[str, Sequence[str], None] = '31a8a680f2e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_user_favorite_recipes_recipe_id', 'user_favorite_recipes', ['recipe_id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_favorite_recipes_recipe_id', table_name='user_favorite_recipes')
@@ -0,0 +1,53 @@
+"""recipes search vector
+
+Revision ID: ef4e0fd6075e
+Revises: 863d1e9687e3
+Create Date: 2026-10-18 11:37:52.604417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ef4e0fd6075e'
+down_revision: Union[str, Sequence[str], None] = '863d1e9687e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Colunas geradas só aceitam funções IMMUTABLE; array_to_string é STABLE
+ARRAY_TO_TEXT_FUNCTION = (
+    "CREATE OR REPLACE FUNCTION petfit_array_to_text(text[]) RETURNS text "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$ SELECT array_to_string($1, ' ') $$"
+)
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('portuguese'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('portuguese'::regconfig, petfit_array_to_text(ingredients::text[])), 'B') || "
+    "setweight(to_tsvector('portuguese'::regconfig, petfit_array_to_text(instructions::text[])), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(ARRAY_TO_TEXT_FUNCTION)
+    op.add_column(
+        'recipes',
+        sa.Column(
+            'search_vector', postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True), nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_recipes_search_vector', 'recipes', ['search_vector'],
+        unique=False, postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_recipes_search_vector', table_name='recipes')
+    op.drop_column('recipes', 'search_vector')
+    op.execute('DROP FUNCTION IF EXISTS petfit_array_to_text(text[])')
@@ -1,11 +1,15 @@
 # petfit/api/deps.py
 
 # Instâncias SQLAlchemy
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer, HTTPBearer, HTTPAuthorizationCredentials # <-- ADICIONADO HTTPBearer e HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from petfit.api.settings import settings
 from petfit.domain.repositories.user_repository import UserRepository
+from petfit.domain.repositories.recipe_repository import MAX_PAGE_LIMIT
+from petfit.domain.services.password_hasher import PasswordHasher
+from petfit.infra.services.executor_password_hasher import ExecutorPasswordHasher
+from petfit.infra.cache import TTLLRUCache
 from petfit.infra.repositories.sqlalchemy.sqlachemy_user_repository import (
     SQLAlchemyUserRepository,
 )
@@ -13,30 +17,130 @@ from petfit.infra.repositories.sqlalchemy.sqlalchemy_recipe_repository import (
     SQLAlchemyRecipeRepository,
 )
 
-from sqlalchemy.ext.asyncio import AsyncSession
-from petfit.infra.database import async_session
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from petfit.infra.database import get_read_sessionmaker, get_sessionmaker
+from petfit.domain.entities.identity import Identity
 from petfit.domain.entities.user import User
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.value_objects.email_vo import Email
 from collections.abc import AsyncGenerator
+from typing import List, Optional
+from petfit.infra.log import get_logger
+
+logger = get_logger("api.deps")
 
 
 # Dependência para obter a sessão do banco de dados
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session() as session:
+    async with get_sessionmaker()() as session:
         yield session
 
 
+# Usuários que escreveram há pouco (chave: claim "sub"). Enquanto a entrada
+# vive, as leituras deles vão ao primário e não à réplica, que pode estar
+# atrasada. É por processo: com várias instâncias, o balanceador deve manter
+# o usuário na mesma instância (ou o atraso da réplica ficar abaixo da janela).
+recent_writers: TTLLRUCache[bool] = TTLLRUCache(
+    maxsize=settings.USER_CACHE_MAXSIZE,
+    ttl=settings.READ_YOUR_WRITES_SECONDS,
+)
+
+# Métodos que não alteram estado e portanto não abrem a janela de leitura no primário
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Bearer opcional: rotas públicas de leitura só o usam para a escolha do banco
+optional_bearer = HTTPBearer(auto_error=False)
+
+
+def _token_subject(token: str) -> Optional[str]:
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+    sub = payload.get("sub")
+    return str(sub) if sub else None
+
+
+def mark_recent_writer(user_id: str) -> None:
+    """Abre a janela de read-your-writes do usuário: suas leituras vão ao primário."""
+    recent_writers.set(str(user_id), True)
+
+
+def reads_from_primary(credentials: Optional[HTTPAuthorizationCredentials]) -> bool:
+    """Verdadeiro se o autor do token escreveu dentro da janela de read-your-writes."""
+    if credentials is None:
+        return False
+    user_id = _token_subject(credentials.credentials)
+    return user_id is not None and recent_writers.get(user_id) is not None
+
+
+# Dependência de sessão para rotas e métodos só de leitura: usa a réplica,
+# exceto logo após uma escrita do próprio usuário
+async def get_read_db_session(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_bearer),
+) -> AsyncGenerator[AsyncSession, None]:
+    factory = get_sessionmaker() if reads_from_primary(credentials) else get_read_sessionmaker()
+    async with factory() as session:
+        yield session
+
+
+# Fábrica de sessões para respostas em streaming, que precisam de uma sessão
+# viva enquanto o corpo é enviado (depois que as dependências já encerraram)
+def get_session_factory() -> async_sessionmaker:
+    return get_sessionmaker()
+
+
+# Igual a get_session_factory, para streams só de leitura (réplica)
+def get_read_session_factory() -> async_sessionmaker:
+    return get_read_sessionmaker()
+
+
+# Cache em processo dos usuários resolvidos em get_current_user (chave: claim "sub")
+user_cache: TTLLRUCache[User] = TTLLRUCache(
+    maxsize=settings.USER_CACHE_MAXSIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+)
+
+
 # Dependência para obter a instância do repositório de usuários
 async def get_user_repository(
     db: AsyncSession = Depends(get_db_session),
 ) -> SQLAlchemyUserRepository:
-    return SQLAlchemyUserRepository(db)
+    return SQLAlchemyUserRepository(db, user_cache=user_cache)
+
+
+# Repositório de usuários para leituras (réplica)
+async def get_read_user_repository(
+    db: AsyncSession = Depends(get_read_db_session),
+) -> SQLAlchemyUserRepository:
+    return SQLAlchemyUserRepository(db, user_cache=user_cache)
+
+
+# Cache em processo do ranking de receitas populares (chave: limite pedido)
+popular_cache: TTLLRUCache[List[Recipe]] = TTLLRUCache(
+    maxsize=MAX_PAGE_LIMIT,
+    ttl=settings.POPULAR_CACHE_TTL_SECONDS,
+)
 
 
 # Dependência para obter a instância do repositório de receitas
 async def get_recipe_repository( 
     db: AsyncSession = Depends(get_db_session),
 ) -> SQLAlchemyRecipeRepository:
-    return SQLAlchemyRecipeRepository(db)
+    return SQLAlchemyRecipeRepository(db, popular_cache=popular_cache)
+
+
+# Serviço de hashing compartilhado pelo processo (bcrypt roda fora do event loop)
+password_hasher = ExecutorPasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    use_processes=settings.PASSWORD_HASH_EXECUTOR == "process",
+    rounds=settings.BCRYPT_ROUNDS,
+)
+
+
+# Dependência para obter o serviço de hashing de senhas
+def get_password_hasher() -> PasswordHasher:
+    return password_hasher
 
 
 # Esquemas de segurança
@@ -44,47 +148,132 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/users/login")
 security_bearer = HTTPBearer() # <-- DEFINIÇÃO CENTRALIZADA AQUI
 
 
-# Dependência para obter o usuário atualmente autenticado
-async def get_current_user(
-    # Use security_bearer para obter as credenciais brutas do cabeçalho
-    credentials: HTTPAuthorizationCredentials = Depends(security_bearer), # <-- Mude aqui para usar security_bearer
-    user_repo: UserRepository = Depends(get_user_repository),
-) -> User:
-    print(f"DEBUG: get_current_user - Iniciando. Token recebido: {credentials.credentials[:15]}...") # Use credentials.credentials
-    credentials_exception = HTTPException(
+def _credentials_exception(detail: str = "Could not validate credentials") -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
+        detail=detail,
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+# Dependência que decodifica o JWT uma única vez por requisição
+async def get_token_payload(
+    request: Request,
+    # Use security_bearer para obter as credenciais brutas do cabeçalho
+    credentials: HTTPAuthorizationCredentials = Depends(security_bearer), # <-- Mude aqui para usar security_bearer
+) -> dict:
     try:
         # Decodifica o token JWT (credentials.credentials contém o token puro)
         payload = jwt.decode(
             credentials.credentials, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        print(f"DEBUG: get_current_user - Payload decodificado: {payload}")
-        
-        # Extrai o ID do usuário (sub) do payload
-        user_id: str = str(payload.get("sub"))
-        if not user_id:
-            print("DEBUG: get_current_user - user_id is None or empty. Raising credentials_exception.")
-            raise credentials_exception
+    except JWTError as e:
+        # Nunca logar o token nem o payload: são credenciais
+        logger.debug("Token rejeitado", extra={"reason": str(e)})
+        raise _credentials_exception()
+
+    # O ID do usuário (sub) é obrigatório
+    if not payload.get("sub"):
+        logger.debug("Token sem claim sub")
+        raise _credentials_exception()
+    if request.method not in SAFE_METHODS:
+        # Abre a janela de read-your-writes deste usuário
+        mark_recent_writer(payload["sub"])
+    return payload
+
+
+# Dependência para obter o usuário atualmente autenticado
+async def get_current_user(
+    payload: dict = Depends(get_token_payload),
+    user_repo: UserRepository = Depends(get_user_repository),
+) -> User:
+    user_id = str(payload["sub"])
+    try:
+        # Usa o cache antes de ir ao banco
+        user = user_cache.get(user_id)
+        if user is not None:
+            return user
 
         # Busca o usuário no banco de dados usando o ID do token
         user = await user_repo.get_by_id(user_id)
         if user is None:
-            print(f"DEBUG: get_current_user - User not found in DB for ID: {user_id}. Raising credentials_exception.")
-            raise credentials_exception
-        
-        print(f"DEBUG: get_current_user - User successfully resolved: {user.id}")
+            logger.debug("Usuário do token não existe", extra={"user_id": user_id})
+            raise _credentials_exception()
+
+        user_cache.set(user_id, user)
         return user 
 
-    except JWTError as e:
-        print(f"DEBUG: get_current_user - JWTError detected: {e}. Raising credentials_exception.")
-        raise credentials_exception
-    except Exception as e:
-        print(f"DEBUG: get_current_user - UNEXPECTED EXCEPTION (not JWTError): {e}")
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Erro inesperado ao resolver o usuário autenticado")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred during authentication."
-        )
\ No newline at end of file
+        )
+
+
+# Dependência para rotas que só precisam da identidade (id, nome, email).
+# Com JWT_STATELESS_IDENTITY ligado, confia nas claims assinadas e não consulta o banco;
+# o retorno é uma Identity (sem senha), não um User completo.
+async def get_current_identity(
+    payload: dict = Depends(get_token_payload),
+    user_repo: UserRepository = Depends(get_user_repository),
+) -> Identity:
+    if settings.JWT_STATELESS_IDENTITY and "name" in payload and "email" in payload:
+        try:
+            return Identity(
+                id=str(payload["sub"]),
+                name=payload["name"],
+                email=Email(payload["email"]),
+                token_version=int(payload.get("ver", 0)),
+            )
+        except (TypeError, ValueError):
+            raise _credentials_exception()
+    return await get_current_user(payload, user_repo)
+
+
+# Variante de get_current_identity para rotas de leitura (busca o usuário na réplica)
+async def get_current_identity_read(
+    payload: dict = Depends(get_token_payload),
+    user_repo: UserRepository = Depends(get_read_user_repository),
+) -> Identity:
+    return await get_current_identity(payload, user_repo)
+
+
+def _check_token_version(payload: dict, user: Identity) -> None:
+    """Rejeita tokens emitidos antes da última revogação (claim "ver")."""
+    if int(payload.get("ver", 0)) != user.token_version:
+        raise _credentials_exception("Token has been revoked")
+
+
+# Dependência para operações sensíveis: sempre vai ao banco (sem cache) e
+# rejeita tokens cuja versão foi revogada depois da emissão.
+async def get_current_user_strict(
+    payload: dict = Depends(get_token_payload),
+    user_repo: UserRepository = Depends(get_user_repository),
+) -> User:
+    user_id = str(payload["sub"])
+    user = await user_repo.get_by_id(user_id)
+    if user is None:
+        raise _credentials_exception()
+    _check_token_version(payload, user)
+    user_cache.set(user_id, user)
+    return user
+
+
+# Identidade opcional para leituras públicas que podem ser personalizadas
+# (ex.: corações na listagem). Sem token devolve None; com token, aplica as
+# mesmas regras das rotas autenticadas (get_token_payload, get_current_user)
+# e a checagem de revogação de get_current_user_strict: inválido ou revogado é 401.
+async def get_optional_viewer_id(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_bearer),
+    user_repo: UserRepository = Depends(get_read_user_repository),
+) -> Optional[str]:
+    if credentials is None:
+        return None
+    payload = await get_token_payload(request, credentials)
+    user = await get_current_user(payload, user_repo)
+    _check_token_version(payload, user)
+    return user.id
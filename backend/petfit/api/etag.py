@@ -0,0 +1,62 @@
+# petfit/api/etag.py
+"""
+Helpers de ETag / If-None-Match para as leituras de receitas.
+
+Os ETags são derivados de versões (do catálogo ou da receita), nunca do corpo
+da resposta, para que o 304 possa ser decidido antes de consultar o ORM. A
+exceção são os IDs de favoritos: a própria lista sai de um index-only scan,
+mais barato que manter uma versão por usuário, e o ETag é o hash dela.
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Response, status
+
+# Força os clientes a revalidarem sempre, sem servir cópia velha sem perguntar
+CACHE_CONTROL = "no-cache"
+# Respostas personalizadas por usuário não podem ir para caches compartilhados
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """ETag forte, estável para as mesmas partes (ex.: versão + parâmetros da query)."""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return '"' + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Compara If-None-Match com o ETag atual. Segue a RFC 9110: a comparação
+    é fraca (ignora o prefixo W/) e "*" casa com qualquer representação.
+    """
+    if not if_none_match:
+        return False
+    current = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == current:
+            return True
+    return False
+
+
+def set_etag(response: Response, etag: str, private: bool = False) -> None:
+    """Define o ETag. `private` para respostas por usuário: só o cache do próprio
+    cliente as guarda, e o Vary separa as cópias por token."""
+    response.headers["ETag"] = etag
+    if private:
+        response.headers["Cache-Control"] = PRIVATE_CACHE_CONTROL
+        response.headers["Vary"] = "Authorization"
+    else:
+        response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def set_private(response: Response) -> None:
+    """Marca uma resposta personalizada (sem ETag: a versão do catálogo não a cobre)."""
+    response.headers["Cache-Control"] = PRIVATE_CACHE_CONTROL
+
+
+def not_modified(etag: str, private: bool = False) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag, private=private)
+    return response
@@ -1,12 +1,81 @@
 # petfit/main.py
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 # REMOVER ESTA LINHA: from fastapi.security import HTTPBearer # <--- ESTA LINHA CAUSA O PROBLEMA
-from petfit.api.routes import recipe_route, user_route
+from petfit.api.routes import health_route, metrics_route, recipe_route, user_route
+from petfit.api.middleware import MetricsMiddleware, RequestContextMiddleware
+from petfit.infra.log import configure_logging, get_logger, shutdown_logging
+from petfit.infra.metrics import install_query_hooks
+from petfit.api.settings import settings
+from petfit.api.deps import password_hasher
+from petfit.infra.database import current_read_engine, dispose_engine, get_sessionmaker, init_engine, ping, warm_up
+from petfit.infra.repositories.sqlalchemy.sqlalchemy_recipe_repository import SQLAlchemyRecipeRepository
+from petfit.usecases.recipe.rollup_favorite_counts import RollupFavoriteCountsUseCase
 from petfit.api.openapi_tags import openapi_tags
 from fastapi.middleware.cors import CORSMiddleware
 
 
+logger = get_logger("api")
+
+
+async def _rollup_favorite_counts(interval: float) -> None:
+    """Consolida os contadores de favoritos a cada `interval` segundos.
+    Seguro com vários workers: cada delta é consumido por um único rollup, em lotes
+    de tamanho fixo que pulam as linhas travadas por outro worker."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with get_sessionmaker()() as session:
+                updated = await RollupFavoriteCountsUseCase(SQLAlchemyRecipeRepository(session)).execute()
+            logger.debug("Rollup de favoritos", extra={"recipes": updated})
+        except Exception:
+            logger.exception("Falha no rollup dos contadores de favoritos")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Configuração ausente é erro de deploy: falha o startup (banco fora do ar não)
+    if not settings.DATABASE_URL:
+        raise ValueError("DATABASE_URL must be set")
+    configure_logging(settings.LOG_LEVEL, json_output=settings.LOG_JSON)
+    # Cria o engine e aquece o pool antes de aceitar tráfego; se o banco ainda
+    # não responde, sobe mesmo assim e o /readyz segue tentando.
+    app.state.ready = False
+    try:
+        engine = init_engine(settings)
+        engines = [engine] + [e for e in (current_read_engine(),) if e is not None]
+        opened = sum(await asyncio.wait_for(
+            asyncio.gather(*(warm_up(e, settings.DB_WARMUP_CONNECTIONS) for e in engines)),
+            settings.DB_WARMUP_TIMEOUT_SECONDS,
+        ))
+        for e in engines:
+            await ping(e)
+        app.state.ready = True
+        logger.info("Pool aquecido", extra={"connections": opened})
+    except Exception as e:
+        logger.warning("Aquecimento do pool falhou; /readyz indicará indisponível", extra={"error": str(e)})
+
+    rollup_task = None
+    if settings.FAVORITE_COUNT_ROLLUP_SECONDS > 0:
+        rollup_task = asyncio.create_task(_rollup_favorite_counts(settings.FAVORITE_COUNT_ROLLUP_SECONDS))
+
+    yield
+
+    app.state.ready = False
+    if rollup_task is not None:
+        rollup_task.cancel()
+        try:
+            await rollup_task
+        except asyncio.CancelledError:
+            pass
+    await dispose_engine()
+    password_hasher.shutdown()
+    shutdown_logging()
+
+
 app = FastAPI(
     title="Petfit API",
     description="API backend do Petfit com FastAPI e PostgreSQL",
@@ -15,6 +84,7 @@ app = FastAPI(
     license_info={"name": "MIT", "url": "https://opensource.org/licenses/MIT"},
     openapi_tags=openapi_tags,
     redirect_slashes=True,
+    lifespan=lifespan,
 )
 
 origins = [
@@ -32,6 +102,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Por último = mais externo: mede a requisição inteira, inclusive o CORS
+app.add_middleware(RequestContextMiddleware, debug_sample_rate=settings.LOG_DEBUG_SAMPLE_RATE)
+app.add_middleware(
+    MetricsMiddleware,
+    query_budget=settings.DB_QUERY_BUDGET,
+    n_plus_one_threshold=settings.DB_N_PLUS_ONE_THRESHOLD,
+)
+install_query_hooks()
+
 
 @app.get("/")
 def ola():
@@ -39,4 +118,6 @@ def ola():
 
 
 app.include_router(user_route.router, prefix="/users", tags=["Users"])
-app.include_router(recipe_route.router, prefix="/recipes", tags=["Recipes"])
\ No newline at end of file
+app.include_router(recipe_route.router, prefix="/recipes", tags=["Recipes"])
+app.include_router(health_route.router, tags=["Health"])
+app.include_router(metrics_route.router, tags=["Health"])
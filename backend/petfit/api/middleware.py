@@ -0,0 +1,109 @@
+# petfit/api/middleware.py
+
+import time
+import uuid
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from petfit.infra.log import begin_request, end_request
+
+from petfit.infra.metrics import (
+    QueryStats,
+    current_query_stats,
+    db_queries_per_request,
+    db_time_per_request_seconds,
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_requests_total,
+)
+from petfit.infra.query_budget import report_query_budget
+
+# Rótulo para requisições que não casaram com nenhuma rota (evita um rótulo por URL)
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope: Scope) -> str:
+    """Caminho da rota com os parâmetros (ex.: /recipes/recipes/{recipe_id})."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI puro (sem BaseHTTPMiddleware, para não trocar de task e
+    manter o contexto visível aos hooks do SQLAlchemy). Mede latência, status,
+    requisições em andamento e queries/tempo de banco por rota.
+    """
+
+    def __init__(self, app: ASGIApp, query_budget: int = 0, n_plus_one_threshold: int = 0):
+        self.app = app
+        # Modo opcional de runtime (0 desliga): avisa sobre orçamento/N+1 por rota
+        self.query_budget = query_budget
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500  # Se a aplicação falhar antes de responder
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = QueryStats(track_shapes=self.n_plus_one_threshold > 0)
+        token = current_query_stats.set(stats)
+        http_requests_in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_requests_in_flight.dec()
+            current_query_stats.reset(token)
+
+            method = scope["method"]
+            route = route_template(scope)
+            http_requests_total.inc(method, route, str(status_code))
+            http_request_duration_seconds.observe(method, route, value=elapsed)
+            db_queries_per_request.observe(method, route, value=stats.count)
+            db_time_per_request_seconds.observe(method, route, value=stats.seconds)
+            if self.query_budget or self.n_plus_one_threshold:
+                report_query_budget(method, route, stats, self.query_budget, self.n_plus_one_threshold)
+
+
+# Cabeçalho de correlação: reaproveitado se vier do proxy, devolvido na resposta
+REQUEST_ID_HEADER = "x-request-id"
+
+
+class RequestContextMiddleware:
+    """Define o request_id dos logs e sorteia se a requisição emite DEBUG."""
+
+    def __init__(self, app: ASGIApp, debug_sample_rate: float = 1.0):
+        self.app = app
+        self.debug_sample_rate = debug_sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        incoming = dict(scope["headers"]).get(REQUEST_ID_HEADER.encode("latin-1"))
+        # Sem cabeçalho (ou vazio), gera o ID aqui: o mesmo vai para os logs e para a resposta
+        request_id = incoming.decode("latin-1")[:128] if incoming else ""
+        request_id = request_id or uuid.uuid4().hex
+        tokens = begin_request(self.debug_sample_rate, request_id)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            end_request(tokens)
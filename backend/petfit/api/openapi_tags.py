@@ -7,5 +7,9 @@ openapi_tags = [
         "name": "Posts",
         "description": "Criação, listagem, edição e remoção de posts.",
     },
+    {
+        "name": "Health",
+        "description": "Sondas de liveness/readiness e estado do pool de conexões.",
+    },
 
 ]
\ No newline at end of file
@@ -0,0 +1,157 @@
+# petfit/api/recipe_import.py
+"""
+Leitura incremental de NDJSON/CSV para a importação em massa de receitas.
+
+Compartilhado pela rota POST /recipes/import e pelo CLI petfit.cli.import_recipes.
+A entrada é consumida como stream de bytes; cada registro é validado com
+RecipeInput e vira um RecipeImportRow (receita ou erro), sem carregar o arquivo
+inteiro em memória.
+
+CSV: cabeçalho com title, ingredients, instructions e, opcionalmente, is_public.
+Listas vão na mesma célula separadas por "|" (ex.: "farinha|ovo|leite").
+"""
+
+import codecs
+import csv
+import json
+import uuid
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from petfit.api.schemas.recipe_schema import RecipeInput
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.entities.recipe_import import RecipeImportRow
+
+IMPORT_FORMATS = ("ndjson", "csv")
+CSV_LIST_SEPARATOR = "|"
+CSV_REQUIRED_COLUMNS = ("title", "ingredients", "instructions")
+# Protege a memória contra uma "linha" sem fim (ex.: arquivo binário enviado por engano)
+MAX_LINE_LENGTH = 1_000_000
+# Mesmo limite para um registro CSV com campo entre aspas em várias linhas: uma
+# aspa sem par não pode fazer o resto do arquivo se acumular em memória
+MAX_RECORD_LENGTH = MAX_LINE_LENGTH
+
+
+def format_from_content_type(content_type: Optional[str]) -> str:
+    """Deduz o formato pelo Content-Type; NDJSON é o padrão."""
+    if content_type and content_type.split(";")[0].strip().lower() in ("text/csv", "application/csv"):
+        return "csv"
+    return "ndjson"
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Quebra um stream de bytes UTF-8 em linhas (sem o terminador)."""
+    # utf-8-sig descarta o BOM que planilhas costumam gravar no início do arquivo
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+        if len(buffer) > MAX_LINE_LENGTH:
+            raise ValueError(f"Line longer than {MAX_LINE_LENGTH} characters.")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}"
+        for err in error.errors()
+    )
+
+
+def _to_import_row(row: int, data: Dict) -> RecipeImportRow:
+    try:
+        recipe_input = RecipeInput.model_validate(data)
+    except ValidationError as e:
+        return RecipeImportRow(row, error=_format_validation_error(e))
+    recipe = Recipe(
+        id=str(uuid.uuid4()),
+        title=recipe_input.title,
+        ingredients=list(recipe_input.ingredients),
+        instructions=list(recipe_input.instructions),
+        is_public=recipe_input.is_public,
+    )
+    return RecipeImportRow(row, recipe=recipe)
+
+
+async def parse_ndjson(lines: AsyncIterable[str]) -> AsyncIterator[RecipeImportRow]:
+    number = 0
+    async for line in lines:
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield RecipeImportRow(number, error=f"Invalid JSON: {e.msg}")
+            continue
+        if not isinstance(data, dict):
+            yield RecipeImportRow(number, error="Each line must be a JSON object.")
+            continue
+        yield _to_import_row(number, data)
+
+
+def _split_list(cell: str) -> List[str]:
+    return [item.strip() for item in cell.split(CSV_LIST_SEPARATOR) if item.strip()]
+
+
+async def parse_csv(lines: AsyncIterable[str]) -> AsyncIterator[RecipeImportRow]:
+    header: Optional[List[str]] = None
+    record: List[str] = []
+    start = number = size = 0
+    quoted = False
+    async for line in lines:
+        number += 1
+        if not record:
+            start = number
+            size = 0
+        record.append(line + "\n")
+        size += len(line) + 1
+        # Estado das aspas atualizado só com a linha nova: aspas em número ímpar
+        # deixam o registro aberto e ele continua na próxima linha (campo com quebra)
+        if line.count('"') % 2:
+            quoted = not quoted
+        if quoted:
+            if size > MAX_RECORD_LENGTH:
+                yield RecipeImportRow(
+                    start, error=f"Record longer than {MAX_RECORD_LENGTH} characters (unbalanced quote?)."
+                )
+                record, quoted = [], False
+            continue
+        pending, record = record, []
+        if not any(part.strip() for part in pending):
+            continue
+
+        fields = next(csv.reader(pending))
+        if header is None:
+            header = [name.strip().lower() for name in fields]
+            missing = [name for name in CSV_REQUIRED_COLUMNS if name not in header]
+            if missing:
+                raise ValueError(f"CSV header is missing columns: {', '.join(missing)}.")
+            continue
+        if len(fields) != len(header):
+            yield RecipeImportRow(start, error=f"Expected {len(header)} columns, got {len(fields)}.")
+            continue
+
+        cells: Dict[str, str] = dict(zip(header, fields))
+        data: Dict[str, object] = dict(cells)
+        data["ingredients"] = _split_list(cells["ingredients"])
+        data["instructions"] = _split_list(cells["instructions"])
+        if not cells.get("is_public"):
+            data.pop("is_public", None)  # Célula vazia: usa o padrão (pública)
+        yield _to_import_row(start, data)
+
+    if record:
+        yield RecipeImportRow(start, error="Unterminated quoted field.")
+
+
+def parse_recipe_rows(chunks: AsyncIterable[bytes], fmt: str) -> AsyncIterator[RecipeImportRow]:
+    if fmt not in IMPORT_FORMATS:
+        raise ValueError(f"Invalid format '{fmt}'. Allowed: {', '.join(IMPORT_FORMATS)}.")
+    lines = iter_lines(chunks)
+    return parse_csv(lines) if fmt == "csv" else parse_ndjson(lines)
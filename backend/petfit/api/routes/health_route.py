@@ -0,0 +1,72 @@
+# petfit/api/routes/health_route.py
+
+import asyncio
+
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
+
+from petfit.infra.database import current_engine, current_read_engine, ping
+from petfit.infra.log import get_logger
+from petfit.infra.pool import pool_metrics
+
+router = APIRouter()
+logger = get_logger("api.health")
+
+# A sonda do /readyz não pode prender o orquestrador
+READY_PROBE_TIMEOUT_SECONDS = 2.0
+
+
+def _pool_state() -> dict:
+    engine = current_engine()
+    if engine is None:
+        return {"initialized": False}
+    state = {"initialized": True, **pool_metrics.snapshot(engine.pool)}
+    read_engine = current_read_engine()
+    if read_engine is not None:
+        state["read_replica"] = pool_metrics.snapshot(read_engine.pool)
+    return state
+
+
+# ----------------------
+# Liveness
+# ----------------------
+@router.get(
+    "/healthz",
+    summary="Liveness",
+    description="Indica que o processo está de pé. Não consulta o banco.",
+    tags=["Health"],
+)
+async def healthz():
+    return {"status": "ok", "pool": _pool_state()}
+
+
+# ----------------------
+# Readiness
+# ----------------------
+@router.get(
+    "/readyz",
+    summary="Readiness",
+    description=(
+        "Indica se a instância pode receber tráfego: o pool foi aquecido no "
+        "startup. Enquanto não estiver pronta, tenta um SELECT 1 a cada chamada."
+    ),
+    tags=["Health"],
+)
+async def readyz(request: Request):
+    state = request.app.state
+    if not getattr(state, "ready", False):
+        engines = [e for e in (current_engine(), current_read_engine()) if e is not None]
+        if engines:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(ping(e) for e in engines)), READY_PROBE_TIMEOUT_SECONDS
+                )
+                state.ready = True
+            except Exception as e:
+                logger.warning("Readiness: banco indisponível", extra={"error": str(e)})
+    if not getattr(state, "ready", False):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "unavailable", "pool": _pool_state()},
+        )
+    return {"status": "ready", "pool": _pool_state()}
@@ -0,0 +1,75 @@
+# petfit/api/routes/metrics_route.py
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from petfit.api.deps import popular_cache, recent_writers, user_cache
+from petfit.infra.database import current_engine, current_read_engine
+from petfit.infra.log import dropped_records
+from petfit.infra.metrics import registry
+from petfit.infra.pool import pool_metrics
+
+router = APIRouter()
+
+# Versão do formato texto de exposição do Prometheus
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _cache_samples():
+    caches = {"user": user_cache, "recent_writers": recent_writers, "popular": popular_cache}
+    stats = {name: cache.stats() for name, cache in caches.items()}
+    for field, type_name in (("hits", "counter"), ("misses", "counter"), ("evictions", "counter"), ("size", "gauge")):
+        yield (
+            f"petfit_cache_{field}" + ("_total" if type_name == "counter" else ""),
+            f"Cache em processo: {field}.",
+            type_name,
+            [({"cache": name}, values[field]) for name, values in stats.items()],
+        )
+
+
+def _pool_samples():
+    engines = {"primary": current_engine(), "replica": current_read_engine()}
+    snapshots = {name: pool_metrics.snapshot(e.pool) for name, e in engines.items() if e is not None}
+    if not snapshots:
+        return
+    for field in ("size", "checkedout", "checkedin", "overflow"):
+        yield (
+            f"petfit_db_pool_{field}",
+            f"Pool de conexões: {field}.",
+            "gauge",
+            [({"pool": name}, snap[field]) for name, snap in snapshots.items() if field in snap],
+        )
+    # Contadores de checkout são do processo (todos os pools somados)
+    yield ("petfit_db_pool_checkouts_total", "Checkouts de conexão.", "counter", [({}, pool_metrics.checkouts)])
+    yield ("petfit_db_pool_timeouts_total", "Checkouts que estouraram o timeout.", "counter", [({}, pool_metrics.timeouts)])
+    yield (
+        "petfit_db_pool_wait_seconds_total", "Tempo total esperando por conexão.", "counter",
+        [({}, pool_metrics.wait_seconds_total)],
+    )
+    yield (
+        "petfit_db_pool_wait_seconds_max", "Maior espera por conexão.", "gauge",
+        [({}, pool_metrics.wait_seconds_max)],
+    )
+
+
+def _log_samples():
+    yield ("petfit_log_records_dropped_total", "Registros de log descartados com a fila cheia.", "counter", [({}, dropped_records())])
+
+
+registry.add_collector(_cache_samples)
+registry.add_collector(_log_samples)
+registry.add_collector(_pool_samples)
+
+
+@router.get(
+    "/metrics",
+    summary="Métricas (Prometheus)",
+    description=(
+        "Latência por rota, status, requisições em andamento, queries e tempo de "
+        "banco por requisição, caches e pool, no formato texto do Prometheus."
+    ),
+    response_class=PlainTextResponse,
+    tags=["Health"],
+)
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,36 +1,64 @@
 # petfit/api/routes/recipe_route.py
 
-from fastapi import APIRouter, HTTPException, Depends, status, Path, Body
-from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, status, Path, Body, Query, Header, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from typing import AsyncIterator, List, Optional
 
+from petfit.domain.entities.identity import Identity
 from petfit.domain.entities.user import User
 from petfit.domain.entities.recipe import Recipe 
+from petfit.domain.value_objects.ingredient_filter import IngredientFilter
 # Importe get_current_user e security_bearer do deps.py
-from petfit.api.deps import get_db_session, get_recipe_repository, get_current_user, security_bearer # <-- ADICIONADO security_bearer
-from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.api.deps import get_db_session, get_read_db_session, get_session_factory, get_read_session_factory, get_recipe_repository, get_current_identity, get_current_identity_read, get_current_user_strict, get_optional_viewer_id, security_bearer # <-- ADICIONADO security_bearer
+from petfit.domain.repositories.recipe_repository import (
+    RecipeRepository,
+    RECIPE_SORT_FIELDS,
+    DEFAULT_RECIPE_SORT,
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+    MAX_SEARCH_QUERY_LENGTH,
+    EXPORT_BATCH_SIZE,
+    IMPORT_CHUNK_SIZE,
+)
 
 from petfit.api.schemas.recipe_schema import (
     RecipeInput,
     RecipeOutput,
-    RecipeFavoriteResponse
+    RecipePageOutput,
+    RecipeImportOutput,
+    RecipeFavoriteResponse,
+    FavoriteBatchInput,
+    FavoriteBatchOutput,
 )
 from petfit.api.schemas.message_schema import MessageOutput 
+from petfit.api.recipe_import import IMPORT_FORMATS, format_from_content_type, parse_recipe_rows
+from petfit.api.etag import make_etag, etag_matches, set_etag, set_private, not_modified
 from fastapi.security import HTTPAuthorizationCredentials # <-- ADICIONADO para tipagem
 
 # Use cases
 from petfit.usecases.recipe.create_recipe import CreateRecipeUseCase
 from petfit.usecases.recipe.get_all_recipes import GetAllRecipesUseCase
 from petfit.usecases.recipe.get_recipe_by_id import GetRecipeByIdUseCase
+from petfit.usecases.recipe.search_recipes import SearchRecipesUseCase
+from petfit.usecases.recipe.export_public_recipes import ExportPublicRecipesUseCase
+from petfit.usecases.recipe.import_recipes import ImportRecipesUseCase
+from petfit.usecases.recipe.get_catalog_version import GetCatalogVersionUseCase
+from petfit.usecases.recipe.get_recipe_version import GetRecipeVersionUseCase
 from petfit.usecases.recipe.add_favorite_recipe import AddFavoriteRecipeUseCase
 from petfit.usecases.recipe.remove_favorite_recipe import RemoveFavoriteRecipeUseCase
 from petfit.usecases.recipe.get_user_favorite_recipes import GetUserFavoriteRecipesUseCase
+from petfit.usecases.recipe.batch_update_favorites import BatchUpdateFavoritesUseCase
+from petfit.usecases.recipe.get_user_favorite_ids import GetUserFavoriteIdsUseCase
+from petfit.usecases.recipe.get_popular_recipes import GetPopularRecipesUseCase
 from petfit.usecases.recipe.update_recipe import UpdateRecipeUseCase
 from petfit.usecases.recipe.delete_recipe import DeleteRecipeUseCase
 
-import uuid 
+import uuid
+from petfit.infra.log import get_logger
 
 router = APIRouter()
+logger = get_logger("api.recipes")
 
 # ----------------------
 # Create Recipe (Pode ser público ou privado inicialmente)
@@ -54,8 +82,8 @@ async def create_recipe(
         recipe_entity = Recipe(
             id=str(uuid.uuid4()),
             title=recipe_input.title,
-            ingredients=", ".join(recipe_input.ingredients),         
-            instructions="\n".join(recipe_input.instructions),       
+            ingredients=list(recipe_input.ingredients),
+            instructions=list(recipe_input.instructions),
             is_public=recipe_input.is_public
             )
         
@@ -64,7 +92,7 @@ async def create_recipe(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Erro inesperado ao criar receita: {e}")
+        logger.exception("Erro inesperado ao criar receita")
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
 # ----------------------
@@ -72,21 +100,190 @@ async def create_recipe(
 # ----------------------
 @router.get(
     "/recipes",
-    response_model=List[RecipeOutput],
-    summary="Listar todas as receitas públicas",
-    description="Retorna uma lista de todas as receitas marcadas como públicas.",
+    response_model=RecipePageOutput,
+    summary="Listar receitas públicas (paginado)",
+    description=(
+        "Retorna uma página de receitas públicas. Use `next_cursor` da resposta "
+        "no parâmetro `after` para obter a próxima página. Filtre por ingredientes "
+        "repetindo `with_ingredients` (contém todos), `any_ingredients` (contém "
+        "algum) e `without_ingredients` (não contém nenhum). A resposta traz um "
+        "`ETag`; reenvie-o em `If-None-Match` para receber 304 se nada mudou. "
+        "Com token, cada receita vem com `is_favorite` e `favorite_count` (sem ETag)."
+    ),
     tags=["Recipes"]
 )
 async def get_all_public_recipes(
-    db: AsyncSession = Depends(get_db_session),
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description="Quantidade máxima de receitas na página"),
+    after: Optional[str] = Query(None, description="Cursor opaco retornado em `next_cursor`"),
+    sort: str = Query(DEFAULT_RECIPE_SORT, description=f"Ordenação: {', '.join(RECIPE_SORT_FIELDS)}"),
+    with_ingredients: Optional[List[str]] = Query(None, description="Receitas que contêm todos estes ingredientes"),
+    any_ingredients: Optional[List[str]] = Query(None, description="Receitas que contêm ao menos um destes ingredientes"),
+    without_ingredients: Optional[List[str]] = Query(None, description="Receitas que não contêm nenhum destes ingredientes"),
+    if_none_match: Optional[str] = Header(None),
+    viewer_id: Optional[str] = Depends(get_optional_viewer_id),
+    db: AsyncSession = Depends(get_read_db_session),
 ):
     try:
+        ingredients = IngredientFilter(
+            all_of=with_ingredients, any_of=any_ingredients, none_of=without_ingredients
+        )
         recipe_repo = await get_recipe_repository(db)
         usecase = GetAllRecipesUseCase(recipe_repo)
-        recipes = await usecase.execute()
+        if viewer_id is not None:
+            # Página anotada com os favoritos do usuário, tudo na mesma query
+            page = await usecase.execute(
+                limit=limit, after=after, sort=sort, ingredients=ingredients, viewer_id=viewer_id
+            )
+            set_private(response)
+            return RecipePageOutput.from_page(page)
+
+        # A versão do catálogo muda a cada escrita; com os parâmetros, identifica a página
+        catalog_version = await GetCatalogVersionUseCase(recipe_repo).execute()
+        etag = make_etag("recipes", catalog_version, limit, after, sort, ingredients.cache_key())
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        page = await usecase.execute(limit=limit, after=after, sort=sort, ingredients=ingredients)
+        set_etag(response, etag)
+        return RecipePageOutput.from_page(page)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("Erro inesperado ao listar receitas públicas")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+# ----------------------
+# Export Public Recipes (NDJSON em streaming)
+# ----------------------
+async def _export_ndjson(session_factory: async_sessionmaker) -> AsyncIterator[str]:
+    # A sessão vive dentro do gerador: o corpo é enviado depois que a rota retorna
+    async with session_factory() as session:
+        recipe_repo = await get_recipe_repository(session)
+        usecase = ExportPublicRecipesUseCase(recipe_repo)
+        lines: List[str] = []
+        async for recipe in usecase.execute(batch_size=EXPORT_BATCH_SIZE):
+            lines.append(RecipeOutput.from_entity(recipe).model_dump_json() + "\n")
+            # Envia um lote por vez para não pagar um send() do ASGI por linha
+            if len(lines) >= EXPORT_BATCH_SIZE:
+                yield "".join(lines)
+                lines.clear()
+        if lines:
+            yield "".join(lines)
+
+
+@router.get(
+    "/export.ndjson",
+    summary="Exportar catálogo público (NDJSON)",
+    description=(
+        "Exporta todas as receitas públicas, uma por linha em JSON, ordenadas por ID. "
+        "A resposta é enviada em streaming a partir de um cursor no servidor, com "
+        "memória constante independente do tamanho do catálogo."
+    ),
+    response_class=StreamingResponse,
+    tags=["Recipes"]
+)
+async def export_public_recipes(
+    session_factory: async_sessionmaker = Depends(get_read_session_factory),
+):
+    return StreamingResponse(
+        _export_ndjson(session_factory),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="recipes.ndjson"'},
+    )
+
+# ----------------------
+# Bulk Import Recipes (AUTHENTICATED)
+# ----------------------
+@router.post(
+    "/import",
+    response_model=RecipeImportOutput,
+    summary="Importar receitas em massa",
+    description=(
+        "Importa receitas a partir do corpo da requisição em NDJSON (um objeto "
+        "RecipeInput por linha) ou CSV (`Content-Type: text/csv`, listas separadas "
+        "por `|`). O corpo é lido em streaming e gravado em lotes, uma transação por "
+        "lote. Retorna um relatório com os erros por linha. Requer autenticação."
+    ),
+    tags=["Recipes"],
+)
+async def import_recipes(
+    request: Request,
+    format: Optional[str] = Query(None, description=f"Força o formato: {', '.join(IMPORT_FORMATS)}"),
+    credentials: HTTPAuthorizationCredentials = Depends(security_bearer),
+    current_user: User = Depends(get_current_user_strict),
+    db: AsyncSession = Depends(get_db_session),
+):
+    try:
+        fmt = format or format_from_content_type(request.headers.get("content-type"))
+        rows = parse_recipe_rows(request.stream(), fmt)
+        recipe_repo = await get_recipe_repository(db)
+        usecase = ImportRecipesUseCase(recipe_repo)
+        report = await usecase.execute(rows, chunk_size=IMPORT_CHUNK_SIZE)
+        return RecipeImportOutput.from_report(report)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("Erro inesperado ao importar receitas")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+# ----------------------
+# Search Public Recipes
+# ----------------------
+@router.get(
+    "/search",
+    response_model=RecipePageOutput,
+    summary="Buscar receitas públicas",
+    description=(
+        "Busca textual em título, ingredientes e modo de preparo, com resultados "
+        "ordenados por relevância. Aceita a sintaxe de busca web (\"frase exata\", "
+        "`-termo`, `or`). Paginado por `next_cursor`/`after`."
+    ),
+    tags=["Recipes"]
+)
+async def search_recipes(
+    q: str = Query(..., min_length=1, max_length=MAX_SEARCH_QUERY_LENGTH, description="Texto a buscar"),
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description="Quantidade máxima de receitas na página"),
+    after: Optional[str] = Query(None, description="Cursor opaco retornado em `next_cursor`"),
+    db: AsyncSession = Depends(get_read_db_session),
+):
+    try:
+        recipe_repo = await get_recipe_repository(db)
+        usecase = SearchRecipesUseCase(recipe_repo)
+        page = await usecase.execute(q, limit=limit, after=after)
+        return RecipePageOutput.from_page(page)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("Erro inesperado ao buscar receitas")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+# ----------------------
+# Get Popular Recipes
+# ----------------------
+@router.get(
+    "/popular",
+    response_model=List[RecipeOutput],
+    summary="Receitas mais favoritadas",
+    description=(
+        "Retorna as receitas públicas mais favoritadas, com `favorite_count`. "
+        "O ranking é consolidado periodicamente e fica em cache por alguns "
+        "segundos, então pode estar levemente atrasado."
+    ),
+    tags=["Recipes"]
+)
+async def get_popular_recipes(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description="Quantas receitas retornar"),
+    db: AsyncSession = Depends(get_read_db_session),
+):
+    try:
+        recipe_repo = await get_recipe_repository(db)
+        recipes = await GetPopularRecipesUseCase(recipe_repo).execute(limit)
         return [RecipeOutput.from_entity(r) for r in recipes]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Erro inesperado ao listar receitas públicas: {e}")
+        logger.exception("Erro inesperado ao listar receitas populares")
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
 # ----------------------
@@ -96,22 +293,48 @@ async def get_all_public_recipes(
     "/recipes/{recipe_id}",
     response_model=RecipeOutput,
     summary="Obter receita por ID",
-    description="Retorna os detalhes de uma receita específica pelo seu ID.",
+    description=(
+        "Retorna os detalhes de uma receita específica pelo seu ID. Suporta "
+        "`If-None-Match` com o `ETag` devolvido anteriormente. Com token, a "
+        "receita vem com `is_favorite` e `favorite_count` (sem ETag)."
+    ),
     tags=["Recipes"]
 )
 async def get_recipe_by_id(
+    response: Response,
     recipe_id: str = Path(..., description="ID da receita a ser obtida"),
-    db: AsyncSession = Depends(get_db_session),
+    if_none_match: Optional[str] = Header(None),
+    viewer_id: Optional[str] = Depends(get_optional_viewer_id),
+    db: AsyncSession = Depends(get_read_db_session),
 ):
     try:
         recipe_repo = await get_recipe_repository(db)
         usecase = GetRecipeByIdUseCase(recipe_repo)
+        if viewer_id is not None:
+            recipe = await usecase.execute(recipe_id, viewer_id=viewer_id)
+            if not recipe:
+                raise HTTPException(status_code=404, detail="Recipe not found.")
+            set_private(response)
+            return RecipeOutput.from_entity(recipe)
+
+        version = await GetRecipeVersionUseCase(recipe_repo).execute(recipe_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Recipe not found.")
+        etag = make_etag("recipe", recipe_id, version)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
         recipe = await usecase.execute(recipe_id)
         if not recipe:
             raise HTTPException(status_code=404, detail="Recipe not found.")
+        # Usa a versão efetivamente lida, caso tenha mudado entre as duas queries
+        etag = make_etag("recipe", recipe_id, recipe.version)
+        set_etag(response, etag)
         return RecipeOutput.from_entity(recipe)
+    except HTTPException as e:
+        raise e
     except Exception as e:
-        print(f"Erro inesperado ao obter receita por ID: {e}")
+        logger.exception("Erro inesperado ao obter receita por ID")
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
 
@@ -130,10 +353,10 @@ async def get_recipe_by_id(
 async def add_recipe_to_favorites(
     recipe_id: str = Path(..., description="ID da receita a ser favoritada"),
     credentials: HTTPAuthorizationCredentials = Depends(security_bearer), # <-- Adicionado aqui para consistência
-    current_user: User = Depends(get_current_user), 
+    current_user: Identity = Depends(get_current_identity), 
     db: AsyncSession = Depends(get_db_session),
 ):
-    print(f"DEBUG: current_user ID in add_recipe_to_favorites: {current_user.id if current_user else 'None'} Type: {type(current_user)}")
+    logger.debug("add_recipe_to_favorites", extra={"user_id": current_user.id})
     try:
         recipe_repo = await get_recipe_repository(db)
         usecase = AddFavoriteRecipeUseCase(recipe_repo)
@@ -142,13 +365,13 @@ async def add_recipe_to_favorites(
         if added:
             return MessageOutput(message="Recipe added to favorites successfully.")
         else:
-            raise HTTPException(status_code=400, detail="Recipe is already in favorites or not found.")
+            raise HTTPException(status_code=400, detail="Recipe is already in favorites.")
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) 
     except HTTPException as e: 
         raise e 
     except Exception as e:
-        print(f"Erro inesperado ao adicionar receita aos favoritos: {e}")
+        logger.exception("Erro inesperado ao adicionar receita aos favoritos")
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
 
@@ -167,10 +390,10 @@ async def add_recipe_to_favorites(
 async def remove_recipe_from_favorites(
     recipe_id: str = Path(..., description="ID da receita a ser removida dos favoritos"),
     credentials: HTTPAuthorizationCredentials = Depends(security_bearer), # <-- Adicionado aqui
-    current_user: User = Depends(get_current_user), 
+    current_user: Identity = Depends(get_current_identity), 
     db: AsyncSession = Depends(get_db_session),
 ):
-    print(f"DEBUG: current_user ID in remove_recipe_from_favorites: {current_user.id if current_user else 'None'} Type: {type(current_user)}")
+    logger.debug("remove_recipe_from_favorites", extra={"user_id": current_user.id})
     try:
         recipe_repo = await get_recipe_repository(db)
         usecase = RemoveFavoriteRecipeUseCase(recipe_repo)
@@ -185,7 +408,7 @@ async def remove_recipe_from_favorites(
     except HTTPException as e:
         raise e
     except Exception as e:
-        print(f"Erro inesperado ao remover receita dos favoritos: {e}")
+        logger.exception("Erro inesperado ao remover receita dos favoritos")
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
 
@@ -194,27 +417,109 @@ async def remove_recipe_from_favorites(
 # ----------------------
 @router.get(
     "/users/me/favorites/recipes", 
-    response_model=List[RecipeOutput],
-    summary="Listar receitas favoritas do usuário logado",
-    description="Retorna uma lista das receitas favoritas do usuário atualmente logado.",
+    response_model=RecipePageOutput,
+    summary="Listar receitas favoritas do usuário logado (paginado)",
+    description=(
+        "Retorna uma página das receitas favoritas do usuário atualmente logado, "
+        "das favoritadas mais recentemente às mais antigas. Use `next_cursor` da "
+        "resposta no parâmetro `after` para obter a próxima página."
+    ),
     tags=["Users", "Favorites"],
     # Removido: dependencies=[Depends(get_current_user)] 
 )
 async def get_my_favorite_recipes(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description="Quantidade máxima de receitas na página"),
+    after: Optional[str] = Query(None, description="Cursor opaco retornado em `next_cursor`"),
     credentials: HTTPAuthorizationCredentials = Depends(security_bearer), # <-- Adicionado aqui
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db_session),
+    current_user: Identity = Depends(get_current_identity_read),
+    db: AsyncSession = Depends(get_read_db_session),
 ):
-    print(f"DEBUG: current_user ID in get_my_favorite_recipes: {current_user.id if current_user else 'None'} Type: {type(current_user)}")
+    logger.debug("get_my_favorite_recipes", extra={"user_id": current_user.id})
     try:
         recipe_repo = await get_recipe_repository(db)
         usecase = GetUserFavoriteRecipesUseCase(recipe_repo)
-        favorite_recipes = await usecase.execute(current_user)
-        return [RecipeOutput.from_entity(r) for r in favorite_recipes]
+        page = await usecase.execute(current_user, limit=limit, after=after)
+        return RecipePageOutput.from_page(page)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.exception("Erro inesperado ao listar favoritos do usuário")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+# ----------------------
+# Get User Favorite IDs (AUTHENTICATED)
+# ----------------------
+@router.get(
+    "/users/me/favorites/ids",
+    response_model=List[str],
+    summary="Listar IDs das receitas favoritas do usuário logado",
+    description=(
+        "Retorna só os IDs das receitas favoritas, para marcar os corações na "
+        "listagem sem baixar as receitas. A resposta traz um `ETag`; reenvie-o "
+        "em `If-None-Match` para receber 304 se os favoritos não mudaram."
+    ),
+    tags=["Users", "Favorites"],
+)
+async def get_my_favorite_ids(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    credentials: HTTPAuthorizationCredentials = Depends(security_bearer),
+    current_user: Identity = Depends(get_current_identity_read),
+    db: AsyncSession = Depends(get_read_db_session),
+):
+    try:
+        recipe_repo = await get_recipe_repository(db)
+        favorite_ids = await GetUserFavoriteIdsUseCase(recipe_repo).execute(current_user)
+        etag = make_etag("favorite-ids", current_user.id, *favorite_ids)
+        # Lista por usuário: fora de caches compartilhados
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, private=True)
+        set_etag(response, etag, private=True)
+        return favorite_ids
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.exception("Erro inesperado ao listar IDs de favoritos do usuário")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+# ----------------------
+# Batch Add/Remove Favorites (AUTHENTICATED)
+# ----------------------
+@router.post(
+    "/users/me/favorites/recipes/batch",
+    response_model=FavoriteBatchOutput,
+    summary="Adicionar e remover favoritos em lote",
+    description=(
+        "Sincroniza vários favoritos de uma vez (ex.: corações marcados offline). "
+        "Retorna o resultado de cada ID: added, already_favorite, removed, not_favorite ou not_found."
+    ),
+    tags=["Users", "Favorites"],
+)
+async def batch_update_my_favorites(
+    payload: FavoriteBatchInput,
+    credentials: HTTPAuthorizationCredentials = Depends(security_bearer),
+    current_user: Identity = Depends(get_current_identity),
+    db: AsyncSession = Depends(get_db_session),
+):
+    logger.debug(
+        "batch_update_my_favorites",
+        extra={"user_id": current_user.id, "add": len(payload.add), "remove": len(payload.remove)},
+    )
+    try:
+        recipe_repo = await get_recipe_repository(db)
+        usecase = BatchUpdateFavoritesUseCase(recipe_repo)
+        result = await usecase.execute(current_user, payload.add, payload.remove)
+        return FavoriteBatchOutput.from_result(result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException as e:
         raise e
     except Exception as e:
-        print(f"Erro inesperado ao listar favoritos do usuário: {e}")
+        logger.exception("Erro inesperado ao sincronizar favoritos em lote")
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
 # ----------------------
@@ -232,10 +537,10 @@ async def update_recipe_endpoint(
     recipe_id: str = Path(..., description="ID da receita a ser atualizada"),
     recipe_input: RecipeInput = Body(..., description="Dados da receita para atualização"),
     credentials: HTTPAuthorizationCredentials = Depends(security_bearer), # <-- Adicionado aqui
-    current_user: User = Depends(get_current_user), 
+    current_user: User = Depends(get_current_user_strict), 
     db: AsyncSession = Depends(get_db_session),
 ):
-    print(f"DEBUG: current_user ID in update_recipe_endpoint: {current_user.id if current_user else 'None'} Type: {type(current_user)}")
+    logger.debug("update_recipe_endpoint", extra={"user_id": current_user.id})
     try:
         recipe_repo = await get_recipe_repository(db)
         usecase = UpdateRecipeUseCase(recipe_repo)
@@ -243,8 +548,8 @@ async def update_recipe_endpoint(
         updated_recipe_entity = Recipe(
                 id=recipe_id,
                 title=recipe_input.title,
-                ingredients=", ".join(recipe_input.ingredients),         
-                instructions="\n".join(recipe_input.instructions),       
+                ingredients=list(recipe_input.ingredients),
+                instructions=list(recipe_input.instructions),
                 is_public=recipe_input.is_public
             )
 
@@ -259,7 +564,7 @@ async def update_recipe_endpoint(
     except HTTPException as e:
         raise e
     except Exception as e:
-        print(f"Erro inesperado ao atualizar receita: {e}")
+        logger.exception("Erro inesperado ao atualizar receita")
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
 # ----------------------
@@ -276,10 +581,10 @@ async def update_recipe_endpoint(
 async def delete_recipe_endpoint(
     recipe_id: str = Path(..., description="ID da receita a ser deletada"),
     credentials: HTTPAuthorizationCredentials = Depends(security_bearer), # <-- Adicionado aqui
-    current_user: User = Depends(get_current_user), 
+    current_user: User = Depends(get_current_user_strict), 
     db: AsyncSession = Depends(get_db_session),
 ):
-    print(f"DEBUG: current_user ID in delete_recipe_endpoint: {current_user.id if current_user else 'None'} Type: {type(current_user)}")
+    logger.debug("delete_recipe_endpoint", extra={"user_id": current_user.id})
     try:
         recipe_repo = await get_recipe_repository(db)
         usecase = DeleteRecipeUseCase(recipe_repo)
@@ -292,5 +597,5 @@ async def delete_recipe_endpoint(
     except HTTPException as e:
         raise e
     except Exception as e:
-        print(f"Erro inesperado ao deletar receita: {e}")
+        logger.exception("Erro inesperado ao deletar receita")
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
\ No newline at end of file
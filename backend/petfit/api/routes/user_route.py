@@ -5,14 +5,17 @@ from petfit.usecases.user.register_user import RegisterUserUseCase
 from petfit.usecases.user.login_user import LoginUserUseCase
 from petfit.usecases.user.logout_user import LogoutUserUseCase
 from petfit.usecases.user.get_current_user import GetCurrentUserUseCase
+from petfit.usecases.user.revoke_user_tokens import RevokeUserTokensUseCase
+from petfit.domain.entities.identity import Identity
 from petfit.domain.entities.user import User
 from petfit.domain.value_objects.email_vo import Email
 from petfit.domain.value_objects.password import Password, PasswordValidationError
 import uuid
+from petfit.infra.log import get_logger
 from sqlalchemy.ext.asyncio import AsyncSession
 # Importe HTTPAuthorizationCredentials e security_bearer do deps.py
 from fastapi.security import HTTPAuthorizationCredentials # <-- ADICIONADO
-from petfit.api.deps import get_db_session, get_user_repository, get_current_user, security_bearer # <-- ADICIONADO security_bearer
+from petfit.api.deps import get_db_session, get_user_repository, get_current_user, get_current_identity, get_current_identity_read, get_current_user_strict, get_password_hasher, mark_recent_writer, security_bearer # <-- ADICIONADO security_bearer
 from petfit.infra.repositories.sqlalchemy.sqlachemy_user_repository import (
     SQLAlchemyUserRepository,
 )
@@ -25,13 +28,15 @@ from petfit.api.schemas.user_schema import (
     TokenResponse,
 )
 from petfit.api.schemas.message_schema import MessageOutput
-from petfit.api.security import create_access_token
+from petfit.api.security import create_access_token, build_token_claims
 from petfit.domain.repositories.user_repository import UserRepository
+from petfit.domain.services.password_hasher import PasswordHasher
 from petfit.api.schemas.user_schema import LoginUserInput
 from petfit.api.security import verify_token
 
 
 router = APIRouter()
+logger = get_logger("api.users")
 
 # ----------------------
 # Register
@@ -46,7 +51,9 @@ router = APIRouter()
     status_code=status.HTTP_201_CREATED 
 )
 async def register_user(
-    data: RegisterUserInput, db: AsyncSession = Depends(get_db_session)
+    data: RegisterUserInput,
+    db: AsyncSession = Depends(get_db_session),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
 ):
     try:
         user_repo = SQLAlchemyUserRepository(db)
@@ -55,9 +62,12 @@ async def register_user(
             id=str(uuid.uuid4()),
             name=data.name,
             email=Email(data.email),
-            password=data.password, 
+            password=await password_hasher.hash(data.password),
         )
         await usecase.execute(user)
+        # Register e login não levam token: abre aqui a janela de read-your-writes,
+        # senão as primeiras leituras do usuário novo podem não achá-lo na réplica
+        mark_recent_writer(user.id)
         return MessageOutput(
             message="User registered successfully"
         )
@@ -66,7 +76,7 @@ async def register_user(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Erro inesperado no registro: {e}")
+        logger.exception("Erro inesperado no registro")
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
 
@@ -84,14 +94,17 @@ async def register_user(
 async def login_user(
     data: LoginUserInput,
     user_repo: UserRepository = Depends(get_user_repository),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
 ):
     try:
-        usecase = LoginUserUseCase(user_repo)
+        usecase = LoginUserUseCase(user_repo, password_hasher)
         user = await usecase.execute(Email(data.email), data.password) 
 
         if not user:
             raise HTTPException(status_code=401, detail="Invalid credentials")
-        token = create_access_token(data={"sub": user.id})
+        # O usuário pode ter acabado de se registrar (ou ter o hash migrado)
+        mark_recent_writer(user.id)
+        token = create_access_token(data=build_token_claims(user))
         return TokenResponse(
             access_token=token, token_type="bearer", user=UserOutput.from_entity(user)
         )
@@ -100,7 +113,7 @@ async def login_user(
     except ValueError as e: 
         raise HTTPException(status_code=401, detail=str(e))
     except Exception as e:
-        print(f"Erro inesperado no login: {e}")
+        logger.exception("Erro inesperado no login")
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
 
@@ -117,13 +130,38 @@ async def login_user(
 )
 async def get_me_user(
     credentials: HTTPAuthorizationCredentials = Depends(security_bearer), # <-- Mude aqui para security_bearer
-    user: User = Depends(get_current_user),
+    user: Identity = Depends(get_current_identity_read),
 ):
-    print(f"DEBUG: current_user ID in get_me_user: {user.id if user else 'None'} Type: {type(user)}") # Adicione print aqui também
+    logger.debug("get_me_user", extra={"user_id": user.id})
     try:
         return UserOutput.from_entity(user)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        print(f"Erro inesperado ao obter usuário atual: {e}")
-        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
\ No newline at end of file
+        logger.exception("Erro inesperado ao obter usuário atual")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+# ----------------------
+# Revoke Tokens
+# ----------------------
+
+
+@router.post(
+    "/me/tokens/revoke",
+    response_model=MessageOutput,
+    summary="Revogar tokens do usuário atual",
+    description="Invalida todos os tokens já emitidos para o usuário atual (inclusive o usado nesta chamada).",
+)
+async def revoke_my_tokens(
+    credentials: HTTPAuthorizationCredentials = Depends(security_bearer),
+    user: User = Depends(get_current_user_strict),
+    user_repo: UserRepository = Depends(get_user_repository),
+):
+    try:
+        usecase = RevokeUserTokensUseCase(user_repo)
+        await usecase.execute(user)
+        return MessageOutput(message="Tokens revoked successfully")
+    except Exception as e:
+        logger.exception("Erro inesperado ao revogar tokens")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
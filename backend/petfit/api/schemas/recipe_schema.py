@@ -13,6 +13,8 @@ class RecipeOutput(BaseModel):
     ingredients: List[str] = Field(..., description="Lista de ingredientes")
     instructions: List[str] = Field(..., description="Lista de instruções")
     is_public: bool = Field(..., description="Indica se a receita é pública")
+    is_favorite: Optional[bool] = Field(None, description="Se é favorita do usuário autenticado (null sem token)")
+    favorite_count: Optional[int] = Field(None, description="Quantos usuários favoritaram (null sem token)")
 
     @classmethod
     def from_entity(cls, recipe):
@@ -22,8 +24,60 @@ class RecipeOutput(BaseModel):
             ingredients=recipe.ingredients,
             instructions=recipe.instructions,
             is_public=recipe.is_public,
+            is_favorite=recipe.is_favorite,
+            favorite_count=recipe.favorite_count,
+        )
+
+class RecipePageOutput(BaseModel):
+    items: List[RecipeOutput] = Field(..., description="Receitas desta página")
+    next_cursor: Optional[str] = Field(None, description="Cursor para a próxima página (null na última)")
+
+    @classmethod
+    def from_page(cls, page):
+        return cls(
+            items=[RecipeOutput.from_entity(r) for r in page.items],
+            next_cursor=page.next_cursor,
         )
 
 class RecipeFavoriteResponse(BaseModel):
     message: str
-    recipe_id: str
\ No newline at end of file
+    recipe_id: str
+
+class FavoriteBatchInput(BaseModel):
+    add: List[str] = Field(default_factory=list, description="IDs de receitas a favoritar")
+    remove: List[str] = Field(default_factory=list, description="IDs de receitas a desfavoritar")
+
+class FavoriteOutcomeOutput(BaseModel):
+    recipe_id: str = Field(..., description="ID da receita")
+    outcome: str = Field(
+        ...,
+        description="added, already_favorite, removed, not_favorite ou not_found",
+    )
+
+class FavoriteBatchOutput(BaseModel):
+    results: List[FavoriteOutcomeOutput] = Field(..., description="Resultado por ID, na ordem enviada")
+
+    @classmethod
+    def from_result(cls, result):
+        return cls(
+            results=[FavoriteOutcomeOutput(recipe_id=r, outcome=o) for r, o in result.items()]
+        )
+
+class RecipeImportErrorOutput(BaseModel):
+    row: int = Field(..., description="Linha (NDJSON) ou registro (CSV) de origem, começando em 1")
+    error: str = Field(..., description="Motivo da rejeição")
+
+class RecipeImportOutput(BaseModel):
+    total: int = Field(..., description="Registros lidos")
+    imported: int = Field(..., description="Receitas gravadas")
+    failed: int = Field(..., description="Registros rejeitados")
+    errors: List[RecipeImportErrorOutput] = Field(..., description="Detalhe dos erros (limitado aos primeiros)")
+
+    @classmethod
+    def from_report(cls, report):
+        return cls(
+            total=report.total,
+            imported=report.imported,
+            failed=report.failed,
+            errors=[RecipeImportErrorOutput(row=e.row, error=e.error) for e in report.errors],
+        )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator
 from typing import Literal
 from petfit.domain.entities.user import User
 from petfit.domain.value_objects.password import Password
@@ -6,7 +6,13 @@ from petfit.domain.value_objects.password import Password
 class RegisterUserInput(BaseModel):
     name: str = Field(..., min_length=3, max_length=50, description="Nome do usuário")
     email: EmailStr = Field(..., description="Email do usuário")
-    password: Password = Field(..., description="Senha do usuário") 
+    # Só valida aqui; o hash é gerado pelo PasswordHasher fora do event loop
+    password: str = Field(..., description="Senha do usuário")
+
+    @field_validator("password")
+    @classmethod
+    def validate_password(cls, value: str) -> str:
+        return Password.validate(value)
 
 
 class LoginUserInput(BaseModel):
@@ -1,18 +1,19 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from petfit.api.settings import settings
+from petfit.domain.entities.user import User
+from petfit.domain.value_objects.password import check_password, hash_password
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Mesma implementação/custo usados pelo Password e pelo PasswordHasher
 
 
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    return check_password(plain_password, hashed_password)
 
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    return hash_password(password, settings.BCRYPT_ROUNDS)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -22,6 +23,14 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
+def build_token_claims(user: User) -> dict:
+    # "ver" permite revogar tokens emitidos incrementando users.token_version
+    claims = {"sub": user.id, "ver": user.token_version}
+    if settings.JWT_STATELESS_IDENTITY:
+        claims.update({"name": user.name, "email": str(user.email)})
+    return claims
+
+
 def verify_token(token: str) -> Optional[dict]:
     try:
         payload = jwt.decode(
@@ -1,9 +1,11 @@
 import os
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import ClassVar
+from pydantic_settings import SettingsConfigDict
+from typing import ClassVar, Optional
 
+from petfit.infra.settings import DatabaseSettings
 
-class Settings(BaseSettings):
+
+class Settings(DatabaseSettings):
     POSTGRES_USER: str = "petfituser"
     POSTGRES_PASSWORD: str = "petfitpass"
     POSTGRES_DB: str = "petfitdb"
@@ -12,14 +14,47 @@ class Settings(BaseSettings):
 
     DOCKER_ENV: int = 0
 
-    DATABASE_URL: str = "postgresql+asyncpg://petfituser:petfitpass@db:5432/petfitdb"
+    # DATABASE_URL, DATABASE_READ_URL e o pool (DB_*) vêm de DatabaseSettings (infra)
     DATABASE_URL_ALEMBIC: str = "postgresql+psycopg2://petfituser:petfitpass@db:5432/petfitdb"
+    # Após uma escrita, as leituras do mesmo usuário vão ao primário por este tempo
+    READ_YOUR_WRITES_SECONDS: float = 5.0
     DATABASE_URL_TEST: str = "postgresql+asyncpg://test_user:test_password@db_test:5432/petfit_test"
 
     SECRET_KEY: str = "myjwtsecret"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Assina nome/email no token para rotas de identidade dispensarem o banco
+    JWT_STATELESS_IDENTITY: bool = False
+
+    # Pool usado para bcrypt fora do event loop ("thread" ou "process")
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_EXECUTOR: str = "thread"
+    # Custo do bcrypt; hashes antigos com outro custo são refeitos no login
+    BCRYPT_ROUNDS: int = 12
+
+    # Cache de usuários autenticados (get_current_user); 0 desativa
+    USER_CACHE_TTL_SECONDS: float = 30.0
+    USER_CACHE_MAXSIZE: int = 10000
+
+    # Receitas populares: cache do ranking (0 desativa) e intervalo do rollup
+    # que consolida os contadores de favoritos em recipes.favorite_count (0 desliga)
+    POPULAR_CACHE_TTL_SECONDS: float = 60.0
+    FAVORITE_COUNT_ROLLUP_SECONDS: float = 30.0
+
+    # Conexões abertas no startup (limitado a DB_POOL_SIZE) e tempo máximo para isso
+    DB_WARMUP_CONNECTIONS: int = 2
+    DB_WARMUP_TIMEOUT_SECONDS: float = 10.0
+
+    # Detecção em runtime (0 desliga): avisa quando uma requisição passa de
+    # DB_QUERY_BUDGET queries ou repete o mesmo statement N vezes (provável N+1)
+    DB_QUERY_BUDGET: int = 0
+    DB_N_PLUS_ONE_THRESHOLD: int = 0
 
+    # Logging (petfit.infra.log)
+    LOG_LEVEL: str = "INFO"
+    LOG_JSON: bool = True
+    # Fração das requisições que emitem linhas de DEBUG (com LOG_LEVEL=DEBUG)
+    LOG_DEBUG_SAMPLE_RATE: float = 1.0
 
     model_config: ClassVar[SettingsConfigDict] = SettingsConfigDict(
         env_file=".env", extra="ignore"
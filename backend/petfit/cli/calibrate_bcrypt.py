@@ -0,0 +1,79 @@
+# petfit/cli/calibrate_bcrypt.py
+"""
+Mede o tempo do bcrypt neste host e sugere um BCRYPT_ROUNDS.
+
+Uso:
+    python -m petfit.cli.calibrate_bcrypt --target-ms 250
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Callable, List, Optional, Tuple
+
+from petfit.domain.value_objects.password import hash_password
+
+MIN_ROUNDS = 4
+MAX_ROUNDS = 31
+_SAMPLE_PASSWORD = "CalibracaoPetfit123"
+
+
+def measure_rounds(rounds: int, samples: int = 3) -> float:
+    """Retorna a mediana (em ms) de `samples` hashes com o custo informado."""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hash_password(_SAMPLE_PASSWORD, rounds)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def suggest_rounds(
+    target_ms: float,
+    min_rounds: int = 10,
+    max_rounds: int = 16,
+    measure: Callable[[int], float] = measure_rounds,
+) -> Tuple[int, List[Tuple[int, float]]]:
+    """
+    Sobe o custo a partir de `min_rounds` até passar do alvo e devolve o maior
+    custo que ainda ficou dentro dele (nunca abaixo de `min_rounds`), junto com
+    as medições feitas. Cada +1 no custo dobra o tempo, então poucas medições bastam.
+    """
+    measurements: List[Tuple[int, float]] = []
+    best = min_rounds
+    for rounds in range(min_rounds, max_rounds + 1):
+        elapsed = measure(rounds)
+        measurements.append((rounds, elapsed))
+        if elapsed > target_ms:
+            break
+        best = rounds
+    return best, measurements
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Sugere o custo do bcrypt para um tempo alvo de hash.")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="Tempo alvo por hash em milissegundos")
+    parser.add_argument("--min-rounds", type=int, default=10, help="Menor custo aceitável")
+    parser.add_argument("--max-rounds", type=int, default=16, help="Maior custo a testar")
+    parser.add_argument("--samples", type=int, default=3, help="Hashes por custo (usa a mediana)")
+    args = parser.parse_args(argv)
+
+    if not MIN_ROUNDS <= args.min_rounds <= args.max_rounds <= MAX_ROUNDS:
+        parser.error(f"rounds must satisfy {MIN_ROUNDS} <= min-rounds <= max-rounds <= {MAX_ROUNDS}")
+
+    best, measurements = suggest_rounds(
+        args.target_ms,
+        args.min_rounds,
+        args.max_rounds,
+        measure=lambda rounds: measure_rounds(rounds, args.samples),
+    )
+    for rounds, elapsed in measurements:
+        marker = "  <-- sugerido" if rounds == best else ""
+        print(f"rounds={rounds:>2}  {elapsed:8.1f} ms{marker}")
+    print(f"\nBCRYPT_ROUNDS={best}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
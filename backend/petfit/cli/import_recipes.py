@@ -0,0 +1,73 @@
+# petfit/cli/import_recipes.py
+"""
+Importa receitas em massa de um arquivo NDJSON ou CSV direto no banco.
+
+Uso:
+    python -m petfit.cli.import_recipes receitas.ndjson
+    python -m petfit.cli.import_recipes receitas.csv --chunk-size 5000
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import AsyncIterator, List, Optional
+
+from petfit.api.recipe_import import IMPORT_FORMATS, parse_recipe_rows
+from petfit.domain.entities.recipe_import import RecipeImportReport
+from petfit.domain.repositories.recipe_repository import IMPORT_CHUNK_SIZE
+from petfit.usecases.recipe.import_recipes import ImportRecipesUseCase
+
+_READ_SIZE = 64 * 1024
+
+
+async def _file_chunks(path: str) -> AsyncIterator[bytes]:
+    with open(path, "rb") as file:
+        while chunk := file.read(_READ_SIZE):
+            yield chunk
+
+
+async def run(path: str, fmt: str, chunk_size: int) -> RecipeImportReport:
+    # Importado aqui para o --help não carregar SQLAlchemy/modelos
+    from petfit.api.settings import settings
+    from petfit.infra.database import dispose_engine, get_sessionmaker, init_engine
+    from petfit.infra.repositories.sqlalchemy.sqlalchemy_recipe_repository import (
+        SQLAlchemyRecipeRepository,
+    )
+
+    try:
+        init_engine(settings)
+        async with get_sessionmaker()() as session:
+            usecase = ImportRecipesUseCase(SQLAlchemyRecipeRepository(session))
+            return await usecase.execute(parse_recipe_rows(_file_chunks(path), fmt), chunk_size)
+    finally:
+        await dispose_engine()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Importa receitas de um arquivo NDJSON ou CSV.")
+    parser.add_argument("path", help="Arquivo de entrada")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="Formato (padrão: pela extensão)")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE, help="Receitas por transação")
+    args = parser.parse_args(argv)
+
+    if args.chunk_size < 1:
+        parser.error("chunk-size must be at least 1")
+    fmt = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+
+    report = asyncio.run(run(args.path, fmt, args.chunk_size))
+    print(json.dumps(
+        {
+            "total": report.total,
+            "imported": report.imported,
+            "failed": report.failed,
+            "errors": [{"row": e.row, "error": e.error} for e in report.errors],
+        },
+        ensure_ascii=False,
+        indent=2,
+    ))
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,24 @@
+from typing import Dict, List, Tuple
+
+# Máximo de IDs (somando adições e remoções) aceitos em uma sincronização
+MAX_FAVORITE_BATCH = 500
+
+# Resultado de cada ID em uma sincronização de favoritos
+ADDED = "added"
+ALREADY_FAVORITE = "already_favorite"
+REMOVED = "removed"
+NOT_FAVORITE = "not_favorite"
+NOT_FOUND = "not_found"
+
+
+class FavoriteBatchResult:
+    """Resultado por receita de uma sincronização em lote, na ordem em que os IDs vieram."""
+
+    def __init__(self):
+        self.outcomes: Dict[str, str] = {}
+
+    def set(self, recipe_id: str, outcome: str) -> None:
+        self.outcomes[recipe_id] = outcome
+
+    def items(self) -> List[Tuple[str, str]]:
+        return list(self.outcomes.items())
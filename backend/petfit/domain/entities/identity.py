@@ -0,0 +1,11 @@
+from petfit.domain.value_objects.email_vo import Email
+
+class Identity:
+    """Quem fez a requisição: o suficiente para autorizar e responder, sem a senha.
+    Pode vir só das claims assinadas do token (JWT_STATELESS_IDENTITY)."""
+
+    def __init__(self, id: str, name: str, email: Email, token_version: int = 0):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.token_version = token_version # Incrementado para revogar tokens emitidos
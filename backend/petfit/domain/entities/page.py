@@ -0,0 +1,18 @@
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Page(Generic[T]):
+    def __init__(self, items: List[T], next_cursor: Optional[str] = None):
+        self.items = items
+        self.next_cursor = next_cursor  # None quando não há próxima página
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index: int) -> T:
+        return self.items[index]
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List, Optional
 
 class Recipe:
@@ -5,9 +6,13 @@ class Recipe:
         self,
         id: str,
         title: str,
-        ingredients: str,       
-        instructions: str,       # <-- agora aceita lista
+        ingredients: List[str],
+        instructions: List[str],
         is_public: bool = True,
+        created_at: Optional[datetime] = None,
+        version: Optional[int] = None,
+        is_favorite: Optional[bool] = None,
+        favorite_count: Optional[int] = None,
     
     ):
         self.id = id
@@ -15,4 +20,9 @@ class Recipe:
         self.ingredients = ingredients
         self.instructions = instructions
         self.is_public = is_public
+        self.created_at = created_at
+        self.version = version
+        # Só preenchidos em leituras feitas por um usuário autenticado
+        self.is_favorite = is_favorite
+        self.favorite_count = favorite_count
 
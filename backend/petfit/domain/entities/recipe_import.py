@@ -0,0 +1,34 @@
+from typing import List, Optional
+
+from petfit.domain.entities.recipe import Recipe
+
+# Quantos erros o relatório guarda em detalhe; os demais entram só na contagem
+MAX_REPORTED_ERRORS = 1000
+
+
+class RecipeImportRow:
+    """Uma linha da entrada já validada: ou traz a receita, ou o motivo da rejeição."""
+
+    def __init__(self, row: int, recipe: Optional[Recipe] = None, error: Optional[str] = None):
+        self.row = row  # Número da linha/registro na entrada (1-based)
+        self.recipe = recipe
+        self.error = error
+
+
+class RecipeImportError:
+    def __init__(self, row: int, error: str):
+        self.row = row
+        self.error = error
+
+
+class RecipeImportReport:
+    def __init__(self):
+        self.total = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[RecipeImportError] = []
+
+    def add_error(self, row: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(RecipeImportError(row, error))
@@ -1,11 +1,10 @@
+from petfit.domain.entities.identity import Identity
 from petfit.domain.value_objects.email_vo import Email
 from petfit.domain.value_objects.password import Password
 
-class  User:
-    def __init__(self,id: str, name: str, email: Email, password: Password):
-        self.id = id
-        self.name = name
-        self.email = email
+class  User(Identity):
+    def __init__(self,id: str, name: str, email: Email, password: Password, token_version: int = 0):
+        super().__init__(id, name, email, token_version)
         self.password = password
 
 
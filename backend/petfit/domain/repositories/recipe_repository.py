@@ -1,52 +1,163 @@
 # petfit/domain/repositories/recipe_repository.py
 #oigit 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from petfit.domain.entities.page import Page
 from petfit.domain.entities.recipe import Recipe
-from petfit.domain.entities.user import User # Para tipagem nas operações de favoritos
+from petfit.domain.entities.identity import Identity # Para tipagem nas operações de favoritos
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.domain.value_objects.ingredient_filter import IngredientFilter
+
+# Ordenações aceitas na listagem pública ("-" indica ordem decrescente)
+RECIPE_SORT_FIELDS = ("-created_at", "created_at", "title", "-title")
+DEFAULT_RECIPE_SORT = "-created_at"
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 100
+
+# Linhas buscadas por ida ao banco no export em streaming
+EXPORT_BATCH_SIZE = 500
+
+# Receitas gravadas por transação na importação em massa
+IMPORT_CHUNK_SIZE = 1000
+
+# Contadores de favoritos: linhas de shard consolidadas por transação no rollup
+# (mantém fixo o número de linhas travadas) e máximo de lotes por execução
+ROLLUP_BATCH_SIZE = 500
+ROLLUP_MAX_BATCHES = 100
+
+# Busca textual: resultados ordenados por relevância
+SEARCH_SORT = "rank"
+MAX_SEARCH_QUERY_LENGTH = 200
+
+# Favoritos: mais recentemente favoritados primeiro
+FAVORITES_SORT = "-favorited_at"
 
 class RecipeRepository(ABC):
     @abstractmethod
     async def create(self, recipe: Recipe) -> Recipe:
-        """Cria uma nova receita."""
+        """Cria uma nova receita e incrementa a versão do catálogo na mesma transação."""
         pass
 
     @abstractmethod
-    async def get_by_id(self, recipe_id: str) -> Optional[Recipe]:
-        """Obtém uma receita pelo ID."""
+    async def bulk_create(self, recipes: List[Recipe]) -> int:
+        """Insere um lote de receitas em uma única transação. Retorna quantas foram gravadas.
+        Levanta ValueError se o lote for rejeitado pelo banco (nada do lote é gravado)."""
         pass
 
     @abstractmethod
-    async def get_all_public_recipes(self) -> Recipe:
-        """Obtém todas as receitas públicas."""
+    async def get_by_id(self, recipe_id: str, viewer_id: Optional[str] = None) -> Optional[Recipe]:
+        """Obtém uma receita pelo ID. Com `viewer_id`, preenche `is_favorite` (para esse
+        usuário) e `favorite_count` na mesma query."""
         pass
 
     @abstractmethod
-    async def add_favorite(self, user: User, recipe: Recipe) -> bool:
-        """Adiciona uma receita aos favoritos de um usuário. Retorna True se adicionado com sucesso."""
+    async def get_all_public_recipes(
+        self,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        after: Optional[Cursor] = None,
+        sort: str = DEFAULT_RECIPE_SORT,
+        ingredients: Optional[IngredientFilter] = None,
+        viewer_id: Optional[str] = None,
+    ) -> Page[Recipe]:
+        """Obtém uma página de receitas públicas, continuando a partir do cursor `after`,
+        opcionalmente filtradas por ingredientes. Com `viewer_id`, cada receita vem com
+        `is_favorite` e `favorite_count` calculados na mesma query."""
         pass
 
     @abstractmethod
-    async def remove_favorite(self, user: User, recipe: Recipe) -> bool:
-        """Remove uma receita dos favoritos de um usuário. Retorna True se removido com sucesso."""
+    def stream_public_recipes(self, batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[Recipe]:
+        """Itera sobre todas as receitas públicas (ordenadas por ID) sem carregá-las
+        todas em memória, buscando `batch_size` linhas por vez."""
         pass
 
     @abstractmethod
-    async def get_user_favorite_recipes(self, user: User) -> List[Recipe]:
-        """Obtém todas as receitas favoritas de um usuário."""
+    async def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        after: Optional[Cursor] = None,
+    ) -> Page[Recipe]:
+        """Busca receitas públicas por texto, das mais às menos relevantes."""
         pass
 
     @abstractmethod
-    async def is_favorite(self, user: User, recipe: Recipe) -> bool:
+    async def get_popular_recipes(self, limit: int = DEFAULT_PAGE_LIMIT) -> List[Recipe]:
+        """Obtém as receitas públicas mais favoritadas, com `favorite_count` preenchido.
+        A contagem é a do último rollup (ver `rollup_favorite_counts`)."""
+        pass
+
+    @abstractmethod
+    async def rollup_favorite_counts(self, limit: int = ROLLUP_BATCH_SIZE) -> Tuple[int, int]:
+        """Consolida em `favorite_count` até `limit` linhas de deltas pendentes, em uma transação.
+        Retorna (linhas de shard consumidas, receitas atualizadas); menos de `limit` linhas
+        consumidas indica que não havia mais pendências livres."""
+        pass
+
+    @abstractmethod
+    async def add_favorite(self, user: Identity, recipe_id: str) -> bool:
+        """Adiciona uma receita aos favoritos de um usuário.
+        Retorna True se adicionado, False se já era favorito. Levanta ValueError se a receita não existe."""
+        pass
+
+    @abstractmethod
+    async def remove_favorite(self, user: Identity, recipe_id: str) -> bool:
+        """Remove uma receita dos favoritos de um usuário. Retorna True se removido, False se não era favorito."""
+        pass
+
+    @abstractmethod
+    async def update_favorites(
+        self, user: Identity, add: List[str], remove: List[str]
+    ) -> Tuple[Dict[str, bool], List[str]]:
+        """Adiciona e remove várias receitas dos favoritos em uma única transação
+        (um INSERT e um DELETE): se qualquer parte falhar, nada é aplicado.
+        Retorna, para cada receita existente em `add`, True se foi adicionada agora e False
+        se já era favorita (IDs ausentes não existem), e os IDs de `remove` efetivamente
+        removidos. Levanta ValueError se o usuário não existe."""
+        pass
+
+    @abstractmethod
+    async def get_user_favorite_recipes(
+        self,
+        user: Identity,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        after: Optional[Cursor] = None,
+    ) -> Page[Recipe]:
+        """Obtém uma página das receitas favoritas de um usuário, das favoritadas mais recentemente às mais antigas."""
+        pass
+
+    @abstractmethod
+    async def get_user_favorite_ids(self, user: Identity) -> List[str]:
+        """Obtém só os IDs das receitas favoritas de um usuário, em ordem estável."""
+        pass
+
+    @abstractmethod
+    async def is_favorite(self, user: Identity, recipe_id: str) -> bool:
         """Verifica se uma receita é favorita de um usuário."""
         pass
 
     @abstractmethod
     async def update(self, recipe: Recipe) -> Optional[Recipe]:
-        """Atualiza uma receita existente."""
+        """Atualiza uma receita existente e, se ela existe, incrementa a versão do catálogo na mesma transação."""
         pass
 
     @abstractmethod
     async def delete(self, recipe_id: str) -> bool:
-        """Deleta uma receita pelo ID. Retorna True se deletado com sucesso."""
-        pass
\ No newline at end of file
+        """Deleta uma receita pelo ID, incrementando a versão do catálogo na mesma transação.
+        Retorna True se deletado com sucesso."""
+        pass
+
+    @abstractmethod
+    async def get_version(self, recipe_id: str) -> Optional[int]:
+        """Obtém apenas a versão de uma receita (None se não existe), sem carregá-la."""
+        pass
+
+    @abstractmethod
+    async def get_catalog_version(self) -> int:
+        """Obtém a versão atual do catálogo de receitas."""
+        pass
+
+    @abstractmethod
+    async def bump_catalog_version(self) -> int:
+        """Incrementa a versão do catálogo em uma transação própria (ex.: ao fim de uma
+        importação em lotes). Retorna a nova versão."""
+        pass
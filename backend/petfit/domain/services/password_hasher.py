@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from petfit.domain.value_objects.password import Password
+
+
+class PasswordHasher(ABC):
+    """Gera e verifica hashes de senha sem bloquear o event loop."""
+
+    @abstractmethod
+    async def hash(self, plain_password: str) -> Password:
+        """Valida a senha em texto claro e retorna o Password já hasheado."""
+        pass
+
+    @abstractmethod
+    async def verify(self, password: Password, plain_password: str) -> bool:
+        """Verifica uma senha em texto claro contra o hash armazenado."""
+        pass
+
+    @abstractmethod
+    async def rehash(self, plain_password: str) -> Password:
+        """Gera um novo hash para uma senha já verificada, sem revalidar a política."""
+        pass
+
+    @abstractmethod
+    def needs_rehash(self, password: Password) -> bool:
+        """Indica se o hash armazenado usa um custo diferente do configurado."""
+        pass
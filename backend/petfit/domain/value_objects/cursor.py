@@ -0,0 +1,41 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+
+class Cursor:
+    """
+    Cursor opaco para paginação por keyset.
+
+    Guarda a ordenação usada, o valor da chave de ordenação e o ID do último
+    item entregue. O cliente recebe apenas a string codificada.
+    """
+
+    def __init__(self, sort: str, value: Any, id: str):
+        self.sort = sort
+        self.value = value
+        self.id = id
+
+    def encode(self) -> str:
+        raw = json.dumps([self.sort, self.value, self.id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            sort, value, id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        except (binascii.Error, UnicodeError, ValueError, TypeError):
+            raise ValueError("Invalid pagination cursor.")
+        if not isinstance(sort, str) or not isinstance(id, str):
+            raise ValueError("Invalid pagination cursor.")
+        return cls(sort=sort, value=value, id=id)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Cursor):
+            return (self.sort, self.value, self.id) == (other.sort, other.value, other.id)
+        return NotImplemented
+
+    def __str__(self) -> str:
+        return self.encode()
@@ -0,0 +1,53 @@
+from typing import Iterable, Optional, Tuple
+
+# Limite de termos por critério, para manter as consultas previsíveis
+MAX_INGREDIENT_TERMS = 20
+
+
+def _normalize(values: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Remove espaços e vazios e deduplica, preservando a ordem."""
+    seen = []
+    for value in values or ():
+        value = value.strip()
+        if value and value not in seen:
+            seen.append(value)
+    if len(seen) > MAX_INGREDIENT_TERMS:
+        raise ValueError(f"At most {MAX_INGREDIENT_TERMS} ingredients per filter.")
+    return tuple(seen)
+
+
+class IngredientFilter:
+    """
+    Filtro da listagem por ingredientes, comparados exatamente como gravados.
+
+    - `all_of`: a receita contém todos (`@>`)
+    - `any_of`: a receita contém pelo menos um (`&&`)
+    - `none_of`: a receita não contém nenhum (`NOT &&`)
+    """
+
+    def __init__(
+        self,
+        all_of: Optional[Iterable[str]] = None,
+        any_of: Optional[Iterable[str]] = None,
+        none_of: Optional[Iterable[str]] = None,
+    ):
+        self.all_of = _normalize(all_of)
+        self.any_of = _normalize(any_of)
+        self.none_of = _normalize(none_of)
+        if set(self.all_of) & set(self.none_of):
+            raise ValueError("An ingredient cannot be both required and excluded.")
+
+    def is_empty(self) -> bool:
+        return not (self.all_of or self.any_of or self.none_of)
+
+    def cache_key(self) -> str:
+        """Representação estável, usada para compor ETags."""
+        return repr((sorted(self.all_of), sorted(self.any_of), sorted(self.none_of)))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, IngredientFilter):
+            return self.cache_key() == other.cache_key()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.cache_key())
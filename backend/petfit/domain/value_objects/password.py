@@ -1,37 +1,66 @@
 import bcrypt # Você precisará instalar `pip install bcrypt`
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
-from typing import Self
+from typing import Optional, Self
 
 class PasswordValidationError(Exception):
     pass
 
+
+# Custo padrão do bcrypt (2^12 iterações); ajuste com `python -m petfit.cli.calibrate_bcrypt`
+DEFAULT_BCRYPT_ROUNDS = 12
+
+
+# Funções de módulo (e não métodos) para poderem ser enviadas a um
+# ThreadPoolExecutor/ProcessPoolExecutor pelo serviço de hashing assíncrono.
+def hash_password(password: str, rounds: int = DEFAULT_BCRYPT_ROUNDS) -> str:
+    hashed_bytes = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds))
+    return hashed_bytes.decode('utf-8')
+
+
+def check_password(plain_password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
 class Password:
     def __init__(self, value: str, hashed: bool = False):
         if not hashed:
-            if not self._is_valid(value):
-                raise ValueError("Password must be at least 8 characters and contain letters and numbers.")
+            self.validate(value)
             self._value = self._hash_password(value) # Armazenar o hash
         else:
             self._value = value # Já é um hash
 
-    def _is_valid(self, password: str) -> bool:
+    @classmethod
+    def validate(cls, password: str) -> str:
+        """Valida a senha em texto claro sem gerar o hash (que é caro)."""
+        if not cls._is_valid(password):
+            raise ValueError("Password must be at least 8 characters and contain letters and numbers.")
+        return password
+
+    @staticmethod
+    def _is_valid(password: str) -> bool:
         # Estas validações são para a senha em TEXTO CLARO antes de hash
         return len(password) >= 8 and any(c.isalpha() for c in password) and any(c.isdigit() for c in password)
 
     def _hash_password(self, password: str) -> str:
         # Hashear a senha
-        hashed_bytes = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-        return hashed_bytes.decode('utf-8')
+        return hash_password(password)
 
     def verify(self, plain_password: str) -> bool:
         # Verificar uma senha em texto claro contra o hash armazenado
-        return bcrypt.checkpw(plain_password.encode('utf-8'), self._value.encode('utf-8'))
+        return check_password(plain_password, self._value)
 
     def hashed_value(self) -> str:
         # Método para obter o valor hash para armazenamento
         return self._value
 
+    def rounds(self) -> Optional[int]:
+        # Custo gravado no hash bcrypt: $2b$<rounds>$<salt+hash>
+        parts = self._value.split("$")
+        if len(parts) < 4 or not parts[2].isdigit():
+            return None
+        return int(parts[2])
+
     def __eq__(self, other) -> bool:
         # Comparar senhas (talvez com outro objeto Password ou string hash)
         if isinstance(other, Password):
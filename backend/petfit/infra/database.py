@@ -1,15 +1,132 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.engine import URL
-import os
 
-DATABASE_URL = os.getenv("DATABASE_URL")
+from petfit.infra.settings import DatabaseSettings
+from petfit.infra.pool import InstrumentedAsyncAdaptedQueuePool, pgbouncer_statement_name
+
+Base = declarative_base()
+
+# Sem bind na importação: o engine é criado em init_engine (lifespan da API ou CLI)
+async_session = async_sessionmaker(expire_on_commit=False, class_=AsyncSession)
+# Sessões só de leitura: ligadas à réplica quando configurada, senão ao primário
+async_read_session = async_sessionmaker(expire_on_commit=False, class_=AsyncSession)
+
+_engine: Optional[AsyncEngine] = None
+_read_engine: Optional[AsyncEngine] = None
+
+
+def engine_options(config: DatabaseSettings) -> Dict[str, Any]:
+    """Opções do create_async_engine a partir das configurações DB_*."""
+    # O adaptador asyncpg do SQLAlchemy prepara os statements ele mesmo e os guarda
+    # no próprio LRU (prepared_statement_cache_size); o statement_cache_size do
+    # asyncpg não é usado nesse caminho
+    connect_args: Dict[str, Any] = {"prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE}
+    if config.DB_PGBOUNCER:
+        # O PgBouncer não mantém prepared statements entre transações
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": pgbouncer_statement_name,
+        }
+    return {
+        "echo": config.DB_ECHO,
+        "poolclass": InstrumentedAsyncAdaptedQueuePool,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+
+def init_engine(
+    config: DatabaseSettings, url: Optional[str] = None, read_url: Optional[str] = None
+) -> AsyncEngine:
+    """Cria os engines (uma vez por processo) e liga as fábricas de sessão a eles.
+    A configuração vem de quem inicializa (lifespan da API ou CLI)."""
+    global _engine, _read_engine
+    if _engine is None:
+        url = url or config.DATABASE_URL
+        if not url:
+            raise ValueError("DATABASE_URL must be set")
+        _engine = create_async_engine(url, **engine_options(config))
+        async_session.configure(bind=_engine)
+
+        read_url = read_url or config.DATABASE_READ_URL
+        if read_url:
+            _read_engine = create_async_engine(read_url, **engine_options(config))
+        async_read_session.configure(bind=_read_engine or _engine)
+    return _engine
+
+
+def current_engine() -> Optional[AsyncEngine]:
+    """Engine já criado, sem criar um novo (para health checks)."""
+    return _engine
+
+
+def current_read_engine() -> Optional[AsyncEngine]:
+    """Engine da réplica, se configurada."""
+    return _read_engine
+
+
+def _require_engine() -> None:
+    if _engine is None:
+        raise RuntimeError("Database engine is not initialized; call init_engine first.")
+
+
+def get_sessionmaker() -> async_sessionmaker:
+    _require_engine()
+    return async_session
+
+
+def get_read_sessionmaker() -> async_sessionmaker:
+    _require_engine()
+    return async_read_session
+
+
+async def dispose_engine() -> None:
+    global _engine, _read_engine
+    if _read_engine is not None:
+        await _read_engine.dispose()
+        _read_engine = None
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+    async_session.configure(bind=None)
+    async_read_session.configure(bind=None)
 
-if DATABASE_URL is None:
-    raise ValueError("DATABASE_URL must be set")
 
-engine = create_async_engine(DATABASE_URL, echo=True)
+async def ping(engine: AsyncEngine) -> None:
+    """Sonda de prontidão: uma ida ao banco com SELECT 1."""
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("SELECT 1")
 
-async_session = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
-Base = declarative_base()
\ No newline at end of file
+async def warm_up(engine: AsyncEngine, connections: int) -> int:
+    """
+    Abre `connections` conexões ao mesmo tempo e as devolve ao pool, para que
+    as primeiras requisições não paguem o handshake. Retorna quantas abriu.
+    """
+    # Só pools com tamanho fixo (QueuePool) guardam conexões; NullPool e
+    # StaticPool não têm size() e não há o que aquecer
+    size = getattr(engine.pool, "size", None)
+    capacity = size() if callable(size) else 0
+    connections = max(0, min(connections, capacity))
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(connections)), return_exceptions=True
+    )
+    opened = [conn for conn in results if isinstance(conn, AsyncConnection)]
+    try:
+        # Se alguma conexão falhou, as que abriram voltam ao pool antes do erro subir
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        await asyncio.gather(*(conn.exec_driver_sql("SELECT 1") for conn in opened))
+    finally:
+        for conn in opened:
+            await conn.close()
+    return len(opened)
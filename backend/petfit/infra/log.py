@@ -0,0 +1,146 @@
+"""
+Logging do petfit: níveis, saída JSON e escrita fora do event loop.
+
+Os registros vão para uma fila (QueueHandler) e uma thread de fundo
+(QueueListener) faz a formatação JSON e a escrita no stdout, então o caminho
+da requisição só paga o enfileiramento. Linhas de DEBUG são amostradas por
+requisição: ou a requisição inteira loga em debug, ou nada dela loga.
+"""
+
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, Tuple
+
+LOGGER_NAME = "petfit"
+# Fila limitada: sob rajada, descarta em vez de crescer a memória sem fim
+LOG_QUEUE_SIZE = 10000
+
+# Atributos padrão do LogRecord; o resto veio de `extra=` e vai para o JSON
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "request_id"}
+
+_request_id: ContextVar[Optional[str]] = ContextVar("petfit_request_id", default=None)
+_debug_sampled: ContextVar[bool] = ContextVar("petfit_debug_sampled", default=True)
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional["DroppingQueueHandler"] = None
+
+
+def get_logger(name: str = "") -> logging.Logger:
+    """Logger filho de "petfit" (ex.: get_logger("api.deps"))."""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
+
+
+def begin_request(sample_rate: float, request_id: Optional[str] = None) -> Tuple[Any, Any]:
+    """Marca o início de uma requisição: define o ID e sorteia se ela loga DEBUG."""
+    id_token = _request_id.set(request_id or uuid.uuid4().hex)
+    sampled_token = _debug_sampled.set(sample_rate >= 1.0 or random.random() < sample_rate)
+    return id_token, sampled_token
+
+
+def end_request(tokens: Tuple[Any, Any]) -> None:
+    id_token, sampled_token = tokens
+    _request_id.reset(id_token)
+    _debug_sampled.reset(sampled_token)
+
+
+def current_request_id() -> Optional[str]:
+    return _request_id.get()
+
+
+class RequestContextFilter(logging.Filter):
+    """Descarta DEBUG de requisições não sorteadas e anexa o request_id."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno <= logging.DEBUG and not _debug_sampled.get():
+            return False
+        record.request_id = _request_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            data["request_id"] = request_id
+        for key, value in vars(record).items():
+            if key not in _RESERVED and not key.startswith("_"):
+                data[key] = value
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data, default=str, ensure_ascii=False)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler que descarta (e conta) registros quando a fila está cheia."""
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve a mensagem e o traceback aqui (args podem mudar depois), mas
+        # deixa a formatação JSON para a thread do listener
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(level: str = "INFO", json_output: bool = True) -> None:
+    """Liga o logger "petfit" à fila e inicia a thread de escrita (idempotente)."""
+    global _listener, _queue_handler
+    shutdown_logging()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        JsonFormatter() if json_output else logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+    )
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(LOG_QUEUE_SIZE)
+    _queue_handler = DroppingQueueHandler(log_queue)
+    _queue_handler.addFilter(RequestContextFilter())
+
+    logger = get_logger()
+    logger.setLevel(level.upper())
+    logger.addHandler(_queue_handler)
+    logger.propagate = False
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Para a thread de escrita, esvaziando a fila antes."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _queue_handler is not None:
+        get_logger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+
+def dropped_records() -> int:
+    return _queue_handler.dropped if _queue_handler is not None else 0
@@ -0,0 +1,281 @@
+"""
+Métricas em memória do processo, exportadas no formato texto do Prometheus.
+
+Implementação própria e enxuta (contador, gauge e histograma com rótulos) para
+não acrescentar dependência. Como o cache de usuários, não é thread-safe: é
+atualizada de dentro do event loop (e dos greenlets do SQLAlchemy, que rodam
+na mesma thread).
+"""
+
+import math
+import re
+import time
+from collections import Counter as _ShapeCounter
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LabelValues = Tuple[str, ...]
+
+# Latências em segundos
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Queries por requisição
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type_name}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}")
+        return lines
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels: str, value: float) -> None:
+        self._values[labels] = value
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Por conjunto de rótulos: contagem por faixa (não cumulativa), soma e total
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, *labels: str, value: float) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = ([0] * (len(self.buckets) + 1), [0.0, 0.0])
+            self._series[labels] = series
+        counts, totals = series
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+                break
+        else:
+            counts[-1] += 1
+        totals[0] += value
+        totals[1] += 1
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return int(series[1][1]) if series else 0
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for labels, (counts, (total, count)) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}"
+                )
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {_format_value(count)}")
+        return lines
+
+    def clear(self) -> None:
+        self._series.clear()
+
+
+# Coletor: devolve (nome, ajuda, tipo, [(rótulos, valor)]) calculados na hora do scrape
+Collector = Callable[[], Iterable[Tuple[str, str, str, Iterable[Tuple[Dict[str, str], float]]]]]
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Collector] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labels))  # type: ignore[return-value]
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help, labels))  # type: ignore[return-value]
+
+    def histogram(
+        self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, help, labels, buckets))  # type: ignore[return-value]
+
+    def add_collector(self, collector: Collector) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for name, help, type_name, samples in collector():
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {type_name}")
+                for labels, value in samples:
+                    label_text = _format_labels(list(labels), list(labels.values()))
+                    lines.append(f"{name}{label_text} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        for metric in self._metrics:
+            metric.clear()
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "petfit_http_requests_total", "Requisições HTTP atendidas.", ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "petfit_http_request_duration_seconds", "Latência das requisições HTTP.", ("method", "route")
+)
+http_requests_in_flight = registry.gauge(
+    "petfit_http_requests_in_flight", "Requisições HTTP em andamento."
+)
+db_queries_per_request = registry.histogram(
+    "petfit_db_queries_per_request", "Statements SQL executados por requisição.",
+    ("method", "route"), buckets=QUERY_COUNT_BUCKETS,
+)
+db_time_per_request_seconds = registry.histogram(
+    "petfit_db_time_per_request_seconds", "Tempo gasto no banco por requisição.", ("method", "route")
+)
+db_query_budget_exceeded_total = registry.counter(
+    "petfit_db_query_budget_exceeded_total", "Requisições acima do orçamento de queries.", ("method", "route")
+)
+db_n_plus_one_total = registry.counter(
+    "petfit_db_n_plus_one_total", "Requisições com statement repetido (provável N+1).", ("method", "route")
+)
+
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\$\d+|%\(\w+\)s|\?|\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,)*\s*\?\s*\)", re.IGNORECASE)
+_SPACES = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """SQL sem literais/parâmetros: statements com o mesmo formato viram a mesma chave."""
+    shape = _LITERALS.sub("?", statement)
+    shape = _IN_LIST.sub("IN (?)", shape)
+    return _SPACES.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """Statements e tempo de banco acumulados durante uma requisição."""
+
+    def __init__(self, track_shapes: bool = False):
+        self.count = 0
+        self.seconds = 0.0
+        # Contagem por formato de statement; só mantida quando há quem a use (N+1)
+        self.shapes: Optional[_ShapeCounter] = _ShapeCounter() if track_shapes else None
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        if self.shapes is not None:
+            self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> Dict[str, int]:
+        """Formatos executados `threshold` vezes ou mais: candidatos a N+1."""
+        if self.shapes is None or threshold < 1:
+            return {}
+        return {shape: count for shape, count in self.shapes.items() if count >= threshold}
+
+
+# Estatísticas da requisição corrente. O SQLAlchemy propaga o contexto para
+# os greenlets onde os eventos de cursor rodam, então os hooks enxergam a variável.
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("petfit_query_stats", default=None)
+
+_START_KEY = "petfit_query_start"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+
+def install_query_hooks() -> None:
+    """Registra os hooks de cursor em todos os engines (idempotente)."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,13 @@
+# petfit/infra/models/catalog_version_model.py
+from __future__ import annotations
+import sqlalchemy as sa
+from petfit.infra.database import Base
+
+# Contadores de versão por catálogo (ex.: "recipes"), usados para ETags.
+# Lidos/escritos via Core, sem materializar entidades do ORM.
+catalog_versions_table = sa.Table(
+    "catalog_versions",
+    Base.metadata,
+    sa.Column("name", sa.String, primary_key=True),
+    sa.Column("version", sa.BigInteger, nullable=False, server_default="0"),
+)
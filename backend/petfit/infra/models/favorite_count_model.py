@@ -0,0 +1,49 @@
+# petfit/infra/models/favorite_count_model.py
+from __future__ import annotations
+import sqlalchemy as sa
+from petfit.infra.database import Base
+from petfit.infra.models.recipe_user_model import user_favorite_recipes_table
+
+# Linhas de contador por receita. Cada favoritar/desfavoritar soma em uma delas,
+# sorteada, em vez de atualizar recipes.favorite_count: receitas virais não
+# viram uma linha quente disputada por todos os writers.
+FAVORITE_COUNT_SHARDS = 16
+
+# Deltas ainda não consolidados em recipes.favorite_count. Sem FK para recipes:
+# o ON DELETE CASCADE dos favoritos dispara o trigger depois que a receita já
+# saiu, e o rollup simplesmente descarta deltas de receitas que não existem mais.
+favorite_count_shards_table = sa.Table(
+    "recipe_favorite_count_shards",
+    Base.metadata,
+    sa.Column("recipe_id", sa.String, primary_key=True),
+    sa.Column("shard", sa.SmallInteger, primary_key=True),
+    sa.Column("delta", sa.BigInteger, nullable=False, server_default="0"),
+)
+
+# Trigger por statement com transition table: um lote de favoritos vira um
+# único upsert agrupado por receita (ordenado, para não gerar deadlocks).
+FAVORITE_COUNT_FUNCTION_DDL = sa.DDL(
+    "CREATE OR REPLACE FUNCTION petfit_count_favorites() RETURNS trigger "
+    "LANGUAGE plpgsql AS $$ BEGIN "
+    "INSERT INTO recipe_favorite_count_shards (recipe_id, shard, delta) "
+    "SELECT recipe_id, floor(random() * " + str(FAVORITE_COUNT_SHARDS) + ")::smallint, "
+    "CASE WHEN TG_OP = 'INSERT' THEN count(*) ELSE -count(*) END "
+    "FROM changed GROUP BY recipe_id ORDER BY recipe_id "
+    "ON CONFLICT (recipe_id, shard) DO UPDATE "
+    "SET delta = recipe_favorite_count_shards.delta + EXCLUDED.delta; "
+    "RETURN NULL; END $$"
+)
+FAVORITE_COUNT_INSERT_TRIGGER_DDL = sa.DDL(
+    "CREATE TRIGGER trg_user_favorite_recipes_count_insert "
+    "AFTER INSERT ON user_favorite_recipes REFERENCING NEW TABLE AS changed "
+    "FOR EACH STATEMENT EXECUTE FUNCTION petfit_count_favorites()"
+)
+FAVORITE_COUNT_DELETE_TRIGGER_DDL = sa.DDL(
+    "CREATE TRIGGER trg_user_favorite_recipes_count_delete "
+    "AFTER DELETE ON user_favorite_recipes REFERENCING OLD TABLE AS changed "
+    "FOR EACH STATEMENT EXECUTE FUNCTION petfit_count_favorites()"
+)
+
+# Garante função e triggers quando as tabelas são criadas via metadata (testes)
+for _ddl in (FAVORITE_COUNT_FUNCTION_DDL, FAVORITE_COUNT_INSERT_TRIGGER_DDL, FAVORITE_COUNT_DELETE_TRIGGER_DDL):
+    sa.event.listen(user_favorite_recipes_table, "after_create", _ddl)
@@ -1,31 +1,94 @@
 # petfit/infra/models/recipe_model.py
 from __future__ import annotations
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from petfit.infra.database import Base
 from petfit.domain.entities.recipe import Recipe
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, List, Optional
 from petfit.infra.models.recipe_user_model import user_favorite_recipes_table # <--- ADICIONE ESTA LINHA
+from petfit.infra.models.catalog_version_model import catalog_versions_table
+from petfit.infra.models.favorite_count_model import favorite_count_shards_table
 from petfit.infra.models.user_model import UserModel
 
+# Configuração de texto usada tanto na coluna gerada quanto nas consultas.
+# Vai como literal (não como parâmetro) para o planner casar a expressão com o índice.
+SEARCH_CONFIG: sa.ColumnElement[Any] = sa.literal_column("'portuguese'::regconfig")
+
+# array_to_string é só STABLE e colunas geradas exigem funções IMMUTABLE;
+# o wrapper abaixo é seguro porque a conversão de text[] não depende de sessão.
+ARRAY_TO_TEXT_DDL = sa.DDL(
+    "CREATE OR REPLACE FUNCTION petfit_array_to_text(text[]) RETURNS text "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$ SELECT array_to_string($1, ' ') $$"
+)
+
+# Título pesa mais que ingredientes, que pesam mais que o modo de preparo
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('portuguese'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('portuguese'::regconfig, petfit_array_to_text(ingredients::text[])), 'B') || "
+    "setweight(to_tsvector('portuguese'::regconfig, petfit_array_to_text(instructions::text[])), 'C')"
+)
+
 
 class RecipeModel(Base):
     __tablename__ = "recipes"
+    __table_args__ = (
+        # Índices parciais usados pela paginação por keyset da listagem pública
+        sa.Index(
+            "ix_recipes_public_created_at_id", "created_at", "id",
+            postgresql_where=sa.text("is_public"),
+        ),
+        sa.Index(
+            "ix_recipes_public_title_id", "title", "id",
+            postgresql_where=sa.text("is_public"),
+        ),
+        # Filtros por ingrediente (@>, &&)
+        sa.Index(
+            "ix_recipes_ingredients", "ingredients",
+            postgresql_using="gin",
+        ),
+        # Ranking de populares: lido do fim do índice (favorite_count DESC, id DESC)
+        sa.Index(
+            "ix_recipes_public_favorite_count_id", "favorite_count", "id",
+            postgresql_where=sa.text("is_public"),
+        ),
+        # Busca textual: GIN sobre o tsvector gerado
+        sa.Index(
+            "ix_recipes_search_vector", "search_vector",
+            postgresql_using="gin",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         sa.String, primary_key=True, default=lambda: str(uuid.uuid4())
     )
     title: Mapped[str] = mapped_column(sa.String, nullable=False)
-    ingredients: Mapped[List[str]] = mapped_column(sa.ARRAY(sa.String), nullable=False)
-    instructions: Mapped[List[str]] = mapped_column(sa.ARRAY(sa.String), nullable=False)
+    ingredients: Mapped[List[str]] = mapped_column(ARRAY(sa.String), nullable=False)
+    instructions: Mapped[List[str]] = mapped_column(ARRAY(sa.String), nullable=False)
     is_public: Mapped[bool] = mapped_column(sa.Boolean, default=True)
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+    )
+    # Incrementada a cada UPDATE; compõe o ETag do detalhe da receita
+    version: Mapped[int] = mapped_column(sa.Integer, nullable=False, server_default="1")
+    # Total de favoritos até o último rollup; os deltas recentes ficam em
+    # recipe_favorite_count_shards até serem consolidados
+    favorite_count: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, server_default="0")
+    # Mantida pelo banco (GENERATED ALWAYS ... STORED); deferred para não trafegar nas leituras comuns
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, sa.Computed(SEARCH_VECTOR_SQL, persisted=True), deferred=True
+    )
 
     favorite_of_users: Mapped[List["UserModel"]] = relationship(
         "UserModel",
         secondary=user_favorite_recipes_table,
         back_populates="favorite_recipes",
-        lazy="selectin"
+        # Não carrega nada por padrão: quem precisar da relação pede explicitamente
+        # (selectinload/join). passive_deletes deixa o ON DELETE CASCADE com o banco.
+        lazy="raise",
+        passive_deletes=True,
     )
 
     @classmethod
@@ -45,4 +108,10 @@ class RecipeModel(Base):
             ingredients=self.ingredients,
             instructions=self.instructions,
             is_public=self.is_public,
-        )
\ No newline at end of file
+            created_at=self.created_at,
+            version=self.version,
+        )
+
+
+# Garante a função da coluna gerada quando as tabelas são criadas via metadata (testes)
+sa.event.listen(RecipeModel.__table__, "before_create", ARRAY_TO_TEXT_DDL)
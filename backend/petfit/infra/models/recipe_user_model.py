@@ -3,10 +3,19 @@ from __future__ import annotations
 import sqlalchemy as sa
 from petfit.infra.database import Base # Certifique-se de importar Base aqui
 
+# Nomes das FKs (os mesmos das migrations), usados para saber qual delas falhou
+FAVORITES_USER_FK = "user_favorite_recipes_user_id_fkey"
+FAVORITES_RECIPE_FK = "user_favorite_recipes_recipe_id_fkey"
+
 # Tabela de associação para o relacionamento muitos-para-muitos (usuário favorito receitas)
 user_favorite_recipes_table = sa.Table(
     "user_favorite_recipes",
     Base.metadata,
-    sa.Column("user_id", sa.String, sa.ForeignKey("users.id"), primary_key=True),
-    sa.Column("recipe_id", sa.String, sa.ForeignKey("recipes.id"), primary_key=True)
+    sa.Column("user_id", sa.String, sa.ForeignKey("users.id", ondelete="CASCADE", name=FAVORITES_USER_FK), primary_key=True),
+    sa.Column("recipe_id", sa.String, sa.ForeignKey("recipes.id", ondelete="CASCADE", name=FAVORITES_RECIPE_FK), primary_key=True),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    # Paginação "favoritados mais recentes primeiro" por keyset (created_at, recipe_id)
+    sa.Index("ix_user_favorite_recipes_user_id_created_at", "user_id", "created_at", "recipe_id"),
+    # Índice reverso: a PK começa por user_id e não serve para buscas por receita
+    sa.Index("ix_user_favorite_recipes_recipe_id", "recipe_id"),
 )
\ No newline at end of file
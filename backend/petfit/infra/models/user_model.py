@@ -22,12 +22,18 @@ class UserModel(Base):
     name: Mapped[str] = mapped_column(sa.String, nullable=False)
     email: Mapped[str] = mapped_column(sa.String, unique=True, nullable=False)
     password: Mapped[str] = mapped_column(sa.String, nullable=False) 
+    token_version: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, default=0, server_default="0"
+    )
 
     favorite_recipes: Mapped[List["RecipeModel"]] = relationship(
         "RecipeModel",
         secondary=user_favorite_recipes_table,
         back_populates="favorite_of_users",
-        lazy="selectin"
+        # Não carrega nada por padrão: quem precisar da relação pede explicitamente
+        # (selectinload/join). passive_deletes deixa o ON DELETE CASCADE com o banco.
+        lazy="raise",
+        passive_deletes=True,
     )
     
     @classmethod
@@ -37,6 +43,7 @@ class UserModel(Base):
             name=entity.name,
             email=str(entity.email),
             password=entity.password.hashed_value(),
+            token_version=entity.token_version,
         )
 
     def to_entity(self) -> User:
@@ -45,4 +52,5 @@ class UserModel(Base):
             name=self.name,
             email=Email(self.email),
             password=Password(self.password, hashed=True),
+            token_version=self.token_version,
         )
\ No newline at end of file
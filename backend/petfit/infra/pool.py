@@ -0,0 +1,87 @@
+import time
+import uuid
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+# Recebe o tempo (em segundos) que cada checkout levou
+CheckoutListener = Callable[[float], None]
+
+
+class PoolMetrics:
+    """
+    Métricas acumuladas de checkout do pool de conexões.
+
+    `subscribe` é o gancho de instrumentação: cada checkout chama os ouvintes
+    com o tempo de espera, para exportar para o sistema de métricas que for.
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._listeners: List[CheckoutListener] = []
+
+    def subscribe(self, listener: CheckoutListener) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: CheckoutListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+        for listener in self._listeners:
+            listener(wait_seconds)
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        """Estado atual do pool (em uso, overflow...) junto com os acumulados."""
+        stats: Dict[str, Any] = {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+        }
+        # Pools sem fila (NullPool/StaticPool) não expõem esses contadores
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, name, None)
+            if callable(method):
+                stats[name] = method()
+        stats["in_use"] = stats.get("checkedout", 0)
+        return stats
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Pool padrão do engine assíncrono, medindo quanto cada checkout espera."""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            pool_metrics.record_timeout()
+            raise
+        pool_metrics.record_checkout(time.perf_counter() - start)
+        return connection
+
+
+def pgbouncer_statement_name() -> str:
+    # Nomes únicos evitam colisão de prepared statements entre conexões
+    # de servidor diferentes atrás do PgBouncer em modo transaction
+    return f"__asyncpg_{uuid.uuid4()}__"
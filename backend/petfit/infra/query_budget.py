@@ -0,0 +1,92 @@
+"""
+Orçamento de queries por requisição e detecção de N+1.
+
+Usado de dois jeitos:
+- em testes, com `query_budget(engine, max_queries=..., max_repeats=...)`,
+  que conta os statements do engine no bloco e falha se o orçamento estourar;
+- em produção (opcional), pelo MetricsMiddleware via `report_query_budget`,
+  que só loga e conta em métricas, sem interromper a requisição.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from petfit.infra.log import get_logger
+from petfit.infra.metrics import QueryStats, db_n_plus_one_total, db_query_budget_exceeded_total
+
+logger = get_logger("db.budget")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Bloco executou mais queries que o orçamento ou repetiu um statement (N+1)."""
+
+
+def budget_violations(
+    stats: QueryStats,
+    max_queries: Optional[int] = None,
+    max_repeats: Optional[int] = None,
+) -> list:
+    """Lista as violações (texto) do orçamento; vazia se está tudo dentro."""
+    problems = []
+    if max_queries is not None and stats.count > max_queries:
+        problems.append(f"{stats.count} queries (budget: {max_queries})")
+    if max_repeats is not None:
+        for shape, count in stats.repeated(max_repeats + 1).items():
+            problems.append(f"statement repeated {count}x (max {max_repeats}), likely N+1: {shape}")
+    return problems
+
+
+@contextmanager
+def query_budget(
+    engine: AsyncEngine,
+    max_queries: Optional[int] = None,
+    max_repeats: Optional[int] = None,
+) -> Iterator[QueryStats]:
+    """
+    Conta os statements executados no engine dentro do bloco e levanta
+    QueryBudgetExceeded se passar de `max_queries` ou se o mesmo formato de
+    statement rodar mais de `max_repeats` vezes.
+    """
+    stats = QueryStats(track_shapes=True)
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats.record(statement, 0.0)
+
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield stats
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    problems = budget_violations(stats, max_queries, max_repeats)
+    if problems:
+        raise QueryBudgetExceeded("; ".join(problems))
+
+
+def report_query_budget(
+    method: str,
+    route: str,
+    stats: QueryStats,
+    max_queries: Optional[int] = None,
+    n_plus_one_threshold: Optional[int] = None,
+) -> None:
+    """Modo de runtime: registra em log e métricas, sem afetar a resposta."""
+    if max_queries and stats.count > max_queries:
+        db_query_budget_exceeded_total.inc(method, route)
+        logger.warning(
+            "Requisição acima do orçamento de queries",
+            extra={"method": method, "route": route, "queries": stats.count, "budget": max_queries},
+        )
+    if n_plus_one_threshold:
+        repeated = stats.repeated(n_plus_one_threshold)
+        if repeated:
+            db_n_plus_one_total.inc(method, route)
+            for shape, count in repeated.items():
+                logger.warning(
+                    "Provável N+1",
+                    extra={"method": method, "route": route, "repeats": count, "statement": shape},
+                )
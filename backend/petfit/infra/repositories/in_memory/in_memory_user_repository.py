@@ -38,7 +38,7 @@ class InMemoryUserRepository(UserRepository): # Herda da interface
         self._current_user_id = user.id
 
     # O retorno agora é 'Optional[User]' para consistência com a interface
-    def update(self, user: User) -> Optional[User]:
+    async def update(self, user: User) -> Optional[User]:
         if user.id in self._users:
             self._users[user.id] = user
             return user
@@ -46,4 +46,11 @@ class InMemoryUserRepository(UserRepository): # Herda da interface
 
     # get_by_id adicionado e consistente com a interface
     def get_by_id(self, user_id: str) -> Optional[User]:
-        return self._users.get(user_id)
\ No newline at end of file
+        return self._users.get(user_id)
+
+    async def revoke_tokens(self, user_id: str) -> Optional[int]:
+        user = self._users.get(user_id)
+        if user is None:
+            return None
+        user.token_version += 1
+        return user.token_version
@@ -1,26 +1,40 @@
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import insert, update
 
 from petfit.domain.entities.user import User
 from petfit.domain.repositories.user_repository import UserRepository
 from petfit.domain.value_objects.email_vo import Email
 from petfit.domain.value_objects.password import Password
 from petfit.infra.models.user_model import UserModel
+from petfit.infra.cache import TTLLRUCache
 
 from petfit.infra.database import async_session
 
 
 class SQLAlchemyUserRepository(UserRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, user_cache: Optional[TTLLRUCache[User]] = None):
         self._session = session
         self._current_user: Optional[User] = None
+        # Cache de usuários autenticados, invalidado a cada escrita no usuário
+        self._user_cache = user_cache
 
     async def register(self, user: User) -> User:
-        model = UserModel.from_entity(user)
-        self._session.add(model)
+        # INSERT ... RETURNING em vez de add + commit + refresh
+        stmt = (
+            insert(UserModel)
+            .values(
+                id=user.id,
+                name=user.name,
+                email=str(user.email),
+                password=user.password.hashed_value(),
+            )
+            .returning(UserModel)
+        )
+        result = await self._session.execute(stmt)
+        model = result.scalar_one()
         await self._session.commit()
-        await self._session.refresh(model)
         user.id = model.id
         return model.to_entity()
 
@@ -62,7 +76,34 @@ class SQLAlchemyUserRepository(UserRepository):
         user_model = result.scalar_one_or_none()
         return user_model.to_entity() if user_model else None
     
-    async def update(self, user):
-        return super().update(user)
-    
-    
\ No newline at end of file
+    async def update(self, user: User) -> Optional[User]:
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == str(user.id))
+            .values(
+                name=user.name,
+                email=str(user.email),
+                password=user.password.hashed_value(),
+            )
+            .returning(UserModel)
+        )
+        result = await self._session.execute(stmt)
+        user_model = result.scalar_one_or_none()
+        await self._session.commit()
+        if self._user_cache is not None:
+            self._user_cache.invalidate(user.id)
+        return user_model.to_entity() if user_model else None
+
+    async def revoke_tokens(self, id: str) -> Optional[int]:
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == str(id))
+            .values(token_version=UserModel.token_version + 1)
+            .returning(UserModel.token_version)
+        )
+        result = await self._session.execute(stmt)
+        token_version = result.scalar_one_or_none()
+        await self._session.commit()
+        if self._user_cache is not None:
+            self._user_cache.invalidate(str(id))
+        return token_version
@@ -1,138 +1,522 @@
 # petfit/infra/repositories/sqlalchemy/sqlalchemy_recipe_repository.py
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import exc # Para tratamento de exceções de DB
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Float, and_, cast, delete, exc, exists, func, insert, literal, or_, tuple_, update # Para tratamento de exceções de DB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
+from petfit.domain.entities.page import Page
 from petfit.domain.entities.recipe import Recipe
-from petfit.domain.entities.user import User
-from petfit.domain.repositories.recipe_repository import RecipeRepository
-from petfit.infra.models.recipe_model import RecipeModel
-from petfit.infra.models.user_model import UserModel # Necessário para carregar usuários e seus favoritos
-# Não precisa importar user_favorite_recipes_table aqui diretamente para relacionamentos.
+from petfit.domain.entities.identity import Identity
+from petfit.domain.repositories.recipe_repository import (
+    RecipeRepository,
+    DEFAULT_PAGE_LIMIT,
+    DEFAULT_RECIPE_SORT,
+    EXPORT_BATCH_SIZE,
+    FAVORITES_SORT,
+    ROLLUP_BATCH_SIZE,
+    SEARCH_SORT,
+)
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.domain.value_objects.ingredient_filter import IngredientFilter
+from petfit.infra.models.recipe_model import RecipeModel, SEARCH_CONFIG
+# Operações de favorito vão direto na tabela de associação, sem carregar coleções
+from petfit.infra.models.recipe_user_model import FAVORITES_USER_FK, user_favorite_recipes_table
+from petfit.infra.models.catalog_version_model import catalog_versions_table
+from petfit.infra.models.favorite_count_model import favorite_count_shards_table
+from petfit.infra.cache import TTLLRUCache
+
+# Nome da linha em catalog_versions que versiona o catálogo de receitas
+_RECIPES_CATALOG = "recipes"
+
+# Colunas permitidas como chave de ordenação (whitelist de RECIPE_SORT_FIELDS)
+_SORT_COLUMNS = {
+    "created_at": RecipeModel.created_at,
+    "title": RecipeModel.title,
+}
+
+
+def _constraint_name(error: exc.DBAPIError) -> Optional[str]:
+    """Nome da constraint violada, lido do erro do driver (asyncpg), não da mensagem."""
+    # O adaptador do SQLAlchemy encadeia o erro original do asyncpg em __cause__
+    cause = error.orig.__cause__ if error.orig is not None else None
+    return getattr(cause, "constraint_name", None)
+
+
+def _cursor_value_of(value: Any) -> Any:
+    """Converte o valor da chave de ordenação para algo serializável no cursor."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _cursor_value(field: str, value: Any) -> Any:
+    """Converte o valor vindo do cursor de volta para o tipo da coluna."""
+    try:
+        if field in ("created_at", FAVORITES_SORT):
+            return datetime.fromisoformat(value)
+        if field == SEARCH_SORT:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TypeError
+            return float(value)
+        if not isinstance(value, str):
+            raise TypeError
+        return value
+    except (TypeError, ValueError):
+        raise ValueError("Invalid pagination cursor.")
+
+def _favorite_state_columns(viewer_id: str) -> tuple:
+    """Colunas correlacionadas com o estado de favorito de cada receita para o usuário."""
+    table = user_favorite_recipes_table
+    shards = favorite_count_shards_table
+    # EXISTS na PK (user_id, recipe_id)
+    is_favorite = (
+        exists()
+        .where(table.c.user_id == viewer_id, table.c.recipe_id == RecipeModel.id)
+        .label("is_favorite")
+    )
+    # Contagem exata sem varrer favoritos: total consolidado + deltas pendentes
+    # (no máximo FAVORITE_COUNT_SHARDS linhas, pela PK dos shards)
+    pending = (
+        select(func.coalesce(func.sum(shards.c.delta), 0))
+        .where(shards.c.recipe_id == RecipeModel.id)
+        .scalar_subquery()
+    )
+    favorite_count = (RecipeModel.favorite_count + pending).label("favorite_count")
+    return is_favorite, favorite_count
+
+
+def _row_to_entity(row: Any) -> Recipe:
+    """Converte (RecipeModel[, is_favorite, favorite_count]) na entidade."""
+    model, *favorite_state = row
+    recipe = model.to_entity()
+    if favorite_state:
+        recipe.is_favorite, recipe.favorite_count = bool(favorite_state[0]), favorite_state[1]
+    return recipe
+
 
 class SQLAlchemyRecipeRepository(RecipeRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, popular_cache: Optional[TTLLRUCache[List[Recipe]]] = None):
         self._session = session
+        # Ranking de populares por limite; só expira por TTL (o rollup já é periódico)
+        self._popular_cache = popular_cache
 
     async def create(self, recipe: Recipe) -> Recipe:
-        model = RecipeModel.from_entity(recipe)
-        self._session.add(model)
+        # INSERT ... RETURNING: a linha gravada (com defaults do banco) volta no mesmo statement
+        stmt = (
+            insert(RecipeModel)
+            .values(
+                id=recipe.id,
+                title=recipe.title,
+                ingredients=recipe.ingredients,
+                instructions=recipe.instructions,
+                is_public=recipe.is_public,
+            )
+            .returning(RecipeModel)
+        )
+        result = await self._session.execute(stmt)
+        model = result.scalar_one()
+        # Versão do catálogo na mesma transação: a escrita e a invalidação dos ETags
+        # da listagem são gravadas juntas ou não são gravadas
+        await self._bump_catalog_version()
         await self._session.commit()
-        await self._session.refresh(model)
         recipe.id = model.id # Atualiza o ID da entidade
         return model.to_entity()
 
-    async def get_by_id(self, recipe_id: str) -> Optional[Recipe]:
+    async def bulk_create(self, recipes: List[Recipe]) -> int:
+        if not recipes:
+            return 0
+        rows = [
+            {
+                "id": recipe.id,
+                "title": recipe.title,
+                "ingredients": list(recipe.ingredients),
+                "instructions": list(recipe.instructions),
+                "is_public": recipe.is_public,
+            }
+            for recipe in recipes
+        ]
+        # executemany: o SQLAlchemy agrupa as linhas em INSERTs multi-row (insertmanyvalues)
+        try:
+            await self._session.execute(insert(RecipeModel), rows)
+            await self._session.commit()
+        except exc.DBAPIError as e:
+            await self._session.rollback()
+            raise ValueError(f"Batch rejected by the database: {e.orig}")
+        return len(rows)
+
+    async def get_by_id(self, recipe_id: str, viewer_id: Optional[str] = None) -> Optional[Recipe]:
         stmt = select(RecipeModel).where(RecipeModel.id == recipe_id)
+        if viewer_id is not None:
+            stmt = stmt.add_columns(*_favorite_state_columns(viewer_id))
         result = await self._session.execute(stmt)
-        recipe_model = result.scalar_one_or_none()
-        return recipe_model.to_entity() if recipe_model else None
+        row = result.one_or_none()
+        return _row_to_entity(row) if row else None
+
+    async def get_all_public_recipes(
+        self,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        after: Optional[Cursor] = None,
+        sort: str = DEFAULT_RECIPE_SORT,
+        ingredients: Optional[IngredientFilter] = None,
+        viewer_id: Optional[str] = None,
+    ) -> Page[Recipe]:
+        descending = sort.startswith("-")
+        field = sort.lstrip("-")
+        column = _SORT_COLUMNS[field]
 
-    async def get_all_public_recipes(self) -> List[Recipe]:
         stmt = select(RecipeModel).where(RecipeModel.is_public == True)
+        if viewer_id is not None:
+            stmt = stmt.add_columns(*_favorite_state_columns(viewer_id))
+        if ingredients is not None:
+            # Operadores de array atendidos pelo índice GIN em recipes.ingredients
+            if ingredients.all_of:
+                stmt = stmt.where(RecipeModel.ingredients.contains(list(ingredients.all_of)))
+            if ingredients.any_of:
+                stmt = stmt.where(RecipeModel.ingredients.overlap(list(ingredients.any_of)))
+            if ingredients.none_of:
+                stmt = stmt.where(~RecipeModel.ingredients.overlap(list(ingredients.none_of)))
+        if after is not None:
+            # Keyset: continua estritamente depois do par (chave, id) do último item
+            boundary = tuple_(column, RecipeModel.id)
+            last = tuple_(_cursor_value(field, after.value), after.id)
+            stmt = stmt.where(boundary < last if descending else boundary > last)
+        if descending:
+            stmt = stmt.order_by(column.desc(), RecipeModel.id.desc())
+        else:
+            stmt = stmt.order_by(column.asc(), RecipeModel.id.asc())
+        # Busca um item a mais só para saber se existe próxima página
+        stmt = stmt.limit(limit + 1)
+
+        result = await self._session.execute(stmt)
+        rows = list(result.all())
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_model = rows[-1][0]
+            next_cursor = Cursor(
+                sort=sort,
+                value=_cursor_value_of(getattr(last_model, field)),
+                id=last_model.id,
+            ).encode()
+        return Page([_row_to_entity(row) for row in rows], next_cursor)
+
+    async def stream_public_recipes(self, batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[Recipe]:
+        # Cursor do lado do servidor: yield_per liga stream_results e busca em lotes,
+        # então a memória fica limitada a um lote independente do tamanho do catálogo
+        stmt = (
+            select(RecipeModel)
+            .where(RecipeModel.is_public == True)
+            .order_by(RecipeModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream_scalars(stmt)
+        try:
+            async for model in result:
+                yield model.to_entity()
+        finally:
+            await result.close()
+
+    async def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        after: Optional[Cursor] = None,
+    ) -> Page[Recipe]:
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        # double precision para o valor no cursor voltar idêntico ao comparado
+        rank = cast(func.ts_rank_cd(RecipeModel.search_vector, ts_query), Float)
+
+        stmt = select(RecipeModel, rank.label("rank")).where(
+            RecipeModel.is_public == True,
+            RecipeModel.search_vector.bool_op("@@")(ts_query),
+        )
+        if after is not None:
+            # Keyset com direções mistas (rank desc, id asc)
+            last_rank = _cursor_value(SEARCH_SORT, after.value)
+            stmt = stmt.where(
+                or_(rank < last_rank, and_(rank == last_rank, RecipeModel.id > after.id))
+            )
+        stmt = stmt.order_by(rank.desc(), RecipeModel.id.asc()).limit(limit + 1)
+
+        result = await self._session.execute(stmt)
+        rows = list(result.all())
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_model, last_rank = rows[-1]
+            next_cursor = Cursor(sort=SEARCH_SORT, value=last_rank, id=last_model.id).encode()
+        return Page([model.to_entity() for model, _ in rows], next_cursor)
+
+    async def get_popular_recipes(self, limit: int = DEFAULT_PAGE_LIMIT) -> List[Recipe]:
+        if self._popular_cache is not None:
+            cached = self._popular_cache.get(limit)
+            if cached is not None:
+                return cached
+        # Lê as primeiras linhas do índice parcial (favorite_count, id) de trás para frente,
+        # sem agregar favoritos
+        stmt = (
+            select(RecipeModel)
+            .where(RecipeModel.is_public == True)
+            .order_by(RecipeModel.favorite_count.desc(), RecipeModel.id.desc())
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        recipes = []
+        for model in result.scalars().all():
+            recipe = model.to_entity()
+            recipe.favorite_count = model.favorite_count
+            recipes.append(recipe)
+        if self._popular_cache is not None:
+            self._popular_cache.set(limit, recipes)
+        return recipes
+
+    async def rollup_favorite_counts(self, limit: int = ROLLUP_BATCH_SIZE) -> Tuple[int, int]:
+        # Um statement por lote: trava até `limit` linhas de shard (SKIP LOCKED pula as
+        # de outro rollup em andamento), apaga-as devolvendo os deltas, soma por
+        # receita e aplica em recipes. Cada delta é consumido por um único rollup e o
+        # número de linhas travadas por transação fica limitado.
+        shards = favorite_count_shards_table
+        keys = (
+            select(shards.c.recipe_id, shards.c.shard)
+            .order_by(shards.c.recipe_id, shards.c.shard)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("keys")
+        )
+        drained = (
+            shards.delete()
+            .where(shards.c.recipe_id == keys.c.recipe_id, shards.c.shard == keys.c.shard)
+            .returning(shards.c.recipe_id, shards.c.delta)
+            .cte("drained")
+        )
+        totals = (
+            select(drained.c.recipe_id, func.sum(drained.c.delta).label("delta"))
+            .group_by(drained.c.recipe_id)
+            .cte("totals")
+        )
+        updated = (
+            update(RecipeModel)
+            .where(RecipeModel.id == totals.c.recipe_id, totals.c.delta != 0)
+            .values(favorite_count=RecipeModel.favorite_count + totals.c.delta)
+            .returning(RecipeModel.id)
+            .cte("updated")
+        )
+        stmt = select(
+            select(func.count()).select_from(drained).scalar_subquery(),
+            select(func.count()).select_from(updated).scalar_subquery(),
+        )
         result = await self._session.execute(stmt)
-        return [model.to_entity() for model in result.scalars().all()]
-
-    async def add_favorite(self, user: User, recipe: Recipe) -> bool:
-        # Carregar o UserModel completo (com favorite_recipes populadas)
-        user_model_stmt = select(UserModel).where(UserModel.id == user.id)
-        user_model_result = await self._session.execute(user_model_stmt)
-        user_model = user_model_result.scalar_one_or_none()
-        if not user_model:
-            return False # Usuário não encontrado
-
-        # Carregar o RecipeModel
-        recipe_model_stmt = select(RecipeModel).where(RecipeModel.id == recipe.id)
-        recipe_model_result = await self._session.execute(recipe_model_stmt)
-        recipe_model = recipe_model_result.scalar_one_or_none()
-        if not recipe_model:
-            return False # Receita não encontrada
-
-        if recipe_model not in user_model.favorite_recipes: # Verifica se já é favorito
-            user_model.favorite_recipes.append(recipe_model)
-            try:
-                await self._session.commit()
-                await self._session.refresh(user_model) # Opcional: refresh para garantir o estado
-                return True
-            except exc.IntegrityError: # Caso haja uma violação de unicidade (já favoritou)
-                await self._session.rollback()
-                return False
-        return False # Já era favorito
-
-    async def remove_favorite(self, user: User, recipe: Recipe) -> bool:
-        user_model_stmt = select(UserModel).where(UserModel.id == user.id)
-        user_model_result = await self._session.execute(user_model_stmt)
-        user_model = user_model_result.scalar_one_or_none()
-        if not user_model:
-            return False
-
-        recipe_model_stmt = select(RecipeModel).where(RecipeModel.id == recipe.id)
-        recipe_model_result = await self._session.execute(recipe_model_stmt)
-        recipe_model = recipe_model_result.scalar_one_or_none()
-        if not recipe_model:
-            return False
-
-        if recipe_model in user_model.favorite_recipes:
-            user_model.favorite_recipes.remove(recipe_model)
+        drained_count, updated_count = result.one()
+        await self._session.commit()
+        return drained_count, updated_count
+
+    async def add_favorite(self, user: Identity, recipe_id: str) -> bool:
+        # Um único INSERT: o ON CONFLICT cobre "já era favorito" e as FKs
+        # cobrem usuário/receita inexistentes, sem leituras prévias.
+        stmt = (
+            pg_insert(user_favorite_recipes_table)
+            .values(user_id=user.id, recipe_id=recipe_id)
+            .on_conflict_do_nothing()
+            .returning(user_favorite_recipes_table.c.recipe_id)
+        )
+        try:
+            result = await self._session.execute(stmt)
+            added = result.first() is not None
             await self._session.commit()
-            await self._session.refresh(user_model) # Opcional: refresh para garantir o estado
-            return True
-        return False # Não era favorito para ser removido
+        except exc.IntegrityError as e: # Violação de FK
+            await self._session.rollback()
+            # A mensagem ecoa o recipe_id vindo da URL; só o nome da constraint é confiável
+            if _constraint_name(e) == FAVORITES_USER_FK:
+                raise ValueError(f"User with ID {user.id} not found.")
+            raise ValueError(f"Recipe with ID {recipe_id} not found.")
+        return added # False quando já era favorito
+
+    async def remove_favorite(self, user: Identity, recipe_id: str) -> bool:
+        # DELETE ... RETURNING direto na chave composta da associação
+        table = user_favorite_recipes_table
+        stmt = (
+            table.delete()
+            .where(table.c.user_id == user.id, table.c.recipe_id == recipe_id)
+            .returning(table.c.recipe_id)
+        )
+        result = await self._session.execute(stmt)
+        removed = result.first() is not None
+        await self._session.commit()
+        return removed # False quando não era favorito (ou a receita não existe)
+
+    async def update_favorites(
+        self, user: Identity, add: List[str], remove: List[str]
+    ) -> Tuple[Dict[str, bool], List[str]]:
+        # Os dois statements na mesma transação: um commit só no fim, e rollback
+        # se qualquer um falhar, para o lote não ficar aplicado pela metade
+        try:
+            added = await self._insert_favorites(user, add)
+            removed = await self._delete_favorites(user, remove)
+            await self._session.commit()
+        except exc.IntegrityError: # Só a FK do usuário pode falhar aqui
+            await self._session.rollback()
+            raise ValueError(f"User with ID {user.id} not found.")
+        except Exception:
+            await self._session.rollback()
+            raise
+        return added, removed
+
+    async def _insert_favorites(self, user: Identity, recipe_ids: List[str]) -> Dict[str, bool]:
+        if not recipe_ids:
+            return {}
+        # Um único statement: a CTE "existing" filtra os IDs que existem, o
+        # INSERT ... SELECT grava todos de uma vez (ON CONFLICT = já favorito)
+        # e o LEFT JOIN final diz, por receita, se ela entrou agora.
+        table = user_favorite_recipes_table
+        existing = (
+            select(RecipeModel.id.label("recipe_id"))
+            .where(RecipeModel.id.in_(recipe_ids))
+            .cte("existing")
+        )
+        inserted = (
+            pg_insert(table)
+            .from_select(
+                ["user_id", "recipe_id"],
+                select(literal(user.id), existing.c.recipe_id),
+            )
+            .on_conflict_do_nothing()
+            .returning(table.c.recipe_id)
+            .cte("inserted")
+        )
+        stmt = select(existing.c.recipe_id, inserted.c.recipe_id.is_not(None)).outerjoin(
+            inserted, inserted.c.recipe_id == existing.c.recipe_id
+        )
+        result = await self._session.execute(stmt)
+        return {recipe_id: added for recipe_id, added in result.all()}
+
+    async def _delete_favorites(self, user: Identity, recipe_ids: List[str]) -> List[str]:
+        if not recipe_ids:
+            return []
+        table = user_favorite_recipes_table
+        stmt = (
+            table.delete()
+            .where(table.c.user_id == user.id, table.c.recipe_id.in_(recipe_ids))
+            .returning(table.c.recipe_id)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_user_favorite_recipes(
+        self,
+        user: Identity,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        after: Optional[Cursor] = None,
+    ) -> Page[Recipe]:
+        # A página é escolhida só na associação, pelo índice (user_id,
+        # created_at, recipe_id); o JOIN com recipes acontece apenas para as
+        # linhas dessa página.
+        table = user_favorite_recipes_table
+        page_stmt = select(table.c.recipe_id, table.c.created_at).where(table.c.user_id == user.id)
+        if after is not None:
+            last = tuple_(_cursor_value(FAVORITES_SORT, after.value), after.id)
+            page_stmt = page_stmt.where(tuple_(table.c.created_at, table.c.recipe_id) < last)
+        # Busca um item a mais só para saber se existe próxima página
+        favorites = (
+            page_stmt.order_by(table.c.created_at.desc(), table.c.recipe_id.desc())
+            .limit(limit + 1)
+            .subquery("favorites")
+        )
+        stmt = (
+            select(RecipeModel, favorites.c.created_at)
+            .join(favorites, favorites.c.recipe_id == RecipeModel.id)
+            .order_by(favorites.c.created_at.desc(), favorites.c.recipe_id.desc())
+        )
+        result = await self._session.execute(stmt)
+        rows = list(result.all())
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_model, favorited_at = rows[-1]
+            next_cursor = Cursor(
+                sort=FAVORITES_SORT, value=_cursor_value_of(favorited_at), id=last_model.id
+            ).encode()
+        return Page([model.to_entity() for model, _ in rows], next_cursor)
 
-    async def get_user_favorite_recipes(self, user: User) -> List[Recipe]:
-        # Para carregar os favoritos, precisamos carregar o UserModel com a relação populada
-        # Usa `selectinload` para carregar a relação `favorite_recipes` na mesma consulta
-        stmt = select(UserModel).options(selectinload(UserModel.favorite_recipes)).where(UserModel.id == user.id)
+    async def get_user_favorite_ids(self, user: Identity) -> List[str]:
+        # Só a associação: a PK (user_id, recipe_id) atende com index-only scan,
+        # já na ordem de recipe_id, sem tocar em recipes
+        table = user_favorite_recipes_table
+        stmt = select(table.c.recipe_id).where(table.c.user_id == user.id).order_by(table.c.recipe_id)
         result = await self._session.execute(stmt)
-        user_model = result.scalar_one_or_none()
-        if user_model:
-            # Converte os RecipeModel para entidades Recipe
-            return [recipe_model.to_entity() for recipe_model in user_model.favorite_recipes]
-        return []
+        return list(result.scalars().all())
 
     async def update(self, recipe: Recipe) -> Optional[Recipe]:
-        # Implementação para atualizar uma receita
-        existing_recipe = await self._session.get(RecipeModel, recipe.id)
-        if not existing_recipe:
-            return None
-        
-        # Atualiza os campos
-        existing_recipe.title = recipe.title
-        existing_recipe.ingredients = recipe.ingredients
-        existing_recipe.instructions = recipe.instructions
-        existing_recipe.is_public = recipe.is_public
-        
+        # UPDATE ... RETURNING: None quando a receita não existe
+        stmt = (
+            update(RecipeModel)
+            .where(RecipeModel.id == recipe.id)
+            .values(
+                title=recipe.title,
+                ingredients=recipe.ingredients,
+                instructions=recipe.instructions,
+                is_public=recipe.is_public,
+                version=RecipeModel.version + 1,
+            )
+            .returning(RecipeModel)
+        )
+        result = await self._session.execute(stmt)
+        model = result.scalar_one_or_none()
+        if model is not None:
+            await self._bump_catalog_version()
         await self._session.commit()
-        await self._session.refresh(existing_recipe)
-        return existing_recipe.to_entity()
+        return model.to_entity() if model else None
 
     async def delete(self, recipe_id: str) -> bool:
-        # Implementação para deletar uma receita
-        recipe_to_delete = await self._session.get(RecipeModel, recipe_id)
-        if not recipe_to_delete:
-            return False
-        
-        await self._session.delete(recipe_to_delete)
+        # DELETE ... RETURNING; os favoritos saem junto via ON DELETE CASCADE
+        stmt = delete(RecipeModel).where(RecipeModel.id == recipe_id).returning(RecipeModel.id)
+        result = await self._session.execute(stmt)
+        deleted = result.first() is not None
+        if deleted:
+            await self._bump_catalog_version()
         await self._session.commit()
-        return True
+        return deleted
     
-    async def is_favorite(self, user: User, recipe: Recipe) -> bool:
-            """Verifica se uma receita é favorita de um usuário."""
-            # Carregar o UserModel com suas receitas favoritas
-            stmt = select(UserModel).options(selectinload(UserModel.favorite_recipes)).where(UserModel.id == user.id)
-            result = await self._session.execute(stmt)
-            user_model = result.scalar_one_or_none()
-
-            if user_model:
-                # Verificar se a receita está na lista de favoritos do usuário
-                # Precisamos do RecipeModel para fazer a comparação direta no relacionamento
-                recipe_model_stmt = select(RecipeModel).where(RecipeModel.id == recipe.id)
-                recipe_model_result = await self._session.execute(recipe_model_stmt)
-                recipe_model = recipe_model_result.scalar_one_or_none()
-
-                if recipe_model and recipe_model in user_model.favorite_recipes:
-                    return True
-            return False
\ No newline at end of file
+    async def is_favorite(self, user: Identity, recipe_id: str) -> bool:
+        """Verifica se uma receita é favorita de um usuário."""
+        # SELECT EXISTS pela chave primária composta (user_id, recipe_id)
+        table = user_favorite_recipes_table
+        stmt = select(
+            exists().where(table.c.user_id == user.id, table.c.recipe_id == recipe_id)
+        )
+        result = await self._session.execute(stmt)
+        return bool(result.scalar())
+
+    async def get_version(self, recipe_id: str) -> Optional[int]:
+        stmt = select(RecipeModel.version).where(RecipeModel.id == recipe_id)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_catalog_version(self) -> int:
+        table = catalog_versions_table
+        stmt = select(table.c.version).where(table.c.name == _RECIPES_CATALOG)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() or 0
+
+    async def bump_catalog_version(self) -> int:
+        version = await self._bump_catalog_version()
+        await self._session.commit()
+        return version
+
+    async def _bump_catalog_version(self) -> int:
+        # Upsert atômico: cria a linha na primeira escrita e incrementa nas seguintes.
+        # Sem commit: roda na transação da escrita que a originou
+        table = catalog_versions_table
+        stmt = (
+            pg_insert(table)
+            .values(name=_RECIPES_CATALOG, version=1)
+            .on_conflict_do_update(
+                index_elements=[table.c.name],
+                set_={"version": table.c.version + 1},
+            )
+            .returning(table.c.version)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one()
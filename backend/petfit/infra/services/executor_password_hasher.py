@@ -0,0 +1,73 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from petfit.domain.services.password_hasher import PasswordHasher
+from petfit.domain.value_objects.password import (
+    DEFAULT_BCRYPT_ROUNDS,
+    Password,
+    check_password,
+    hash_password,
+)
+
+
+class ExecutorPasswordHasher(PasswordHasher):
+    """
+    Executa bcrypt em um pool limitado de threads (ou processos).
+
+    O bcrypt libera a GIL durante o cálculo, então threads já bastam para não
+    travar o event loop; o pool de processos fica disponível para hosts onde
+    o CPU do worker do uvicorn também precisa ser isolado.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        use_processes: bool = False,
+        rounds: int = DEFAULT_BCRYPT_ROUNDS,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        if not 4 <= rounds <= 31:
+            raise ValueError("bcrypt rounds must be between 4 and 31.")
+        self._max_workers = max_workers
+        self._use_processes = use_processes
+        self._executor: Optional[Executor] = None
+        self.rounds = rounds
+
+    @property
+    def executor(self) -> Executor:
+        # Criado sob demanda para não abrir threads/processos só por importar o módulo
+        if self._executor is None:
+            if self._use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="petfit-bcrypt"
+                )
+        return self._executor
+
+    async def hash(self, plain_password: str) -> Password:
+        Password.validate(plain_password)
+        return await self.rehash(plain_password)
+
+    async def rehash(self, plain_password: str) -> Password:
+        loop = asyncio.get_running_loop()
+        hashed = await loop.run_in_executor(
+            self.executor, hash_password, plain_password, self.rounds
+        )
+        return Password(hashed, hashed=True)
+
+    async def verify(self, password: Password, plain_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, check_password, plain_password, password.hashed_value()
+        )
+
+    def needs_rehash(self, password: Password) -> bool:
+        return password.rounds() != self.rounds
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
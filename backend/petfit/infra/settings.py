@@ -1,5 +1,7 @@
 from dotenv import load_dotenv
 import os
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import ClassVar, Optional
 
 load_dotenv()
 
@@ -11,4 +13,28 @@ POSTGRES_DB = os.getenv("POSTGRES_DB", "petfitdb")
 POSTGRES_HOST = "db" if DOCKER_ENV else "localhost"
 POSTGRES_PORT = os.getenv("POSTGRES_PORT", "5432")
 
-DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
\ No newline at end of file
+DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
+
+
+class DatabaseSettings(BaseSettings):
+    """Configuração do engine/pool (petfit.infra.database). A API estende esta classe
+    em petfit.api.settings.Settings e passa a instância para init_engine."""
+
+    # Sem padrão: sem a variável de ambiente a aplicação não sobe (em vez de tentar o host "db")
+    DATABASE_URL: Optional[str] = None
+    # Réplica de leitura opcional; sem ela, as leituras vão para o primário
+    DATABASE_READ_URL: Optional[str] = None
+
+    DB_ECHO: bool = False  # Loga cada SQL de forma síncrona; só para depuração
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # Segundos esperando uma conexão livre
+    DB_POOL_RECYCLE: int = 1800  # Segundos até reciclar uma conexão; -1 desativa
+    DB_POOL_PRE_PING: bool = False  # Testa a conexão a cada checkout (1 ida ao banco)
+    DB_STATEMENT_CACHE_SIZE: int = 100  # LRU de prepared statements por conexão (adaptador asyncpg do SQLAlchemy)
+    # Compatível com PgBouncer em modo transaction: desliga o cache de statements
+    DB_PGBOUNCER: bool = False
+
+    model_config: ClassVar[SettingsConfigDict] = SettingsConfigDict(
+        env_file=".env", extra="ignore"
+    )
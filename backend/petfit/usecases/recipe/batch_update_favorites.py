@@ -0,0 +1,52 @@
+# petfit/usecases/recipe/batch_update_favorites.py
+
+from typing import List
+
+from petfit.domain.entities.favorite_batch import (
+    ADDED,
+    ALREADY_FAVORITE,
+    MAX_FAVORITE_BATCH,
+    NOT_FAVORITE,
+    NOT_FOUND,
+    REMOVED,
+    FavoriteBatchResult,
+)
+from petfit.domain.entities.identity import Identity
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+
+
+def _unique(ids: List[str]) -> List[str]:
+    # Remove repetidos mantendo a ordem de chegada
+    return list(dict.fromkeys(ids))
+
+
+class BatchUpdateFavoritesUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(self, user: Identity, add: List[str], remove: List[str]) -> FavoriteBatchResult:
+        """Adiciona e remove vários favoritos de uma vez, com o resultado de cada ID.
+        Levanta ValueError se o lote for grande demais, se um ID estiver nas duas listas
+        ou se o usuário não existir.
+        """
+        add, remove = _unique(add), _unique(remove)
+        if len(add) + len(remove) > MAX_FAVORITE_BATCH:
+            raise ValueError(f"At most {MAX_FAVORITE_BATCH} recipe IDs per batch.")
+        conflicting = set(add) & set(remove)
+        if conflicting:
+            raise ValueError(f"Recipe IDs both added and removed: {', '.join(sorted(conflicting))}.")
+
+        # Um INSERT para todas as adições e um DELETE para todas as remoções, na mesma transação
+        added, removed_ids = await self.repository.update_favorites(user, add, remove)
+
+        result = FavoriteBatchResult()
+        for recipe_id in add:
+            if recipe_id not in added:
+                result.set(recipe_id, NOT_FOUND)
+            else:
+                result.set(recipe_id, ADDED if added[recipe_id] else ALREADY_FAVORITE)
+
+        removed = set(removed_ids)
+        for recipe_id in remove:
+            result.set(recipe_id, REMOVED if recipe_id in removed else NOT_FAVORITE)
+        return result
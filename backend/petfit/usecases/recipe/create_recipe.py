@@ -12,4 +12,5 @@ class CreateRecipeUseCase:
         """Cria uma nova receita."""
         # Aqui você poderia adicionar lógicas de negócio adicionais antes de criar
         # Ex: verificar duplicidade de título, padronizar dados, etc.
+        # O repositório invalida os ETags da listagem na mesma transação
         return await self.repository.create(recipe)
\ No newline at end of file
@@ -8,4 +8,5 @@ class DeleteRecipeUseCase:
 
     async def execute(self, recipe_id: str) -> bool:
         """Deleta uma receita pelo ID."""
+        # O repositório invalida os ETags da listagem na mesma transação
         return await self.repository.delete(recipe_id)
\ No newline at end of file
@@ -0,0 +1,16 @@
+# petfit/usecases/recipe/export_public_recipes.py
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.repositories.recipe_repository import RecipeRepository, EXPORT_BATCH_SIZE
+from typing import AsyncIterator
+
+class ExportPublicRecipesUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(self, batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[Recipe]:
+        """Percorre todo o catálogo público em streaming, uma receita por vez."""
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        async for recipe in self.repository.stream_public_recipes(batch_size=batch_size):
+            yield recipe
@@ -1,13 +1,48 @@
 # petfit/usecases/recipe/get_all_recipes.py
 
+from petfit.domain.entities.page import Page
 from petfit.domain.entities.recipe import Recipe
-from petfit.domain.repositories.recipe_repository import RecipeRepository
-from typing import List
+from petfit.domain.repositories.recipe_repository import (
+    RecipeRepository,
+    RECIPE_SORT_FIELDS,
+    DEFAULT_RECIPE_SORT,
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+)
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.domain.value_objects.ingredient_filter import IngredientFilter
+from typing import Optional
 
 class GetAllRecipesUseCase:
     def __init__(self, repository: RecipeRepository):
         self.repository = repository
 
-    async def execute(self) -> List[Recipe]:
-        """Obtém todas as receitas públicas."""
-        return await self.repository.get_all_public_recipes()
\ No newline at end of file
+    async def execute(
+        self,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        after: Optional[str] = None,
+        sort: str = DEFAULT_RECIPE_SORT,
+        ingredients: Optional[IngredientFilter] = None,
+        viewer_id: Optional[str] = None,
+    ) -> Page[Recipe]:
+        """Obtém uma página de receitas públicas.
+        `after` é o cursor opaco devolvido em `next_cursor` pela página anterior.
+        `ingredients` restringe a página a receitas com/sem certos ingredientes.
+        `viewer_id` anota cada receita com `is_favorite` e `favorite_count`.
+        """
+        if sort not in RECIPE_SORT_FIELDS:
+            raise ValueError(f"Invalid sort '{sort}'. Allowed: {', '.join(RECIPE_SORT_FIELDS)}.")
+        if not 1 <= limit <= MAX_PAGE_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_LIMIT}.")
+
+        cursor = Cursor.decode(after) if after else None
+        if cursor and cursor.sort != sort:
+            # Um cursor só é válido para a mesma ordenação que o gerou
+            raise ValueError("Cursor does not match the requested sort.")
+
+        if ingredients is not None and ingredients.is_empty():
+            ingredients = None
+
+        return await self.repository.get_all_public_recipes(
+            limit=limit, after=cursor, sort=sort, ingredients=ingredients, viewer_id=viewer_id
+        )
@@ -0,0 +1,11 @@
+# petfit/usecases/recipe/get_catalog_version.py
+
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+
+class GetCatalogVersionUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(self) -> int:
+        """Obtém a versão atual do catálogo de receitas (muda a cada escrita)."""
+        return await self.repository.get_catalog_version()
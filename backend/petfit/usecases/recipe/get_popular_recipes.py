@@ -0,0 +1,19 @@
+# petfit/usecases/recipe/get_popular_recipes.py
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.repositories.recipe_repository import (
+    RecipeRepository,
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+)
+from typing import List
+
+class GetPopularRecipesUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(self, limit: int = DEFAULT_PAGE_LIMIT) -> List[Recipe]:
+        """Obtém as `limit` receitas públicas mais favoritadas."""
+        if not 1 <= limit <= MAX_PAGE_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_LIMIT}.")
+        return await self.repository.get_popular_recipes(limit)
@@ -8,6 +8,8 @@ class GetRecipeByIdUseCase:
     def __init__(self, repository: RecipeRepository):
         self.repository = repository
 
-    async def execute(self, recipe_id: str) -> Optional[Recipe]:
-        """Obtém uma receita específica pelo ID."""
-        return await self.repository.get_by_id(recipe_id)
\ No newline at end of file
+    async def execute(self, recipe_id: str, viewer_id: Optional[str] = None) -> Optional[Recipe]:
+        """Obtém uma receita específica pelo ID.
+        Com `viewer_id`, a receita vem anotada com `is_favorite` e `favorite_count`.
+        """
+        return await self.repository.get_by_id(recipe_id, viewer_id=viewer_id)
\ No newline at end of file
@@ -0,0 +1,12 @@
+# petfit/usecases/recipe/get_recipe_version.py
+
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from typing import Optional
+
+class GetRecipeVersionUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(self, recipe_id: str) -> Optional[int]:
+        """Obtém a versão de uma receita sem carregá-la. None se não existe."""
+        return await self.repository.get_version(recipe_id)
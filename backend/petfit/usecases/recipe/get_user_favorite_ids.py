@@ -0,0 +1,13 @@
+# petfit/usecases/recipe/get_user_favorite_ids.py
+
+from petfit.domain.entities.identity import Identity
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from typing import List
+
+class GetUserFavoriteIdsUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(self, user: Identity) -> List[str]:
+        """Obtém os IDs das receitas favoritas de um usuário (para marcar corações na listagem)."""
+        return await self.repository.get_user_favorite_ids(user)
@@ -1,14 +1,36 @@
 # petfit/usecases/recipe/get_user_favorite_recipes.py
 
+from petfit.domain.entities.page import Page
 from petfit.domain.entities.recipe import Recipe
-from petfit.domain.entities.user import User
-from petfit.domain.repositories.recipe_repository import RecipeRepository
-from typing import List
+from petfit.domain.entities.identity import Identity
+from petfit.domain.repositories.recipe_repository import (
+    RecipeRepository,
+    DEFAULT_PAGE_LIMIT,
+    FAVORITES_SORT,
+    MAX_PAGE_LIMIT,
+)
+from petfit.domain.value_objects.cursor import Cursor
+from typing import Optional
 
 class GetUserFavoriteRecipesUseCase:
     def __init__(self, repository: RecipeRepository):
         self.repository = repository
 
-    async def execute(self, user: User) -> List[Recipe]:
-        """Obtém todas as receitas favoritas de um usuário."""
-        return await self.repository.get_user_favorite_recipes(user)
\ No newline at end of file
+    async def execute(
+        self,
+        user: Identity,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        after: Optional[str] = None,
+    ) -> Page[Recipe]:
+        """Obtém uma página das receitas favoritas de um usuário, das mais recentes às mais antigas.
+        `after` é o cursor opaco devolvido em `next_cursor` pela página anterior.
+        """
+        if not 1 <= limit <= MAX_PAGE_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_LIMIT}.")
+
+        cursor = Cursor.decode(after) if after else None
+        if cursor and cursor.sort != FAVORITES_SORT:
+            # Cursores da listagem/busca não valem aqui
+            raise ValueError("Cursor does not match the requested sort.")
+
+        return await self.repository.get_user_favorite_recipes(user, limit=limit, after=cursor)
@@ -0,0 +1,58 @@
+# petfit/usecases/recipe/import_recipes.py
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.entities.recipe_import import RecipeImportReport, RecipeImportRow
+from petfit.domain.repositories.recipe_repository import RecipeRepository, IMPORT_CHUNK_SIZE
+from typing import AsyncIterable, List, Tuple
+
+class ImportRecipesUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(
+        self,
+        rows: AsyncIterable[RecipeImportRow],
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> RecipeImportReport:
+        """Importa receitas em lotes, uma transação por lote.
+        Linhas inválidas não impedem as demais; um lote que falha no banco é
+        reportado linha a linha e a importação segue para o próximo. Um erro de
+        leitura no meio da entrada (linha longa demais, cabeçalho inválido)
+        encerra a importação com um erro final no relatório; os lotes já
+        gravados ficam e o relatório parcial é devolvido.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+
+        report = RecipeImportReport()
+        chunk: List[Tuple[int, Recipe]] = []
+        last_row = 0
+        try:
+            try:
+                async for row in rows:
+                    report.total += 1
+                    last_row = row.row
+                    if row.recipe is None:
+                        report.add_error(row.row, row.error or "Invalid row.")
+                        continue
+                    chunk.append((row.row, row.recipe))
+                    if len(chunk) >= chunk_size:
+                        await self._flush(chunk, report)
+                        chunk = []
+            except ValueError as e:
+                report.add_error(last_row + 1, str(e))
+            if chunk:
+                await self._flush(chunk, report)
+        finally:
+            # Mesmo se a leitura for interrompida (ex.: cliente desconectou), os
+            # lotes já gravados precisam invalidar os ETags do catálogo, uma vez só
+            if report.imported:
+                await self.repository.bump_catalog_version()
+        return report
+
+    async def _flush(self, chunk: List[Tuple[int, Recipe]], report: RecipeImportReport) -> None:
+        try:
+            report.imported += await self.repository.bulk_create([recipe for _, recipe in chunk])
+        except ValueError as e:
+            for row, _ in chunk:
+                report.add_error(row, str(e))
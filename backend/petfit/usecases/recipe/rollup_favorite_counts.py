@@ -0,0 +1,26 @@
+# petfit/usecases/recipe/rollup_favorite_counts.py
+
+from petfit.domain.repositories.recipe_repository import (
+    RecipeRepository,
+    ROLLUP_BATCH_SIZE,
+    ROLLUP_MAX_BATCHES,
+)
+
+class RollupFavoriteCountsUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(self, batch_size: int = ROLLUP_BATCH_SIZE, max_batches: int = ROLLUP_MAX_BATCHES) -> int:
+        """Consolida os contadores de favoritos pendentes em lotes, uma transação por lote.
+        Para quando um lote vem incompleto ou após `max_batches` (o resto fica para a
+        próxima execução). Retorna quantas receitas mudaram."""
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        updated = 0
+        for _ in range(max_batches):
+            drained, recipes = await self.repository.rollup_favorite_counts(batch_size)
+            updated += recipes
+            if drained < batch_size:
+                break
+        return updated
@@ -0,0 +1,40 @@
+# petfit/usecases/recipe/search_recipes.py
+
+from petfit.domain.entities.page import Page
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.repositories.recipe_repository import (
+    RecipeRepository,
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+    MAX_SEARCH_QUERY_LENGTH,
+    SEARCH_SORT,
+)
+from petfit.domain.value_objects.cursor import Cursor
+from typing import Optional
+
+class SearchRecipesUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(
+        self,
+        query: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        after: Optional[str] = None,
+    ) -> Page[Recipe]:
+        """Busca receitas públicas por título, ingredientes e modo de preparo.
+        `after` é o cursor opaco devolvido em `next_cursor` pela página anterior.
+        """
+        query = (query or "").strip()
+        if not query:
+            raise ValueError("Search query must not be empty.")
+        if len(query) > MAX_SEARCH_QUERY_LENGTH:
+            raise ValueError(f"Search query must have at most {MAX_SEARCH_QUERY_LENGTH} characters.")
+        if not 1 <= limit <= MAX_PAGE_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_LIMIT}.")
+
+        cursor = Cursor.decode(after) if after else None
+        if cursor and cursor.sort != SEARCH_SORT:
+            raise ValueError("Cursor does not match the requested sort.")
+
+        return await self.repository.search(query, limit=limit, after=cursor)
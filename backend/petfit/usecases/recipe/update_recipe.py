@@ -12,4 +12,5 @@ class UpdateRecipeUseCase:
         """Atualiza uma receita existente."""
         # Você pode adicionar lógica de negócio aqui, como verificar se o usuário
         # que está tentando atualizar é o proprietário original da receita (se houver)
+        # O repositório invalida os ETags da listagem na mesma transação
         return await self.repository.update(recipe)
\ No newline at end of file
@@ -2,11 +2,17 @@ from petfit.domain.value_objects.email_vo import Email
 from petfit.domain.value_objects.password import Password
 from petfit.domain.entities.user import User
 from petfit.domain.repositories.user_repository import UserRepository
+from petfit.domain.services.password_hasher import PasswordHasher
 from typing import Optional
+import logging
+
+# Logger filho de "petfit", sem depender da infra
+logger = logging.getLogger("petfit.usecases.login")
 
 class LoginUserUseCase:
-    def __init__(self, repository: UserRepository):
+    def __init__(self, repository: UserRepository, password_hasher: Optional[PasswordHasher] = None):
         self.repository = repository
+        self.password_hasher = password_hasher
 
     async def execute(self, email: Email, plain_password: str) -> Optional[User]:
         user = await self.repository.login(email) 
@@ -14,7 +20,26 @@ class LoginUserUseCase:
         if not user:
             return None  # Usuário não encontrado
 
-        if user.password.verify(plain_password):
+        if await self._verify(user, plain_password):
+            await self._rehash_if_needed(user, plain_password)
             return user
         
-        return None  # Credenciais inválidas (senha incorreta)
\ No newline at end of file
+        return None  # Credenciais inválidas (senha incorreta)
+
+    async def _verify(self, user: User, plain_password: str) -> bool:
+        # Sem serviço de hashing a verificação é síncrona (bloqueia o event loop)
+        if self.password_hasher is None:
+            return user.password.verify(plain_password)
+        return await self.password_hasher.verify(user.password, plain_password)
+
+    async def _rehash_if_needed(self, user: User, plain_password: str) -> None:
+        # Com a senha em texto claro já verificada, aproveita para migrar o hash
+        # para o custo configurado atualmente.
+        if self.password_hasher is None or not self.password_hasher.needs_rehash(user.password):
+            return
+        # Melhor esforço: a senha já foi verificada, uma falha aqui não recusa o login
+        try:
+            user.password = await self.password_hasher.rehash(plain_password)
+            await self.repository.update(user)
+        except Exception:
+            logger.exception("Falha ao migrar o hash da senha", extra={"user_id": user.id})
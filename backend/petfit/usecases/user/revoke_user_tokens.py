@@ -0,0 +1,12 @@
+from petfit.domain.entities.user import User
+from petfit.domain.repositories.user_repository import UserRepository
+from typing import Optional
+
+
+class RevokeUserTokensUseCase:
+    def __init__(self, repository: UserRepository):
+        self.repository = repository
+
+    async def execute(self, user: User) -> Optional[int]:
+        """Revoga todos os tokens já emitidos para o usuário. Retorna a nova versão de token."""
+        return await self.repository.revoke_tokens(user.id)
@@ -0,0 +1,41 @@
+import pytest
+from asgi_lifespan import LifespanManager
+from httpx import ASGITransport, AsyncClient
+
+from petfit.api.main import app
+from petfit.api.settings import settings
+from petfit.infra import database
+
+
+@pytest.mark.asyncio
+async def test_health_endpoints_without_database(monkeypatch):
+    """Sem banco, a aplicação sobe: /healthz responde e /readyz indica indisponível."""
+    # Porta fechada: a conexão é recusada na hora
+    monkeypatch.setattr(settings, "DATABASE_URL", "postgresql+asyncpg://u:p@127.0.0.1:1/none")
+
+    async with LifespanManager(app):
+        assert database.current_engine() is not None
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/healthz", headers={"X-Request-ID": "probe-1"})
+            assert response.status_code == 200
+            assert response.headers["x-request-id"] == "probe-1"
+            assert response.json()["pool"]["initialized"] is True
+
+            response = await client.get("/readyz")
+            assert response.status_code == 503
+            assert response.json()["status"] == "unavailable"
+
+    # O shutdown descarta o engine
+    assert database.current_engine() is None
+
+
+@pytest.mark.asyncio
+async def test_startup_fails_fast_without_database_url(monkeypatch):
+    """URL ausente é erro de configuração: o startup falha em vez de tentar um host padrão."""
+    monkeypatch.setattr(settings, "DATABASE_URL", None)
+
+    with pytest.raises(ValueError, match="DATABASE_URL must be set"):
+        async with LifespanManager(app):
+            pass
+    assert database.current_engine() is None
@@ -0,0 +1,50 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.requests import Request
+
+from petfit.api import deps
+from petfit.domain.entities.identity import Identity
+from petfit.api.security import create_access_token
+from petfit.domain.entities.user import User
+from petfit.domain.value_objects.email_vo import Email
+from petfit.domain.value_objects.password import Password
+
+
+@pytest.mark.asyncio
+async def test_stateless_identity_is_built_from_claims_without_password(monkeypatch):
+    monkeypatch.setattr(deps.settings, "JWT_STATELESS_IDENTITY", True)
+    user_repo = AsyncMock()
+    payload = {"sub": "user-1", "name": "Ana", "email": "ana@example.com", "ver": 3}
+
+    identity = await deps.get_current_identity(payload, user_repo)
+
+    # Identity não é um User: nenhum caminho que usa a senha aceita este objeto
+    assert type(identity) is Identity and not isinstance(identity, User)
+    assert (identity.id, identity.name, str(identity.email), identity.token_version) == (
+        "user-1", "Ana", "ana@example.com", 3
+    )
+    user_repo.get_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_optional_viewer_rejects_revoked_tokens(monkeypatch):
+    """O viewer opcional confere a claim "ver" como get_current_user_strict."""
+    monkeypatch.setattr(deps, "user_cache", deps.TTLLRUCache(maxsize=10, ttl=60))
+    user = User("user-1", "Ana", Email("ana@example.com"), MagicMock(spec=Password), token_version=1)
+    user_repo = AsyncMock()
+    user_repo.get_by_id.return_value = user
+
+    request = Request({"type": "http", "method": "GET", "headers": []})
+    current = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token({"sub": "user-1", "ver": 1}))
+    assert await deps.get_optional_viewer_id(request, current, user_repo) == "user-1"
+
+    revoked = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token({"sub": "user-1", "ver": 0}))
+    with pytest.raises(HTTPException) as error:
+        await deps.get_optional_viewer_id(request, revoked, user_repo)
+    assert error.value.status_code == 401
+    # A segunda chamada usou o usuário em cache
+    user_repo.get_by_id.assert_awaited_once_with("user-1")
+    assert await deps.get_optional_viewer_id(request, None, user_repo) is None
@@ -0,0 +1,28 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from petfit.api.middleware import RequestContextMiddleware
+from petfit.infra.log import current_request_id
+
+
+async def _echo(request):
+    return JSONResponse({"request_id": current_request_id()})
+
+
+@pytest.mark.asyncio
+async def test_request_id_is_generated_when_header_is_missing():
+    """Sem X-Request-ID, a resposta leva o mesmo ID gerado para os logs."""
+    app = Starlette(routes=[Route("/", _echo)])
+    app.add_middleware(RequestContextMiddleware)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/")
+        request_id = response.headers["x-request-id"]
+        assert request_id
+        assert response.json()["request_id"] == request_id
+
+        response = await client.get("/", headers={"X-Request-ID": "probe-2"})
+        assert response.headers["x-request-id"] == "probe-2"
@@ -0,0 +1,70 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.requests import Request
+
+from petfit.api import deps
+from petfit.api.routes.user_route import login_user
+from petfit.api.schemas.user_schema import LoginUserInput
+from petfit.api.security import create_access_token
+from petfit.domain.entities.user import User
+from petfit.domain.value_objects.email_vo import Email
+from petfit.domain.value_objects.password import Password
+
+
+def _credentials(user_id: str) -> HTTPAuthorizationCredentials:
+    token = create_access_token(data={"sub": user_id, "ver": 0})
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _request(method: str) -> Request:
+    return Request({"type": "http", "method": method, "headers": []})
+
+
+@pytest.fixture(autouse=True)
+def clear_recent_writers():
+    deps.recent_writers.clear()
+    yield
+    deps.recent_writers.clear()
+
+
+@pytest.mark.asyncio
+async def test_writes_route_the_writer_reads_to_primary():
+    credentials = _credentials("user-1")
+
+    # Leitura não abre a janela
+    await deps.get_token_payload(_request("GET"), credentials)
+    assert not deps.reads_from_primary(credentials)
+
+    await deps.get_token_payload(_request("POST"), credentials)
+    assert deps.reads_from_primary(credentials)
+    # Só o autor da escrita lê do primário
+    assert not deps.reads_from_primary(_credentials("user-2"))
+
+
+def test_anonymous_and_invalid_tokens_read_from_replica():
+    deps.recent_writers.set("user-1", True)
+    assert not deps.reads_from_primary(None)
+    assert not deps.reads_from_primary(
+        HTTPAuthorizationCredentials(scheme="Bearer", credentials="not-a-jwt")
+    )
+
+
+@pytest.mark.asyncio
+async def test_login_routes_the_new_user_reads_to_primary():
+    """Login não leva token: a janela é aberta na rota, antes da primeira leitura."""
+    user = User("user-1", "Ana", Email("ana@example.com"), MagicMock(spec=Password))
+    user_repo = AsyncMock()
+    user_repo.login.return_value = user
+    password_hasher = MagicMock()
+    password_hasher.verify = AsyncMock(return_value=True)
+    password_hasher.needs_rehash.return_value = False
+
+    response = await login_user(
+        LoginUserInput(email="ana@example.com", password="Teste123@!"), user_repo, password_hasher
+    )
+
+    assert deps.reads_from_primary(
+        HTTPAuthorizationCredentials(scheme="Bearer", credentials=response.access_token)
+    )
@@ -0,0 +1,84 @@
+import pytest
+
+from petfit.api import recipe_import
+from petfit.api.recipe_import import format_from_content_type, iter_lines, parse_recipe_rows
+
+
+async def _chunks(data: bytes, size: int = 7):
+    # Pedaços pequenos para quebrar linhas e caracteres multibyte no meio
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+async def _rows(data: bytes, fmt: str):
+    return [row async for row in parse_recipe_rows(_chunks(data), fmt)]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_reassembles_split_chunks():
+    data = "\ufeffpão de queijo\r\nmaçã\nfim".encode("utf-8")
+    assert [line async for line in iter_lines(_chunks(data, 3))] == ["pão de queijo", "maçã", "fim"]
+
+
+@pytest.mark.asyncio
+async def test_parse_ndjson_reports_errors_per_line():
+    data = (
+        b'{"title": "Bolo", "ingredients": ["farinha"], "instructions": ["Asse."]}\n'
+        b"\n"
+        b"{not json}\n"
+        b'{"title": "X", "ingredients": [], "instructions": ["Asse."]}\n'
+        b"[1, 2]\n"
+    )
+    rows = await _rows(data, "ndjson")
+
+    assert [row.row for row in rows] == [1, 3, 4, 5]
+    assert rows[0].recipe.title == "Bolo" and rows[0].error is None
+    assert rows[1].error.startswith("Invalid JSON")
+    assert "title" in rows[2].error and "ingredients" in rows[2].error
+    assert rows[3].error == "Each line must be a JSON object."
+
+
+@pytest.mark.asyncio
+async def test_parse_csv_splits_lists_and_handles_quoted_newlines():
+    data = (
+        "title,ingredients,instructions,is_public\n"
+        'Pão,farinha|fermento| água ,"Sove.\nAsse.|Sirva.",false\n'
+        "Bolo,ovo,Asse.,\n"
+        "Curta,ovo\n"
+    ).encode("utf-8")
+    rows = await _rows(data, "csv")
+
+    assert [row.row for row in rows] == [2, 4, 5]
+    assert rows[0].recipe.ingredients == ["farinha", "fermento", "água"]
+    assert rows[0].recipe.instructions == ["Sove.\nAsse.", "Sirva."]
+    assert rows[0].recipe.is_public is False
+    assert rows[1].recipe.is_public is True
+    assert rows[2].error == "Expected 4 columns, got 2."
+
+
+@pytest.mark.asyncio
+async def test_parse_csv_bounds_records_with_unbalanced_quotes(monkeypatch):
+    monkeypatch.setattr(recipe_import, "MAX_RECORD_LENGTH", 40)
+    data = (
+        "title,ingredients,instructions\n"
+        'Bolo,"ovo,Asse.\n'
+        + "x" * 30 + "\n"
+        "Pão,farinha,Asse.\n"
+    ).encode("utf-8")
+    rows = await _rows(data, "csv")
+
+    assert [row.row for row in rows] == [2, 4]
+    assert rows[0].error == "Record longer than 40 characters (unbalanced quote?)."
+    assert rows[1].recipe.title == "Pão"
+
+
+@pytest.mark.asyncio
+async def test_parse_csv_requires_header_columns():
+    with pytest.raises(ValueError, match="missing columns: instructions"):
+        await _rows(b"title,ingredients\nBolo,ovo\n", "csv")
+
+
+def test_format_from_content_type():
+    assert format_from_content_type("text/csv; charset=utf-8") == "csv"
+    assert format_from_content_type("application/x-ndjson") == "ndjson"
+    assert format_from_content_type(None) == "ndjson"
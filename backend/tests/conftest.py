@@ -64,10 +64,16 @@ async def client(setup_engine):
             yield session
 
     app.dependency_overrides[deps.get_db_session] = override_get_db_session
+    app.dependency_overrides[deps.get_read_db_session] = override_get_db_session
+    app.dependency_overrides[deps.get_session_factory] = lambda: async_session
+    app.dependency_overrides[deps.get_read_session_factory] = lambda: async_session
 
     async with LifespanManager(app):
         transport = ASGITransport(app=app)
         async with AsyncClient(transport=transport, base_url="http://test") as ac:
             yield ac
 
-    app.dependency_overrides.clear()
\ No newline at end of file
+    app.dependency_overrides.clear()
+    deps.user_cache.clear()
+    deps.recent_writers.clear()
+    deps.popular_cache.clear()
\ No newline at end of file
@@ -1,6 +1,9 @@
 import pytest
 from petfit.domain.value_objects.email_vo import Email
 from petfit.domain.value_objects.password import Password, PasswordValidationError
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.domain.value_objects.ingredient_filter import IngredientFilter
+from petfit.infra.services.executor_password_hasher import ExecutorPasswordHasher
 import bcrypt
 from pydantic import BaseModel, ValidationError
 
@@ -14,6 +17,30 @@ def test_invalid_email():
     with pytest.raises(ValueError):
         Email("invalid-email")
 
+def test_cursor_roundtrip():
+    cursor = Cursor(sort="-created_at", value="2025-07-17T19:46:17+00:00", id="recipe-1")
+    token = cursor.encode()
+    assert "=" not in token
+    assert Cursor.decode(token) == cursor
+
+
+def test_invalid_cursor():
+    with pytest.raises(ValueError):
+        Cursor.decode("nao-e-um-cursor")
+
+# Testes para o filtro de ingredientes
+def test_ingredient_filter_normalizes_terms():
+    f = IngredientFilter(all_of=[" frango", "arroz", "frango", ""], none_of=["trigo"])
+    assert f.all_of == ("frango", "arroz")
+    assert not f.is_empty()
+    assert f == IngredientFilter(all_of=["arroz", "frango"], none_of=["trigo"])
+    assert IngredientFilter().is_empty()
+
+
+def test_ingredient_filter_rejects_contradiction():
+    with pytest.raises(ValueError):
+        IngredientFilter(all_of=["trigo"], none_of=["trigo"])
+
 # Testes para a validação da senha (método _is_valid)
 def test_password_valid_creation():
     """Deve criar uma instância de Password com uma senha válida."""
@@ -71,6 +98,26 @@ def test_password_verification_different_hash_same_password():
     assert password1.verify("SenhaUnica111") is True
     assert password2.verify("SenhaUnica111") is True
 
+@pytest.mark.asyncio
+async def test_executor_password_hasher_roundtrip():
+    """O hash gerado fora do event loop deve ser verificável pelo próprio Password."""
+    hasher = ExecutorPasswordHasher(max_workers=1)
+    try:
+        password = await hasher.hash("SenhaNoPool123")
+        assert password.hashed_value().startswith("$2b$")
+        assert await hasher.verify(password, "SenhaNoPool123") is True
+        assert await hasher.verify(password, "SenhaErrada123") is False
+        with pytest.raises(ValueError):
+            await hasher.hash("curta")
+    finally:
+        hasher.shutdown()
+
+def test_password_rounds_from_hash():
+    """O custo do bcrypt deve ser lido do próprio hash."""
+    hashed = bcrypt.hashpw(b"SenhaCusto123", bcrypt.gensalt(5)).decode('utf-8')
+    assert Password(hashed, hashed=True).rounds() == 5
+    assert Password("nao_e_bcrypt", hashed=True).rounds() is None
+
 # Testes para o construtor com 'hashed=True'
 def test_password_creation_with_prehashed():
     """Deve criar Password a partir de um hash existente."""
@@ -0,0 +1,49 @@
+from petfit.infra.cache import TTLLRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_hit_and_miss_counters():
+    cache = TTLLRUCache(maxsize=2, ttl=10, clock=FakeClock())
+    assert cache.get("user-1") is None
+    cache.set("user-1", "Ana")
+    assert cache.get("user-1") == "Ana"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLLRUCache(maxsize=2, ttl=10, clock=clock)
+    cache.set("user-1", "Ana")
+    clock.now = 10.0
+    assert cache.get("user-1") is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLLRUCache(maxsize=2, ttl=10, clock=FakeClock())
+    cache.set("user-1", "Ana")
+    cache.set("user-2", "Bia")
+    cache.get("user-1")  # user-2 passa a ser o menos usado
+    cache.set("user-3", "Caio")
+    assert cache.get("user-2") is None
+    assert cache.get("user-1") == "Ana"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_invalidate_and_disabled():
+    cache = TTLLRUCache(maxsize=2, ttl=10, clock=FakeClock())
+    cache.set("user-1", "Ana")
+    cache.invalidate("user-1")
+    assert cache.get("user-1") is None
+
+    disabled = TTLLRUCache(maxsize=0, ttl=10)
+    disabled.set("user-1", "Ana")
+    assert disabled.get("user-1") is None
@@ -0,0 +1,62 @@
+import json
+
+from petfit.infra.log import (
+    begin_request,
+    configure_logging,
+    end_request,
+    get_logger,
+    shutdown_logging,
+)
+
+
+def _records(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_logger_writes_json_from_background_thread(capsys):
+    configure_logging("DEBUG")
+    try:
+        tokens = begin_request(sample_rate=1.0, request_id="req-1")
+        try:
+            get_logger("test").info("Receita criada", extra={"recipe_id": "r1"})
+        finally:
+            end_request(tokens)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            get_logger("test").exception("Falhou")
+    finally:
+        shutdown_logging()  # Esvazia a fila antes de ler a saída
+
+    first, second = _records(capsys)
+    assert first["message"] == "Receita criada"
+    assert first["level"] == "INFO" and first["logger"] == "petfit.test"
+    assert first["request_id"] == "req-1" and first["recipe_id"] == "r1"
+    assert second["level"] == "ERROR" and "ValueError: boom" in second["exception"]
+    assert "request_id" not in second
+
+
+def test_debug_lines_are_sampled_per_request(capsys):
+    configure_logging("DEBUG")
+    try:
+        tokens = begin_request(sample_rate=0.0)
+        try:
+            get_logger("test").debug("descartada")
+            get_logger("test").info("mantida")
+        finally:
+            end_request(tokens)
+    finally:
+        shutdown_logging()
+
+    assert [r["message"] for r in _records(capsys)] == ["mantida"]
+
+
+def test_level_gating(capsys):
+    configure_logging("WARNING")
+    try:
+        get_logger("test").info("abaixo do nível")
+        get_logger("test").warning("acima do nível")
+    finally:
+        shutdown_logging()
+
+    assert [r["message"] for r in _records(capsys)] == ["acima do nível"]
@@ -0,0 +1,65 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from petfit.api.main import app
+from petfit.infra.metrics import Counter, Histogram, MetricsRegistry, registry
+
+
+def test_histogram_renders_cumulative_buckets():
+    local = MetricsRegistry()
+    histogram = local.histogram("latency_seconds", "Latência.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe("/x", value=value)
+    counter = local.counter("hits_total", "Acertos.", ("route",))
+    counter.inc('/a"b')
+
+    text = local.render()
+    assert 'latency_seconds_bucket{route="/x",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/x",le="1"} 3' in text
+    assert 'latency_seconds_bucket{route="/x",le="+Inf"} 4' in text
+    assert 'latency_seconds_count{route="/x"} 4' in text
+    assert 'latency_seconds_sum{route="/x"} 4.25' in text
+    assert 'hits_total{route="/a\\"b"} 1' in text
+    assert "# TYPE latency_seconds histogram" in text
+
+
+@pytest.mark.asyncio
+async def test_middleware_labels_requests_by_route_template():
+    registry.clear()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/healthz")
+        await client.get("/does-not-exist")
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert 'petfit_http_requests_total{method="GET",route="/healthz",status="200"} 1' in text
+    assert 'petfit_http_requests_total{method="GET",route="unmatched",status="404"} 1' in text
+    assert 'petfit_db_queries_per_request_count{method="GET",route="/healthz"} 1' in text
+    assert 'petfit_cache_hits_total{cache="user"}' in text
+
+
+def test_query_hooks_accumulate_into_current_request_stats():
+    from sqlalchemy import create_engine, text
+
+    from petfit.infra.metrics import QueryStats, current_query_stats, install_query_hooks
+
+    install_query_hooks()
+    engine = create_engine("sqlite://")
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+    finally:
+        current_query_stats.reset(token)
+
+    # Fora de uma requisição nada é contabilizado
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 3"))
+
+    assert stats.count == 2
+    assert stats.seconds > 0
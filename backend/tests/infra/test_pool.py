@@ -0,0 +1,116 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import asyncpg
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlalchemy.util import greenlet_spawn
+
+from petfit.infra.settings import DatabaseSettings
+from petfit.infra.database import engine_options, warm_up
+from petfit.infra.pool import InstrumentedAsyncAdaptedQueuePool, PoolMetrics, pool_metrics
+
+
+@pytest.fixture
+def metrics():
+    pool_metrics.reset()
+    yield pool_metrics
+    pool_metrics.reset()
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_records_checkouts_and_timeouts(metrics):
+    # Como no engine assíncrono, o pool roda dentro de um greenlet
+    await greenlet_spawn(_exercise_pool, metrics)
+
+
+def _exercise_pool(metrics):
+    pool = InstrumentedAsyncAdaptedQueuePool(
+        creator=lambda: MagicMock(), pool_size=1, max_overflow=0, timeout=0.01
+    )
+    waits = []
+    metrics.subscribe(waits.append)
+    try:
+        connection = pool.connect()
+        stats = metrics.snapshot(pool)
+        assert stats["checkouts"] == 1 and stats["in_use"] == 1 and stats["overflow"] == 0
+        assert len(waits) == 1
+
+        # Pool cheio e sem overflow: o segundo checkout estoura o timeout
+        with pytest.raises(exc.TimeoutError):
+            pool.connect()
+        assert metrics.timeouts == 1
+
+        connection.close()
+        assert metrics.snapshot(pool)["in_use"] == 0
+    finally:
+        metrics.unsubscribe(waits.append)
+
+
+def test_pool_metrics_tracks_max_wait():
+    metrics = PoolMetrics()
+    metrics.record_checkout(0.2)
+    metrics.record_checkout(0.05)
+    assert metrics.checkouts == 2
+    assert metrics.wait_seconds_max == 0.2
+    assert metrics.wait_seconds_total == pytest.approx(0.25)
+
+
+def test_engine_options_pgbouncer_disables_statement_caches():
+    options = engine_options(DatabaseSettings(DB_PGBOUNCER=True, DB_POOL_SIZE=20))
+    assert options["echo"] is False
+    assert options["pool_size"] == 20
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert options["connect_args"]["prepared_statement_cache_size"] == 0
+    assert callable(options["connect_args"]["prepared_statement_name_func"])
+
+
+@pytest.mark.asyncio
+async def test_statement_cache_size_sizes_the_adapter_prepared_statement_cache(monkeypatch):
+    received = {}
+
+    async def fake_asyncpg_connect(*args, **kwargs):
+        received.update(kwargs)
+        return MagicMock()
+
+    monkeypatch.setattr(asyncpg, "connect", fake_asyncpg_connect)
+    options = engine_options(DatabaseSettings(DB_STATEMENT_CACHE_SIZE=7))
+    engine = create_async_engine("postgresql+asyncpg://u:p@localhost/db", **options)
+    # Mesmo caminho de conexão do pool (connect_args incluídos), mas sem a
+    # inicialização do dialeto, que precisaria de um banco
+    adapter = await greenlet_spawn(engine.sync_engine.pool._creator)
+    assert adapter._prepared_statement_cache.capacity == 7
+    # Consumido pelo adaptador, não repassado ao asyncpg.connect
+    assert "prepared_statement_cache_size" not in received
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_skips_pools_without_size():
+    # NullPool não guarda conexões: nada a aquecer e nenhuma conexão aberta
+    engine = create_async_engine("postgresql+asyncpg://u:p@127.0.0.1:1/none", poolclass=NullPool)
+    assert await warm_up(engine, 5) == 0
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_closes_opened_connections_when_one_fails():
+    opened = [MagicMock(spec=AsyncConnection, close=AsyncMock()) for _ in range(2)]
+    results = iter([opened[0], OSError("connection refused"), opened[1]])
+
+    async def connect():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    engine = MagicMock()
+    engine.pool.size.return_value = 3
+    engine.connect.side_effect = connect
+
+    with pytest.raises(OSError):
+        await warm_up(engine, 3)
+    for conn in opened:
+        conn.close.assert_awaited_once()
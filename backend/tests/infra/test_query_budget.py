@@ -0,0 +1,35 @@
+import logging
+
+from petfit.infra.metrics import QueryStats, db_n_plus_one_total, registry, statement_shape
+from petfit.infra.query_budget import budget_violations, report_query_budget
+
+
+def test_statement_shape_ignores_literals_and_parameters():
+    first = statement_shape("SELECT * FROM recipes WHERE id = $1::VARCHAR AND x IN ($2, $3)")
+    second = statement_shape("SELECT *\n  FROM recipes WHERE id = 'abc'::VARCHAR AND x IN (7)")
+    assert first == second == "SELECT * FROM recipes WHERE id = ?::VARCHAR AND x IN (?)"
+
+
+def test_budget_violations_flag_total_and_repeated_shapes():
+    stats = QueryStats(track_shapes=True)
+    stats.record("SELECT * FROM users WHERE id = $1", 0.0)
+    for _ in range(3):
+        stats.record("SELECT * FROM recipes WHERE user_id = $1", 0.0)
+
+    assert budget_violations(stats, max_queries=4, max_repeats=3) == []
+    problems = budget_violations(stats, max_queries=2, max_repeats=1)
+    assert problems[0] == "4 queries (budget: 2)"
+    assert "repeated 3x" in problems[1] and "recipes WHERE user_id = ?" in problems[1]
+
+
+def test_report_query_budget_logs_and_counts_n_plus_one(caplog):
+    registry.clear()
+    stats = QueryStats(track_shapes=True)
+    for _ in range(5):
+        stats.record("SELECT * FROM favorites WHERE recipe_id = $1", 0.0)
+
+    with caplog.at_level(logging.WARNING, logger="petfit.db.budget"):
+        report_query_budget("GET", "/recipes/recipes", stats, max_queries=10, n_plus_one_threshold=5)
+
+    assert db_n_plus_one_total.value("GET", "/recipes/recipes") == 1
+    assert [r.repeats for r in caplog.records] == [5]
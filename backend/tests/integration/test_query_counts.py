@@ -0,0 +1,217 @@
+import uuid
+
+import pytest
+
+from petfit.infra.models.recipe_model import RecipeModel
+from petfit.infra.query_budget import query_budget
+
+# Orçamento por rota: (método, caminho) -> máximo de queries; nenhum statement
+# pode se repetir dentro de uma requisição (max_repeats=1), o que pega N+1
+# mesmo quando o total ainda cabe no orçamento.
+ROUTE_BUDGETS = {
+    ("GET", "/recipes/recipes"): 2,  # versão do catálogo + página
+    ("GET", "/recipes/recipes/{recipe_id}"): 2,  # versão da receita + receita
+    ("GET", "/recipes/search"): 1,
+    ("GET", "/recipes/popular"): 1,
+    ("GET", "/recipes/users/me/favorites/recipes"): 1,
+    ("GET", "/recipes/users/me/favorites/ids"): 1,
+    ("GET", "/users/me"): 1,
+}
+
+
+async def _seed_recipes(db_session, total):
+    recipes = [
+        RecipeModel(
+            id=str(uuid.uuid4()),
+            title=f"Receita {i}",
+            ingredients=["frango", "arroz"],
+            instructions=["Cozinhe tudo."],
+            is_public=True,
+        )
+        for i in range(total)
+    ]
+    db_session.add_all(recipes)
+    await db_session.commit()
+    return [r.id for r in recipes]
+
+
+async def _login(client):
+    await client.post(
+        "/users/register",
+        json={"name": "Query", "email": "query@example.com", "password": "Teste123@!"},
+    )
+    response = await client.post(
+        "/users/login", json={"email": "query@example.com", "password": "Teste123@!"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_endpoints_do_not_eager_load_relationships(client, setup_engine, db_session):
+    """Cada endpoint deve emitir um número fixo de queries, independente dos favoritos."""
+    engine, _ = setup_engine
+    recipe_ids = await _seed_recipes(db_session, 5)
+    headers = await _login(client)
+
+    # Primeira resolução do usuário vai ao banco; as seguintes vêm do cache
+    with query_budget(engine, max_repeats=1) as stats:
+        response = await client.get("/users/me", headers=headers)
+    assert response.status_code == 200
+    assert stats.count == 1
+
+    for recipe_id in recipe_ids:
+        with query_budget(engine, max_repeats=1) as stats:
+            response = await client.post(f"/recipes/recipes/{recipe_id}/favorite", headers=headers)
+        assert response.status_code == 200
+        assert stats.count == 1
+
+    with query_budget(engine, max_repeats=1) as stats:
+        response = await client.get("/users/me", headers=headers)
+    assert stats.count == 0
+
+    with query_budget(engine, max_repeats=1) as stats:
+        response = await client.get("/recipes/recipes")
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 5
+    assert stats.count == 2  # versão do catálogo + página
+
+    with query_budget(engine, max_repeats=1) as stats:
+        response = await client.get(f"/recipes/recipes/{recipe_ids[0]}")
+    assert response.status_code == 200
+    assert stats.count == 2  # versão da receita + receita
+
+    with query_budget(engine, max_repeats=1) as stats:
+        response = await client.get("/recipes/users/me/favorites/recipes", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 5
+    assert stats.count == 1
+
+    with query_budget(engine, max_repeats=1) as stats:
+        response = await client.delete(f"/recipes/recipes/{recipe_ids[0]}/favorite", headers=headers)
+    assert response.status_code == 200
+    assert stats.count == 1
+
+
+@pytest.mark.asyncio
+async def test_write_endpoints_use_single_returning_statement(client, setup_engine):
+    """Escritas devem sair em um único statement com RETURNING (mais autenticação e versão do catálogo)."""
+    engine, _ = setup_engine
+
+    with query_budget(engine, max_repeats=1) as stats:
+        response = await client.post(
+            "/users/register",
+            json={"name": "Writer", "email": "writer@example.com", "password": "Teste123@!"},
+        )
+    assert response.status_code == 201
+    assert stats.count == 2  # checagem de email + INSERT ... RETURNING
+
+    response = await client.post(
+        "/users/login", json={"email": "writer@example.com", "password": "Teste123@!"}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    recipe = {"title": "Bolo", "ingredients": ["farinha", "ovo"], "instructions": ["Asse."]}
+
+    with query_budget(engine, max_repeats=1) as stats:
+        response = await client.post("/recipes/recipes", json=recipe)
+    assert response.status_code == 201
+    assert response.json()["ingredients"] == ["farinha", "ovo"]
+    assert stats.count == 2  # INSERT ... RETURNING + versão do catálogo
+    recipe_id = response.json()["id"]
+
+    with query_budget(engine, max_repeats=1) as stats:
+        response = await client.put(
+            f"/recipes/recipes/{recipe_id}", json={**recipe, "title": "Bolo de Fubá"}, headers=headers
+        )
+    assert response.status_code == 200
+    assert response.json()["title"] == "Bolo de Fubá"
+    assert stats.count == 3  # usuário (revogação) + UPDATE ... RETURNING + catálogo
+
+    with query_budget(engine, max_repeats=1) as stats:
+        response = await client.delete(f"/recipes/recipes/{recipe_id}", headers=headers)
+    assert response.status_code == 200
+    assert stats.count == 3  # usuário (revogação) + DELETE ... RETURNING + catálogo
+
+
+@pytest.mark.asyncio
+async def test_conditional_reads_return_304_without_loading_recipes(client, setup_engine, db_session):
+    """If-None-Match com o ETag atual responde 304 com uma única query de versão."""
+    engine, _ = setup_engine
+    recipe_ids = await _seed_recipes(db_session, 3)
+
+    response = await client.get("/recipes/recipes")
+    etag = response.headers["ETag"]
+    with query_budget(engine, max_repeats=1) as stats:
+        response = await client.get("/recipes/recipes", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert stats.count == 1
+
+    # Outros parâmetros geram outro ETag
+    response = await client.get("/recipes/recipes?limit=1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+    response = await client.get(f"/recipes/recipes/{recipe_ids[0]}")
+    detail_etag = response.headers["ETag"]
+    with query_budget(engine, max_repeats=1) as stats:
+        response = await client.get(f"/recipes/recipes/{recipe_ids[0]}", headers={"If-None-Match": detail_etag})
+    assert response.status_code == 304
+    assert stats.count == 1
+
+    # Uma escrita invalida os ETags da listagem
+    await client.post(
+        "/recipes/recipes",
+        json={"title": "Nova", "ingredients": ["ovo"], "instructions": ["Frite."]},
+    )
+    response = await client.get("/recipes/recipes", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method,route", sorted(ROUTE_BUDGETS))
+async def test_route_query_budgets(client, setup_engine, db_session, method, route):
+    """Cada rota de leitura cabe no seu orçamento, com 1 ou com muitos registros."""
+    engine, _ = setup_engine
+    recipe_ids = await _seed_recipes(db_session, 25)
+    headers = await _login(client)
+    for recipe_id in recipe_ids:
+        await client.post(f"/recipes/recipes/{recipe_id}/favorite", headers=headers)
+
+    path = route.format(recipe_id=recipe_ids[0])
+    params = {"q": "receita"} if route == "/recipes/search" else None
+    with query_budget(engine, max_queries=ROUTE_BUDGETS[(method, route)], max_repeats=1):
+        # Leituras públicas anônimas; as autenticadas têm teste próprio abaixo
+        response = await client.request(
+            method, path, params=params, headers=headers if "/users/me" in route else None
+        )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_authenticated_reads_annotate_favorites_in_one_query(client, setup_engine, db_session):
+    """Com token, lista e detalhe trazem is_favorite/favorite_count em uma única query."""
+    engine, _ = setup_engine
+    recipe_ids = await _seed_recipes(db_session, 3)
+    headers = await _login(client)
+    await client.post(f"/recipes/recipes/{recipe_ids[0]}/favorite", headers=headers)
+
+    with query_budget(engine, max_queries=1):
+        response = await client.get("/recipes/recipes", headers=headers)
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    state = {item["id"]: (item["is_favorite"], item["favorite_count"]) for item in response.json()["items"]}
+    assert state[recipe_ids[0]] == (True, 1)
+    assert state[recipe_ids[1]] == (False, 0)
+
+    with query_budget(engine, max_queries=1):
+        response = await client.get(f"/recipes/recipes/{recipe_ids[0]}", headers=headers)
+    assert (response.json()["is_favorite"], response.json()["favorite_count"]) == (True, 1)
+
+    # Anônimo continua sem anotações (e com ETag)
+    response = await client.get(f"/recipes/recipes/{recipe_ids[0]}")
+    assert response.json()["is_favorite"] is None
+    assert "ETag" in response.headers
+
+    response = await client.get("/recipes/recipes", headers={"Authorization": "Bearer invalid"})
+    assert response.status_code == 401
@@ -0,0 +1,317 @@
+import json
+import uuid
+
+import pytest
+
+from petfit.api import deps
+from petfit.domain.entities.identity import Identity
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.value_objects.email_vo import Email
+from petfit.infra.models.recipe_model import RecipeModel
+from petfit.infra.repositories.sqlalchemy.sqlalchemy_recipe_repository import SQLAlchemyRecipeRepository
+from petfit.usecases.recipe.rollup_favorite_counts import RollupFavoriteCountsUseCase
+
+
+async def _seed(db_session, *recipes):
+    models = [
+        RecipeModel(id=str(uuid.uuid4()), title=title, ingredients=ingredients,
+                    instructions=["Misture e sirva."], is_public=is_public)
+        for title, ingredients, is_public in recipes
+    ]
+    db_session.add_all(models)
+    await db_session.commit()
+    return [m.id for m in models]
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_title_matches_first_and_paginates(client, db_session):
+    """Título pesa mais que ingrediente; receitas privadas não aparecem."""
+    title_hit, ingredient_hit, _, _ = await _seed(
+        db_session,
+        ("Frango assado", ["batata", "alho"], True),
+        ("Arroz completo", ["arroz", "frango desfiado"], True),
+        ("Salada verde", ["alface", "tomate"], True),
+        ("Frango secreto", ["frango"], False),
+    )
+
+    response = await client.get("/recipes/search", params={"q": "frango", "limit": 1})
+    assert response.status_code == 200
+    body = response.json()
+    assert [r["id"] for r in body["items"]] == [title_hit]
+    assert body["next_cursor"]
+
+    response = await client.get(
+        "/recipes/search", params={"q": "frango", "limit": 1, "after": body["next_cursor"]}
+    )
+    body = response.json()
+    assert [r["id"] for r in body["items"]] == [ingredient_hit]
+    assert body["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_search_rejects_listing_cursor(client):
+    listing_cursor = "WyJ0aXRsZSIsIkJvbG8iLCJpZCJd"  # ["title","Bolo","id"]
+    response = await client.get("/recipes/search", params={"q": "bolo", "after": listing_cursor})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_filters_by_ingredients(client, db_session):
+    """with/any/without_ingredients mapeiam para @>, && e NOT &&."""
+    chicken_rice, chicken_only, pasta = await _seed(
+        db_session,
+        ("Galinhada", ["frango", "arroz", "açafrão"], True),
+        ("Frango grelhado", ["frango", "limão"], True),
+        ("Macarrão", ["trigo", "ovo"], True),
+    )
+
+    async def ids(**params):
+        response = await client.get("/recipes/recipes", params=params)
+        assert response.status_code == 200
+        return {r["id"] for r in response.json()["items"]}
+
+    assert await ids(with_ingredients=["frango", "arroz"]) == {chicken_rice}
+    assert await ids(any_ingredients=["arroz", "limão"]) == {chicken_rice, chicken_only}
+    assert await ids(without_ingredients=["trigo"]) == {chicken_rice, chicken_only}
+    assert await ids(with_ingredients="frango", without_ingredients="limão") == {chicken_rice}
+
+    response = await client.get(
+        "/recipes/recipes", params={"with_ingredients": "trigo", "without_ingredients": "trigo"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_streams_public_catalog(client, db_session):
+    """Uma linha JSON por receita pública, em ordem de ID."""
+    public_ids = await _seed(
+        db_session,
+        ("Bolo", ["farinha"], True),
+        ("Pão", ["farinha", "fermento"], True),
+    )
+    await _seed(db_session, ("Privada", ["sal"], False))
+
+    response = await client.get("/recipes/export.ndjson")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["id"] for r in lines] == sorted(public_ids)
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_ndjson(client):
+    await client.post(
+        "/users/register",
+        json={"name": "Importer", "email": "importer@example.com", "password": "Teste123@!"},
+    )
+    response = await client.post(
+        "/users/login", json={"email": "importer@example.com", "password": "Teste123@!"}
+    )
+    headers = {
+        "Authorization": f"Bearer {response.json()['access_token']}",
+        "Content-Type": "application/x-ndjson",
+    }
+    body = "\n".join(
+        [json.dumps({"title": f"Receita {i}", "ingredients": ["ovo"], "instructions": ["Frite."]}) for i in range(5)]
+        + ['{"title": "Sem ingredientes", "instructions": ["Nada."]}']
+    )
+
+    response = await client.post("/recipes/import", content=body, headers=headers)
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["total"], report["imported"], report["failed"]) == (6, 5, 1)
+    assert report["errors"][0]["row"] == 6
+
+    response = await client.get("/recipes/recipes")
+    assert len(response.json()["items"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_batch_favorites_reports_outcome_per_id(client, db_session):
+    first, second = await _seed(db_session, ("Bolo", ["ovo"], True), ("Pão", ["farinha"], True))
+    await client.post(
+        "/users/register",
+        json={"name": "Sync", "email": "sync@example.com", "password": "Teste123@!"},
+    )
+    response = await client.post(
+        "/users/login", json={"email": "sync@example.com", "password": "Teste123@!"}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    await client.post(f"/recipes/recipes/{second}/favorite", headers=headers)
+
+    response = await client.post(
+        "/recipes/users/me/favorites/recipes/batch",
+        json={"add": [first, second, "missing"], "remove": ["other"]},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        {"recipe_id": first, "outcome": "added"},
+        {"recipe_id": second, "outcome": "already_favorite"},
+        {"recipe_id": "missing", "outcome": "not_found"},
+        {"recipe_id": "other", "outcome": "not_favorite"},
+    ]
+
+    response = await client.get("/recipes/users/me/favorites/ids", headers=headers)
+    assert response.json() == sorted([first, second])
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert response.headers["Vary"] == "Authorization"
+    response = await client.get(
+        "/recipes/users/me/favorites/ids", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    response = await client.post(
+        "/recipes/users/me/favorites/recipes/batch", json={"remove": [first, second]}, headers=headers
+    )
+    assert [r["outcome"] for r in response.json()["results"]] == ["removed", "removed"]
+    response = await client.get("/recipes/users/me/favorites/recipes", headers=headers)
+    assert response.json()["items"] == []
+    response = await client.get(
+        "/recipes/users/me/favorites/ids", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_batch_favorites_failed_remove_leaves_adds_unapplied(client, db_session, monkeypatch):
+    """O lote é uma transação só: se o DELETE falha, o INSERT também é desfeito."""
+    (recipe_id,) = await _seed(db_session, ("Bolo", ["ovo"], True))
+    await client.post(
+        "/users/register",
+        json={"name": "Atomic", "email": "atomic@example.com", "password": "Teste123@!"},
+    )
+    response = await client.post(
+        "/users/login", json={"email": "atomic@example.com", "password": "Teste123@!"}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    me = (await client.get("/users/me", headers=headers)).json()
+    user = Identity(id=me["id"], name=me["name"], email=Email(me["email"]))
+
+    async def failing_delete(self, user, recipe_ids):
+        raise RuntimeError("delete failed")
+
+    monkeypatch.setattr(SQLAlchemyRecipeRepository, "_delete_favorites", failing_delete)
+    with pytest.raises(RuntimeError):
+        await SQLAlchemyRecipeRepository(db_session).update_favorites(user, [recipe_id], ["other"])
+
+    response = await client.get("/recipes/users/me/favorites/ids", headers=headers)
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_revoked_token_gets_no_private_annotations(client, db_session):
+    (recipe_id,) = await _seed(db_session, ("Bolo", ["ovo"], True))
+    await client.post(
+        "/users/register",
+        json={"name": "Revoked", "email": "revoked@example.com", "password": "Teste123@!"},
+    )
+    response = await client.post(
+        "/users/login", json={"email": "revoked@example.com", "password": "Teste123@!"}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    response = await client.get(f"/recipes/recipes/{recipe_id}", headers=headers)
+    assert response.json()["is_favorite"] is False
+
+    await client.post("/users/me/tokens/revoke", headers=headers)
+    response = await client.get(f"/recipes/recipes/{recipe_id}", headers=headers)
+    assert response.status_code == 401
+    response = await client.get("/recipes/recipes", headers=headers)
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_recipe_writes_bump_catalog_version_in_the_same_transaction(db_session):
+    repo = SQLAlchemyRecipeRepository(db_session)
+    before = await repo.get_catalog_version()
+
+    recipe = await repo.create(Recipe(id=str(uuid.uuid4()), title="Bolo", ingredients=["ovo"], instructions=["Asse."]))
+    assert await repo.get_catalog_version() == before + 1
+    recipe.title = "Bolo de fubá"
+    await repo.update(recipe)
+    assert await repo.delete(recipe.id)
+    assert await repo.get_catalog_version() == before + 3
+
+    # Escrita sem efeito não invalida os ETags
+    assert not await repo.delete("missing")
+    assert await repo.get_catalog_version() == before + 3
+
+
+@pytest.mark.asyncio
+async def test_favorite_missing_recipe_is_reported_by_constraint_name(client):
+    """O erro de FK é identificado pela constraint, não pelo texto (que ecoa o recipe_id)."""
+    await client.post(
+        "/users/register",
+        json={"name": "Fk", "email": "fk@example.com", "password": "Teste123@!"},
+    )
+    response = await client.post("/users/login", json={"email": "fk@example.com", "password": "Teste123@!"})
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    response = await client.post("/recipes/recipes/user_id-missing/favorite", headers=headers)
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Recipe with ID user_id-missing not found."
+
+
+@pytest.mark.asyncio
+async def test_favorites_page_by_most_recently_favorited(client, db_session):
+    ids = await _seed(db_session, *[(f"Receita {i}", ["ovo"], True) for i in range(5)])
+    await client.post(
+        "/users/register",
+        json={"name": "Pager", "email": "pager@example.com", "password": "Teste123@!"},
+    )
+    response = await client.post(
+        "/users/login", json={"email": "pager@example.com", "password": "Teste123@!"}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    # Um favorito por transação: cada um recebe um created_at diferente
+    for recipe_id in ids:
+        await client.post(f"/recipes/recipes/{recipe_id}/favorite", headers=headers)
+
+    seen, after = [], None
+    while True:
+        params = {"limit": 2, **({"after": after} if after else {})}
+        response = await client.get("/recipes/users/me/favorites/recipes", params=params, headers=headers)
+        assert response.status_code == 200
+        body = response.json()
+        seen += [item["id"] for item in body["items"]]
+        after = body["next_cursor"]
+        if after is None:
+            break
+    assert seen == list(reversed(ids))
+
+    response = await client.get(
+        "/recipes/users/me/favorites/recipes", params={"after": "not-a-cursor"}, headers=headers
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_popular_ranks_by_rolled_up_favorite_count(client, db_session):
+    quiet, viral = await _seed(db_session, ("Sopa", ["água"], True), ("Bolo", ["ovo"], True))
+    headers = []
+    for i in range(3):
+        email = f"fan{i}@example.com"
+        await client.post("/users/register", json={"name": "Fan", "email": email, "password": "Teste123@!"})
+        response = await client.post("/users/login", json={"email": email, "password": "Teste123@!"})
+        headers.append({"Authorization": f"Bearer {response.json()['access_token']}"})
+    for h in headers:
+        await client.post(f"/recipes/recipes/{viral}/favorite", headers=h)
+    await client.post(f"/recipes/recipes/{quiet}/favorite", headers=headers[0])
+    await client.delete(f"/recipes/recipes/{quiet}/favorite", headers=headers[0])
+
+    # Antes do rollup a contagem anotada já é exata (total + deltas pendentes)
+    response = await client.get(f"/recipes/recipes/{viral}", headers=headers[0])
+    assert response.json()["favorite_count"] == 3
+
+    # Lotes de uma linha de shard: o rollup drena tudo em várias transações
+    rollup = RollupFavoriteCountsUseCase(SQLAlchemyRecipeRepository(db_session))
+    assert await rollup.execute(batch_size=1) == 1
+    assert await rollup.execute(batch_size=1) == 0
+
+    response = await client.get("/recipes/popular", params={"limit": 2})
+    assert response.status_code == 200
+    assert [(r["id"], r["favorite_count"]) for r in response.json()] == [(viral, 3), (quiet, 0)]
+    assert len(deps.popular_cache) == 1
@@ -7,17 +7,27 @@ from unittest.mock import AsyncMock, MagicMock
 # (Ajuste os imports se a estrutura do seu projeto for diferente)
 from petfit.domain.entities.user import User
 from petfit.domain.entities.recipe import Recipe
+from petfit.domain.entities.page import Page
 from petfit.domain.value_objects.email_vo import Email
 from petfit.domain.value_objects.password import Password
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.domain.value_objects.ingredient_filter import IngredientFilter
 
 # Importe TODOS os seus casos de uso de receita
 from petfit.usecases.recipe.add_favorite_recipe import AddFavoriteRecipeUseCase
+from petfit.usecases.recipe.batch_update_favorites import BatchUpdateFavoritesUseCase
 from petfit.usecases.recipe.create_recipe import CreateRecipeUseCase
 from petfit.usecases.recipe.delete_recipe import DeleteRecipeUseCase
 from petfit.usecases.recipe.get_all_recipes import GetAllRecipesUseCase
 from petfit.usecases.recipe.get_recipe_by_id import GetRecipeByIdUseCase
+from petfit.usecases.recipe.get_popular_recipes import GetPopularRecipesUseCase
 from petfit.usecases.recipe.get_user_favorite_recipes import GetUserFavoriteRecipesUseCase
 from petfit.usecases.recipe.remove_favorite_recipe import RemoveFavoriteRecipeUseCase
+from petfit.usecases.recipe.search_recipes import SearchRecipesUseCase
+from petfit.usecases.recipe.export_public_recipes import ExportPublicRecipesUseCase
+from petfit.usecases.recipe.import_recipes import ImportRecipesUseCase
+from petfit.usecases.recipe.rollup_favorite_counts import RollupFavoriteCountsUseCase
+from petfit.domain.entities.recipe_import import RecipeImportRow
 from petfit.usecases.recipe.update_recipe import UpdateRecipeUseCase
 
 # -- Fixtures: Objetos reutilizáveis para os testes --
@@ -54,29 +64,28 @@ def sample_recipe():
 async def test_add_favorite_recipe_success(mock_recipe_repo, sample_user, sample_recipe):
     """Testa adicionar uma receita aos favoritos com sucesso."""
     # Arrange: Configura os mocks
-    mock_recipe_repo.get_by_id.return_value = sample_recipe
     mock_recipe_repo.add_favorite.return_value = True
     use_case = AddFavoriteRecipeUseCase(mock_recipe_repo)
 
     # Act: Executa o caso de uso
     result = await use_case.execute(user=sample_user, recipe_id="recipe-456")
 
-    # Assert: Verifica o resultado e as chamadas
+    # Assert: Verifica o resultado e as chamadas (sem leitura prévia da receita)
     assert result is True
-    mock_recipe_repo.get_by_id.assert_called_once_with("recipe-456")
-    mock_recipe_repo.add_favorite.assert_called_once_with(sample_user, sample_recipe)
+    mock_recipe_repo.get_by_id.assert_not_called()
+    mock_recipe_repo.add_favorite.assert_called_once_with(sample_user, "recipe-456")
 
 @pytest.mark.asyncio
 async def test_add_favorite_recipe_not_found(mock_recipe_repo, sample_user):
     """Testa adicionar uma receita que não existe, esperando um erro."""
-    # Arrange
-    mock_recipe_repo.get_by_id.return_value = None
+    # Arrange: a violação de FK chega do repositório como ValueError
+    mock_recipe_repo.add_favorite.side_effect = ValueError("Recipe with ID recipe-999 not found.")
     use_case = AddFavoriteRecipeUseCase(mock_recipe_repo)
 
     # Act & Assert
     with pytest.raises(ValueError, match="Recipe with ID recipe-999 not found."):
         await use_case.execute(user=sample_user, recipe_id="recipe-999")
-    mock_recipe_repo.add_favorite.assert_not_called()
+    mock_recipe_repo.get_by_id.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_create_recipe(mock_recipe_repo, sample_recipe):
@@ -91,6 +100,8 @@ async def test_create_recipe(mock_recipe_repo, sample_recipe):
     # Assert
     assert created_recipe == sample_recipe
     mock_recipe_repo.create.assert_called_once_with(sample_recipe)
+    # A versão do catálogo sobe dentro do repositório, na transação da escrita
+    mock_recipe_repo.bump_catalog_version.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_delete_recipe(mock_recipe_repo):
@@ -105,6 +116,19 @@ async def test_delete_recipe(mock_recipe_repo):
     # Assert
     assert result is True
     mock_recipe_repo.delete.assert_called_once_with("recipe-456")
+    # A versão do catálogo sobe dentro do repositório, na transação da escrita
+    mock_recipe_repo.bump_catalog_version.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_delete_missing_recipe_keeps_catalog_version(mock_recipe_repo):
+    """Deleção sem efeito não deve invalidar os ETags do catálogo."""
+    mock_recipe_repo.delete.return_value = False
+    use_case = DeleteRecipeUseCase(mock_recipe_repo)
+
+    result = await use_case.execute(recipe_id="missing")
+
+    assert result is False
+    mock_recipe_repo.bump_catalog_version.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_get_all_recipes(mock_recipe_repo, sample_recipe):
@@ -121,6 +145,158 @@ async def test_get_all_recipes(mock_recipe_repo, sample_recipe):
     assert recipes[0] == sample_recipe
     mock_recipe_repo.get_all_public_recipes.assert_called_once()
 
+@pytest.mark.asyncio
+async def test_get_all_recipes_with_cursor(mock_recipe_repo):
+    """Testa que o cursor é decodificado e repassado ao repositório."""
+    # Arrange
+    cursor = Cursor(sort="title", value="Bolo", id="recipe-456")
+    use_case = GetAllRecipesUseCase(mock_recipe_repo)
+
+    # Act
+    await use_case.execute(limit=10, after=cursor.encode(), sort="title")
+
+    # Assert
+    mock_recipe_repo.get_all_public_recipes.assert_called_once_with(
+        limit=10, after=cursor, sort="title", ingredients=None, viewer_id=None
+    )
+
+@pytest.mark.asyncio
+async def test_get_all_recipes_with_ingredient_filter(mock_recipe_repo):
+    """Testa que o filtro de ingredientes chega ao repositório (e que vazio vira None)."""
+    use_case = GetAllRecipesUseCase(mock_recipe_repo)
+    ingredients = IngredientFilter(all_of=["frango", "arroz"], none_of=["trigo"])
+
+    await use_case.execute(ingredients=ingredients)
+    assert mock_recipe_repo.get_all_public_recipes.call_args.kwargs["ingredients"] == ingredients
+
+    await use_case.execute(ingredients=IngredientFilter(all_of=[" "]))
+    assert mock_recipe_repo.get_all_public_recipes.call_args.kwargs["ingredients"] is None
+
+@pytest.mark.asyncio
+async def test_get_all_recipes_rejects_invalid_sort_and_cursor(mock_recipe_repo):
+    """Testa a rejeição de ordenação fora da whitelist e de cursor de outra ordenação."""
+    use_case = GetAllRecipesUseCase(mock_recipe_repo)
+
+    with pytest.raises(ValueError, match="Invalid sort"):
+        await use_case.execute(sort="password")
+
+    cursor = Cursor(sort="title", value="Bolo", id="recipe-456").encode()
+    with pytest.raises(ValueError, match="Cursor does not match"):
+        await use_case.execute(after=cursor, sort="-created_at")
+    mock_recipe_repo.get_all_public_recipes.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_export_public_recipes_streams_from_repository(mock_recipe_repo, sample_recipe):
+    """Testa que o export repassa o tamanho do lote e entrega as receitas uma a uma."""
+    async def stream(batch_size):
+        for _ in range(3):
+            yield sample_recipe
+
+    mock_recipe_repo.stream_public_recipes = MagicMock(side_effect=stream)
+    use_case = ExportPublicRecipesUseCase(mock_recipe_repo)
+
+    recipes = [recipe async for recipe in use_case.execute(batch_size=2)]
+
+    assert recipes == [sample_recipe] * 3
+    mock_recipe_repo.stream_public_recipes.assert_called_once_with(batch_size=2)
+
+@pytest.mark.asyncio
+async def test_import_recipes_chunks_and_reports_errors(mock_recipe_repo, sample_recipe):
+    """Testa que a importação grava em lotes e segue após linhas e lotes inválidos."""
+    async def rows():
+        yield RecipeImportRow(1, recipe=sample_recipe)
+        yield RecipeImportRow(2, error="title: Field required")
+        yield RecipeImportRow(3, recipe=sample_recipe)
+        yield RecipeImportRow(4, recipe=sample_recipe)
+        yield RecipeImportRow(5, recipe=sample_recipe)
+
+    # O segundo lote é rejeitado pelo banco
+    mock_recipe_repo.bulk_create.side_effect = [2, ValueError("Batch rejected")]
+    use_case = ImportRecipesUseCase(mock_recipe_repo)
+
+    report = await use_case.execute(rows(), chunk_size=2)
+
+    assert (report.total, report.imported, report.failed) == (5, 2, 3)
+    assert [(e.row, e.error) for e in report.errors] == [
+        (2, "title: Field required"), (4, "Batch rejected"), (5, "Batch rejected"),
+    ]
+    assert mock_recipe_repo.bulk_create.await_count == 2
+    mock_recipe_repo.bump_catalog_version.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_import_recipes_keeps_partial_report_when_stream_fails(mock_recipe_repo, sample_recipe):
+    """Um erro de leitura no meio da entrada vira erro no relatório e não impede o bump."""
+    async def rows():
+        yield RecipeImportRow(1, recipe=sample_recipe)
+        yield RecipeImportRow(2, recipe=sample_recipe)
+        yield RecipeImportRow(3, recipe=sample_recipe)
+        raise ValueError("Line longer than 10 characters.")
+
+    mock_recipe_repo.bulk_create.side_effect = [2, 1]
+    use_case = ImportRecipesUseCase(mock_recipe_repo)
+
+    report = await use_case.execute(rows(), chunk_size=2)
+
+    assert (report.total, report.imported, report.failed) == (3, 3, 1)
+    assert [(e.row, e.error) for e in report.errors] == [(4, "Line longer than 10 characters.")]
+    mock_recipe_repo.bump_catalog_version.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_import_recipes_bumps_catalog_when_stream_is_interrupted(mock_recipe_repo, sample_recipe):
+    """Se a entrada é interrompida (ex.: cliente desconectou), os lotes gravados ainda invalidam o catálogo."""
+    async def rows():
+        yield RecipeImportRow(1, recipe=sample_recipe)
+        raise ConnectionError("client disconnected")
+
+    mock_recipe_repo.bulk_create.return_value = 1
+    use_case = ImportRecipesUseCase(mock_recipe_repo)
+
+    with pytest.raises(ConnectionError):
+        await use_case.execute(rows(), chunk_size=1)
+    mock_recipe_repo.bump_catalog_version.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_rollup_favorite_counts_drains_in_bounded_batches(mock_recipe_repo):
+    """O rollup consome lotes de tamanho fixo até um lote vir incompleto."""
+    mock_recipe_repo.rollup_favorite_counts.side_effect = [(2, 1), (2, 2), (1, 1)]
+    use_case = RollupFavoriteCountsUseCase(mock_recipe_repo)
+
+    assert await use_case.execute(batch_size=2) == 4
+    assert mock_recipe_repo.rollup_favorite_counts.await_count == 3
+    mock_recipe_repo.rollup_favorite_counts.assert_awaited_with(2)
+
+@pytest.mark.asyncio
+async def test_rollup_favorite_counts_stops_after_max_batches(mock_recipe_repo):
+    """Com escritas contínuas, uma execução não passa de max_batches lotes."""
+    mock_recipe_repo.rollup_favorite_counts.return_value = (2, 2)
+    use_case = RollupFavoriteCountsUseCase(mock_recipe_repo)
+
+    assert await use_case.execute(batch_size=2, max_batches=3) == 6
+    assert mock_recipe_repo.rollup_favorite_counts.await_count == 3
+
+@pytest.mark.asyncio
+async def test_search_recipes(mock_recipe_repo):
+    """Testa que a busca normaliza o texto e repassa o cursor de relevância."""
+    cursor = Cursor(sort="rank", value=0.25, id="recipe-456")
+    use_case = SearchRecipesUseCase(mock_recipe_repo)
+
+    await use_case.execute("  frango com arroz ", limit=5, after=cursor.encode())
+
+    mock_recipe_repo.search.assert_called_once_with("frango com arroz", limit=5, after=cursor)
+
+@pytest.mark.asyncio
+async def test_search_recipes_rejects_blank_query_and_foreign_cursor(mock_recipe_repo):
+    """Testa a rejeição de busca vazia e de cursor gerado pela listagem."""
+    use_case = SearchRecipesUseCase(mock_recipe_repo)
+
+    with pytest.raises(ValueError, match="must not be empty"):
+        await use_case.execute("   ")
+
+    cursor = Cursor(sort="title", value="Bolo", id="recipe-456").encode()
+    with pytest.raises(ValueError, match="Cursor does not match"):
+        await use_case.execute("bolo", after=cursor)
+    mock_recipe_repo.search.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_get_recipe_by_id(mock_recipe_repo, sample_recipe):
     """Testa a busca de uma receita por ID."""
@@ -133,13 +309,13 @@ async def test_get_recipe_by_id(mock_recipe_repo, sample_recipe):
 
     # Assert
     assert recipe == sample_recipe
-    mock_recipe_repo.get_by_id.assert_called_once_with("recipe-456")
+    mock_recipe_repo.get_by_id.assert_called_once_with("recipe-456", viewer_id=None)
 
 @pytest.mark.asyncio
 async def test_get_user_favorite_recipes(mock_recipe_repo, sample_user, sample_recipe):
     """Testa a busca pelas receitas favoritas de um usuário."""
     # Arrange
-    mock_recipe_repo.get_user_favorite_recipes.return_value = [sample_recipe]
+    mock_recipe_repo.get_user_favorite_recipes.return_value = Page([sample_recipe])
     use_case = GetUserFavoriteRecipesUseCase(mock_recipe_repo)
 
     # Act
@@ -148,13 +324,12 @@ async def test_get_user_favorite_recipes(mock_recipe_repo, sample_user, sample_r
     # Assert
     assert len(favorites) == 1
     assert favorites[0] == sample_recipe
-    mock_recipe_repo.get_user_favorite_recipes.assert_called_once_with(sample_user)
+    mock_recipe_repo.get_user_favorite_recipes.assert_called_once_with(sample_user, limit=20, after=None)
 
 @pytest.mark.asyncio
 async def test_remove_favorite_recipe(mock_recipe_repo, sample_user, sample_recipe):
     """Testa a remoção de uma receita dos favoritos."""
     # Arrange
-    mock_recipe_repo.get_by_id.return_value = sample_recipe
     mock_recipe_repo.remove_favorite.return_value = True
     use_case = RemoveFavoriteRecipeUseCase(mock_recipe_repo)
 
@@ -163,9 +338,39 @@ async def test_remove_favorite_recipe(mock_recipe_repo, sample_user, sample_reci
 
     # Assert
     assert result is True
-    mock_recipe_repo.get_by_id.assert_called_once_with("recipe-456")
-    mock_recipe_repo.remove_favorite.assert_called_once_with(sample_user, sample_recipe)
+    mock_recipe_repo.get_by_id.assert_not_called()
+    mock_recipe_repo.remove_favorite.assert_called_once_with(sample_user, "recipe-456")
     
+@pytest.mark.asyncio
+async def test_batch_update_favorites_reports_outcome_per_id(mock_recipe_repo, sample_user):
+    """Testa a sincronização em lote: uma chamada ao repositório e o resultado de cada ID."""
+    # Arrange
+    mock_recipe_repo.update_favorites.return_value = ({"r1": True, "r2": False}, ["r4"])
+    use_case = BatchUpdateFavoritesUseCase(mock_recipe_repo)
+
+    # Act
+    result = await use_case.execute(sample_user, add=["r1", "r2", "r3", "r1"], remove=["r4", "r5"])
+
+    # Assert
+    assert result.items() == [
+        ("r1", "added"),
+        ("r2", "already_favorite"),
+        ("r3", "not_found"),
+        ("r4", "removed"),
+        ("r5", "not_favorite"),
+    ]
+    mock_recipe_repo.update_favorites.assert_awaited_once_with(sample_user, ["r1", "r2", "r3"], ["r4", "r5"])
+    mock_recipe_repo.add_favorite.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_batch_update_favorites_rejects_conflicting_ids(mock_recipe_repo, sample_user):
+    """Um mesmo ID não pode ser adicionado e removido no mesmo lote."""
+    use_case = BatchUpdateFavoritesUseCase(mock_recipe_repo)
+
+    with pytest.raises(ValueError, match="both added and removed"):
+        await use_case.execute(sample_user, add=["r1"], remove=["r1"])
+    mock_recipe_repo.update_favorites.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_update_recipe(mock_recipe_repo, sample_recipe):
     """Testa a atualização de uma receita."""
@@ -181,4 +386,18 @@ async def test_update_recipe(mock_recipe_repo, sample_recipe):
     
     # Assert
     assert result.title == "Novo Título do Bolo"
-    mock_recipe_repo.update.assert_called_once_with(updated_recipe)
\ No newline at end of file
+    mock_recipe_repo.update.assert_called_once_with(updated_recipe)
+    # A versão do catálogo sobe dentro do repositório, na transação da escrita
+    mock_recipe_repo.bump_catalog_version.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_popular_recipes_validates_limit(mock_recipe_repo, sample_recipe):
+    """Testa que o ranking de populares respeita o limite máximo."""
+    mock_recipe_repo.get_popular_recipes.return_value = [sample_recipe]
+    use_case = GetPopularRecipesUseCase(mock_recipe_repo)
+
+    assert await use_case.execute(limit=5) == [sample_recipe]
+    mock_recipe_repo.get_popular_recipes.assert_awaited_once_with(5)
+    with pytest.raises(ValueError):
+        await use_case.execute(limit=1000)
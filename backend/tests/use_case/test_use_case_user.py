@@ -15,6 +15,7 @@ from petfit.usecases.user.logout_user import LogoutUserUseCase
 from petfit.usecases.user.register_user import RegisterUserUseCase
 from petfit.usecases.user.set_current_user import SetCurrentUserUseCase
 from petfit.usecases.user.update_user import UpdateUserUseCase
+from petfit.usecases.user.revoke_user_tokens import RevokeUserTokensUseCase
 
 # --- Fixtures: Objetos reutilizáveis para os testes ---
 
@@ -90,6 +91,63 @@ async def test_login_user_success(mock_user_repo, sample_user):
     assert result == sample_user
     sample_user.password.verify.assert_called_once_with("correct_password")
 
+@pytest.mark.asyncio
+async def test_login_user_with_password_hasher(mock_user_repo, sample_user):
+    """Testa que o login delega a verificação ao serviço de hashing assíncrono."""
+    # Arrange
+    mock_user_repo.login.return_value = sample_user
+    password_hasher = AsyncMock()
+    password_hasher.verify.return_value = True
+    password_hasher.needs_rehash = MagicMock(return_value=False)
+    use_case = LoginUserUseCase(mock_user_repo, password_hasher)
+
+    # Act
+    result = await use_case.execute(email=sample_user.email, plain_password="correct_password")
+
+    # Assert
+    assert result == sample_user
+    password_hasher.verify.assert_awaited_once_with(sample_user.password, "correct_password")
+    sample_user.password.verify.assert_not_called()
+    mock_user_repo.update.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_login_user_rehashes_outdated_cost(mock_user_repo, sample_user):
+    """Testa que um hash com custo antigo é refeito e persistido após o login."""
+    # Arrange
+    mock_user_repo.login.return_value = sample_user
+    new_password = MagicMock(spec=Password)
+    password_hasher = AsyncMock()
+    password_hasher.verify.return_value = True
+    password_hasher.needs_rehash = MagicMock(return_value=True)
+    password_hasher.rehash.return_value = new_password
+    use_case = LoginUserUseCase(mock_user_repo, password_hasher)
+
+    # Act
+    result = await use_case.execute(email=sample_user.email, plain_password="correct_password")
+
+    # Assert
+    assert result.password is new_password
+    password_hasher.rehash.assert_awaited_once_with("correct_password")
+    mock_user_repo.update.assert_awaited_once_with(sample_user)
+
+@pytest.mark.asyncio
+async def test_login_user_succeeds_when_rehash_fails(mock_user_repo, sample_user):
+    """A migração do hash é opcional: se falhar, o login com a senha correta segue valendo."""
+    # Arrange
+    mock_user_repo.login.return_value = sample_user
+    mock_user_repo.update.side_effect = RuntimeError("database unavailable")
+    password_hasher = AsyncMock()
+    password_hasher.verify.return_value = True
+    password_hasher.needs_rehash = MagicMock(return_value=True)
+    use_case = LoginUserUseCase(mock_user_repo, password_hasher)
+
+    # Act
+    result = await use_case.execute(email=sample_user.email, plain_password="correct_password")
+
+    # Assert
+    assert result is sample_user
+    mock_user_repo.update.assert_awaited_once_with(sample_user)
+
 @pytest.mark.asyncio
 async def test_login_user_not_found(mock_user_repo):
     """Testa o login com um email que não existe."""
@@ -181,4 +239,18 @@ async def test_update_user(mock_user_repo, sample_user):
 
     # Assert
     assert result == sample_user
-    mock_user_repo.update.assert_called_once_with(sample_user)
\ No newline at end of file
+    mock_user_repo.update.assert_called_once_with(sample_user)
+
+@pytest.mark.asyncio
+async def test_revoke_user_tokens(mock_user_repo, sample_user):
+    """Testa a revogação dos tokens emitidos para o usuário."""
+    # Arrange
+    mock_user_repo.revoke_tokens.return_value = 1
+    use_case = RevokeUserTokensUseCase(mock_user_repo)
+
+    # Act
+    result = await use_case.execute(user=sample_user)
+
+    # Assert
+    assert result == 1
+    mock_user_repo.revoke_tokens.assert_awaited_once_with("user-123")